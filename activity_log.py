@@ -0,0 +1,371 @@
+import os
+import re
+import json
+import time
+import argparse
+from collections import deque
+from datetime import datetime, timezone
+
+from sync_manifest import atomic_write
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Append-only, rotating JSON-Lines store for admin activity events.
+#
+# Events are appended as one line each to <dir>/current.jsonl, so a LOGIN costs one
+# small write instead of re-serializing the whole history. When the live segment
+# grows past MAX_BYTES or MAX_AGE it is sealed as <YYYYMMDD-HHMMSS>-<seq>.jsonl
+# together with a sidecar index (byte offsets grouped by userId and action). seq
+# is zero-padded and only ever grows, so segments order by it even when two are
+# sealed in the same second. Queries walk segments newest first, seek straight to
+# indexed offsets in sealed segments and stop as soon as enough events are found.
+#
+# compact() writes the merged segments as .compact-* files, then records a plan
+# (which to rename, which old segments to drop) before touching anything. A
+# compaction interrupted after that point is finished by the next ActivityLog
+# opened on the directory; one interrupted before it just leaves the old
+# segments in place.
+
+LOG_DIR = os.path.join(repo_root, 'data', 'activity_logs')
+LEGACY_PATH = os.path.join(repo_root, 'data', 'activity_logs.json')
+CURRENT = 'current.jsonl'
+COMPACT_PLAN = '.compact-plan.json'
+MAX_BYTES = 1024 * 1024
+MAX_AGE = 7 * 24 * 60 * 60
+INDEX_FIELDS = ('userId', 'action')
+SEQ_RE = re.compile(r'-(\d{6})\.jsonl$')
+
+try:
+    import fcntl
+except ImportError:  # Windows: rely on O_APPEND for single-line writes
+    fcntl = None
+
+
+class _Lock:
+    def __init__(self, directory):
+        self.path = os.path.join(directory, '.lock')
+        self.f = None
+
+    def __enter__(self):
+        self.f = open(self.path, 'a')
+        if fcntl:
+            fcntl.flock(self.f, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl:
+            fcntl.flock(self.f, fcntl.LOCK_UN)
+        self.f.close()
+
+
+def _iter_lines(path, start=0):
+    # Yields (offset, event) for every complete line from start.
+    with open(path, 'rb') as f:
+        f.seek(start)
+        offset = start
+        for raw in f:
+            if raw.endswith(b'\n') and raw.strip():
+                yield offset, json.loads(raw)
+            offset += len(raw)
+
+
+def _build_index(path):
+    index = {field: {} for field in INDEX_FIELDS}
+    count = 0
+    first = last = None
+    for offset, event in _iter_lines(path):
+        count += 1
+        first = first or event.get('timestamp')
+        last = event.get('timestamp') or last
+        for field in INDEX_FIELDS:
+            index[field].setdefault(str(event.get(field)), []).append(offset)
+    return {'count': count, 'first': first, 'last': last, 'offsets': index}
+
+
+def _write_index(segment):
+    index = _build_index(segment)
+    atomic_write(segment[:-len('.jsonl')] + '.idx.json', json.dumps(index, separators=(',', ':')).encode('utf-8'))
+    return index
+
+
+def _seq(path):
+    # Segments sealed before sequence numbers existed sort first, by name.
+    match = SEQ_RE.search(path)
+    return (int(match.group(1)), '') if match else (-1, os.path.basename(path))
+
+
+def _dump(event):
+    return (json.dumps(event, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+class ActivityLog:
+    def __init__(self, directory=LOG_DIR, max_bytes=MAX_BYTES, max_age=MAX_AGE):
+        self.dir = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(directory, exist_ok=True)
+        self.current = os.path.join(directory, CURRENT)
+        with _Lock(directory):
+            self._finish_compact()
+
+    def segments(self):
+        # Sealed segments, oldest first.
+        return sorted((os.path.join(self.dir, n) for n in os.listdir(self.dir)
+                       if n.endswith('.jsonl') and n != CURRENT and not n.startswith('.')), key=_seq)
+
+    def _finish_compact(self):
+        # Caller holds the lock. Renames come before deletes, so an interrupted
+        # run never leaves the events in neither place; both steps can be
+        # repeated safely.
+        plan_path = os.path.join(self.dir, COMPACT_PLAN)
+        if os.path.exists(plan_path):
+            with open(plan_path, 'r', encoding='utf-8') as f:
+                plan = json.load(f)
+            for tmp, final in plan['rename']:
+                tmp, final = os.path.join(self.dir, tmp), os.path.join(self.dir, final)
+                if os.path.exists(tmp):
+                    os.replace(tmp, final)
+                    _write_index(final)
+            for name in plan['remove']:
+                for path in (os.path.join(self.dir, name), os.path.join(self.dir, name[:-len('.jsonl')] + '.idx.json')):
+                    if os.path.exists(path):
+                        os.remove(path)
+            os.remove(plan_path)
+        # Merged output without a plan is from a run that never got that far.
+        for name in os.listdir(self.dir):
+            if name.startswith('.compact-') and name != COMPACT_PLAN:
+                os.remove(os.path.join(self.dir, name))
+
+    def _segment_path(self, stamp, seq):
+        return os.path.join(self.dir, f'{stamp}-{seq:06d}.jsonl')
+
+    def _needs_rotation(self):
+        try:
+            st = os.stat(self.current)
+        except FileNotFoundError:
+            return False
+        if st.st_size >= self.max_bytes:
+            return True
+        with open(self.current, 'rb') as f:
+            first = f.readline()
+        if not first.strip():
+            return False
+        started = json.loads(first).get('timestamp')
+        return bool(started) and time.time() - _parse_ts(started) >= self.max_age
+
+    def rotate(self):
+        if not os.path.exists(self.current) or os.path.getsize(self.current) == 0:
+            return None
+        segments = self.segments()
+        seq = max(_seq(segments[-1])[0] + 1, 1) if segments else 1
+        sealed = self._segment_path(datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S'), seq)
+        os.replace(self.current, sealed)
+        _write_index(sealed)
+        return sealed
+
+    def append(self, event):
+        event = dict(event)
+        event.setdefault('timestamp', datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z'))
+        event.setdefault('id', str(int(time.time() * 1000)))
+        line = _dump(event)
+        with _Lock(self.dir):
+            if self._needs_rotation():
+                self.rotate()
+            fd = os.open(self.current, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        return event
+
+    def _load_index(self, segment):
+        idx_path = segment[:-len('.jsonl')] + '.idx.json'
+        if not os.path.exists(idx_path):
+            return _write_index(segment)
+        with open(idx_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _matches(self, event, filters, since):
+        if since and (event.get('timestamp') or '') < since:
+            return False
+        return all(str(event.get(k)) == v for k, v in filters.items())
+
+    def query(self, user_id=None, action=None, since=None, limit=50):
+        # Newest events first.
+        filters = {k: v for k, v in (('userId', user_id), ('action', action)) if v is not None}
+        found = []
+
+        if os.path.exists(self.current):
+            recent = deque(maxlen=limit)
+            for offset, event in _iter_lines(self.current):
+                if self._matches(event, filters, since):
+                    recent.append(event)
+            found.extend(reversed(recent))
+
+        for segment in reversed(self.segments()):
+            if len(found) >= limit:
+                break
+            index = self._load_index(segment)
+            if since and index['last'] and index['last'] < since:
+                break
+            if filters:
+                offsets = None
+                for field, value in filters.items():
+                    hits = set(index['offsets'][field].get(value, []))
+                    offsets = hits if offsets is None else offsets & hits
+                offsets = sorted(offsets, reverse=True)
+            else:
+                offsets = None
+
+            with open(segment, 'rb') as f:
+                if offsets is None:
+                    events = [e for _, e in _iter_lines(segment)]
+                    candidates = reversed(events)
+                else:
+                    candidates = (json.loads(_read_line(f, o)) for o in offsets)
+                for event in candidates:
+                    if self._matches(event, filters, since):
+                        found.append(event)
+                        if len(found) >= limit:
+                            break
+        return found[:limit]
+
+    def iter_all(self):
+        # Oldest to newest, streaming.
+        for segment in self.segments():
+            for _, event in _iter_lines(segment):
+                yield event
+        if os.path.exists(self.current):
+            for _, event in _iter_lines(self.current):
+                yield event
+
+    def compact(self, retention_days=None, target_bytes=None):
+        # Drops events older than the retention window and merges small sealed
+        # segments into ones of about max_bytes. Returns (kept, dropped).
+        target_bytes = target_bytes or self.max_bytes
+        cutoff = None
+        if retention_days:
+            cutoff = datetime.fromtimestamp(time.time() - retention_days * 86400, timezone.utc) \
+                .isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+        kept = dropped = 0
+        with _Lock(self.dir):
+            self._finish_compact()
+            old_segments = self.segments()
+            out_paths = []
+            out = None
+            for segment in old_segments:
+                for _, event in _iter_lines(segment):
+                    if cutoff and (event.get('timestamp') or '') < cutoff:
+                        dropped += 1
+                        continue
+                    if out is None or out.tell() >= target_bytes:
+                        if out:
+                            out.close()
+                        path = os.path.join(self.dir, f'.compact-{len(out_paths):05d}.jsonl')
+                        out_paths.append((path, event.get('timestamp') or ''))
+                        out = open(path, 'wb')
+                    out.write(_dump(event))
+                    kept += 1
+            if out:
+                out.close()
+
+            # Numbered after the old segments, so no new name is an old one.
+            seq = max(_seq(old_segments[-1])[0], 0) if old_segments else 0
+            rename = []
+            for n, (path, first_ts) in enumerate(out_paths, seq + 1):
+                stamp = first_ts.replace('-', '').replace(':', '').replace('T', '-')[:15] or 'compact'
+                rename.append([os.path.basename(path), os.path.basename(self._segment_path(stamp, n))])
+            plan = {'rename': rename, 'remove': [os.path.basename(s) for s in old_segments]}
+            atomic_write(os.path.join(self.dir, COMPACT_PLAN), json.dumps(plan).encode('utf-8'))
+            self._finish_compact()
+        return kept, dropped
+
+    def stats(self):
+        segments = self.segments()
+        sizes = sum(os.path.getsize(s) for s in segments)
+        current = os.path.getsize(self.current) if os.path.exists(self.current) else 0
+        return {'segments': len(segments), 'sealed_bytes': sizes, 'current_bytes': current}
+
+
+def _read_line(f, offset):
+    f.seek(offset)
+    return f.readline()
+
+
+def _parse_ts(ts):
+    return datetime.fromisoformat(ts.replace('Z', '+00:00')).timestamp()
+
+
+def migrate(log, legacy_path=LEGACY_PATH):
+    # The legacy file is a JSON array, newest first. Its events are merged with
+    # the live segment in one write and sealed at most once, rather than going
+    # through append(), which would seal a segment per event once the oldest is
+    # past max_age. Sealed segments are newer than anything legacy, so the
+    # import is refused once there are any.
+    with open(legacy_path, 'r', encoding='utf-8') as f:
+        events = json.load(f)
+    imported = len(events)
+    with _Lock(log.dir):
+        if log.segments():
+            raise ValueError(f"{log.dir} already has sealed segments; migrate into an empty log")
+        if os.path.exists(log.current):
+            events.extend(e for _, e in _iter_lines(log.current))
+        events.sort(key=lambda e: e.get('timestamp') or '')
+        now = datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+        for n, event in enumerate(events):
+            event.setdefault('timestamp', now)
+            event.setdefault('id', f"{int(time.time() * 1000)}-{n}")
+        atomic_write(log.current, b''.join(_dump(e) for e in events))
+        if log._needs_rotation():
+            log.rotate()
+    return imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query and maintain the append-only activity log.")
+    parser.add_argument('--dir', default=LOG_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    q = sub.add_parser('query', help="Print recent events, newest first")
+    q.add_argument('--user')
+    q.add_argument('--action')
+    q.add_argument('--since', help="ISO timestamp lower bound")
+    q.add_argument('-n', '--limit', type=int, default=20)
+
+    a = sub.add_parser('append', help="Append one event given as JSON")
+    a.add_argument('event')
+
+    c = sub.add_parser('compact', help="Merge sealed segments and drop old events")
+    c.add_argument('--retention-days', type=int)
+
+    sub.add_parser('rotate', help="Seal the live segment now")
+    sub.add_parser('stats')
+    m = sub.add_parser('migrate', help="Import data/activity_logs.json")
+    m.add_argument('--file', default=LEGACY_PATH)
+    args = parser.parse_args()
+
+    log = ActivityLog(args.dir)
+    start = time.perf_counter()
+    if args.command == 'query':
+        for event in log.query(args.user, args.action, args.since, args.limit):
+            print(f"{event.get('timestamp')}  {event.get('action') or '':<14} {event.get('userName')}  {event.get('details', '')}")
+    elif args.command == 'append':
+        print(json.dumps(log.append(json.loads(args.event))))
+    elif args.command == 'compact':
+        kept, dropped = log.compact(args.retention_days)
+        print(f"{kept} events kept, {dropped} dropped")
+    elif args.command == 'rotate':
+        print(log.rotate() or "Nothing to rotate")
+    elif args.command == 'stats':
+        print(json.dumps(log.stats(), indent=2))
+    elif args.command == 'migrate':
+        try:
+            print(f"Imported {migrate(log, args.file)} events")
+        except ValueError as e:
+            parser.error(str(e))
+    print(f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,320 @@
+import os
+import re
+import json
+import argparse
+
+from sync_manifest import write_if_changed
+
+# Structural index over the INTERNAL_ARTICLES object literal in berita/[slug]/page.tsx.
+#
+# The object is tokenized once (strings, template literals with ${} nesting and
+# comments are skipped) to build a slug -> offsets table. Inserts, replacements and
+# deletions are then collected as (start, end, text) edits against the original
+# string and spliced in a single pass.
+
+DEFAULT_PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "app", "berita", "[slug]", "page.tsx")
+# Where articles_split.py moves the entries once INTERNAL_ARTICLES is split up.
+ARTICLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "data", "articles")
+
+_KEY_RE = re.compile(r'''(?:"([^"\\]*)"|'([^'\\]*)'|([A-Za-z_$][\w$]*))\s*:\s*''')
+_OPENERS = {"{": "}", "[": "]", "(": ")"}
+
+
+def _skip_comment(text, i):
+    if text.startswith("//", i):
+        end = text.find("\n", i)
+        return len(text) if end == -1 else end
+    if text.startswith("/*", i):
+        end = text.find("*/", i + 2)
+        if end == -1:
+            raise ValueError(f"Unterminated comment at offset {i}")
+        return end + 2
+    return i
+
+
+def _skip_string(text, i):
+    quote = text[i]
+    i += 1
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == quote:
+            return i + 1
+        if quote == "`" and text.startswith("${", i):
+            i = find_matching(text, i + 1) + 1
+            continue
+        if quote != "`" and c == "\n":
+            break
+        i += 1
+    raise ValueError(f"Unterminated string starting at offset {i}")
+
+
+def find_matching(text, i):
+    # Return the offset of the bracket closing the one at text[i].
+    stack = [_OPENERS[text[i]]]
+    i += 1
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c in "\"'`":
+            i = _skip_string(text, i)
+            continue
+        if c == "/":
+            j = _skip_comment(text, i)
+            if j != i:
+                i = j
+                continue
+        if c in _OPENERS:
+            stack.append(_OPENERS[c])
+        elif c in ")]}":
+            if c != stack.pop():
+                raise ValueError(f"Mismatched '{c}' at offset {i}")
+            if not stack:
+                return i
+        i += 1
+    raise ValueError("Unbalanced brackets")
+
+
+def _skip_trivia(text, i, end):
+    while i < end:
+        if text[i].isspace():
+            i += 1
+            continue
+        j = _skip_comment(text, i)
+        if j == i:
+            break
+        i = j
+    return i
+
+
+def _skip_expression(text, i, end):
+    # Any other value (`new Date().toLocale...(...)`, identifiers, numbers): runs up
+    # to the next comma at this nesting level, trailing whitespace excluded.
+    last = i
+    while i < end:
+        c = text[i]
+        if c == ",":
+            break
+        if c in "\"'`":
+            i = _skip_string(text, i)
+        elif c in _OPENERS:
+            i = find_matching(text, i) + 1
+        else:
+            j = _skip_comment(text, i) if c == "/" else i
+            if j != i:
+                i = j
+                continue
+            i += 1
+        if not c.isspace():
+            last = i
+    return last
+
+
+def literal_value(source):
+    # Decode a string or template literal's source; None for anything else.
+    source = source.strip()
+    if len(source) < 2 or source[0] not in "\"'`" or source[-1] != source[0]:
+        return None
+    if source[0] == "`":
+        if "${" in source:
+            return None
+        return source[1:-1].replace("\\`", "`").replace("\\$", "$")
+    if source[0] == "'":
+        source = '"' + source[1:-1].replace('\\\'', "'").replace('"', '\\"') + '"'
+    return json.loads(source)
+
+
+def entry_fields(text, start, end):
+    # {key: decoded literal or None} for the properties of the object literal
+    # whose braces are at text[start] and text[end - 1].
+    fields = {}
+    for key, line_start, key_start, value_end, span_end in parse_entries(text, start + 1, end - 1):
+        colon = text.index(":", key_start)
+        fields[key] = literal_value(text[colon + 1:value_end])
+    return fields
+
+
+def parse_entries(text, start=0, end=None):
+    # Parse `key: { ... },` pairs between start and end. Each entry is
+    # (slug, line_start, key_start, value_end, span_end) where value_end is just past
+    # the closing brace and span_end also covers a trailing comma.
+    end = len(text) if end is None else end
+    entries = []
+    i = _skip_trivia(text, start, end)
+    while i < end:
+        m = _KEY_RE.match(text, i, end)
+        if not m:
+            raise ValueError(f"Expected an object key at offset {i}: {text[i:i + 40]!r}")
+        slug = next(g for g in m.groups() if g is not None)
+        key_start = m.start()
+        value_start = m.end()
+        if text[value_start] in _OPENERS:
+            value_end = find_matching(text, value_start) + 1
+        elif text[value_start] in "\"'`":
+            value_end = _skip_string(text, value_start)
+        else:
+            value_end = _skip_expression(text, value_start, end)
+
+        span_end = _skip_trivia(text, value_end, end)
+        if span_end < end and text[span_end] == ",":
+            span_end += 1
+        else:
+            span_end = value_end
+
+        line_start = text.rfind("\n", 0, key_start) + 1
+        if text[line_start:key_start].strip():
+            line_start = key_start
+        entries.append((slug, line_start, key_start, value_end, span_end))
+        i = _skip_trivia(text, span_end, end)
+    return entries
+
+
+class ArticlesIndex:
+    def __init__(self, content, name="INTERNAL_ARTICLES"):
+        self.content = content
+        self.newline = "\r\n" if "\r\n" in content else "\n"
+
+        decl = re.search(r"\b" + re.escape(name) + r"\b[^=]*=\s*\{", content)
+        if not decl:
+            raise ValueError(f"{name} object not found")
+        self.open = decl.end() - 1
+        self.close = find_matching(content, self.open)
+
+        self.entries = {}
+        self.order = []
+        for slug, line_start, key_start, value_end, span_end in parse_entries(content, self.open + 1, self.close):
+            if slug in self.entries:
+                raise ValueError(f"Duplicate article '{slug}'")
+            self.entries[slug] = (line_start, key_start, value_end, span_end)
+            self.order.append(slug)
+
+        if self.order:
+            line_start, key_start = self.entries[self.order[0]][:2]
+            self.indent = content[line_start:key_start]
+        else:
+            self.indent = "    "
+
+    def span(self, slug):
+        line_start, key_start, value_end, span_end = self.entries[slug]
+        return key_start, value_end
+
+    def source(self, slug):
+        start, end = self.span(slug)
+        return self.content[start:end]
+
+    def fields(self, slug):
+        start, end = self.span(slug)
+        return entry_fields(self.content, self.content.index("{", start), end)
+
+    def _normalize(self, entry_text):
+        text = entry_text.strip().rstrip(",").rstrip()
+        text = text.replace("\r\n", "\n").replace("\n", self.newline)
+        return text
+
+    def splice(self, upserts=None, deletes=()):
+        # upserts: {slug: entry source text `"slug": {...}`}. Existing slugs are
+        # replaced in place, new ones are appended after the last entry.
+        upserts = upserts or {}
+        edits = []
+        appended = []
+
+        for slug in deletes:
+            if slug not in self.entries:
+                raise KeyError(slug)
+            line_start, key_start, value_end, span_end = self.entries[slug]
+            end = span_end
+            # Take the rest of the line (and its newline) with the entry.
+            rest = _skip_trivia(self.content, end, self.close)
+            newline_at = self.content.find("\n", end, rest)
+            if newline_at != -1:
+                end = newline_at + 1
+            edits.append((line_start, end, ""))
+
+        for slug, entry_text in upserts.items():
+            if slug in deletes:
+                raise ValueError(f"'{slug}' is both upserted and deleted")
+            text = self._normalize(entry_text)
+            if slug in self.entries:
+                edits.append(self.span(slug) + (text,))
+            else:
+                appended.append(text)
+
+        if appended:
+            nl = self.newline
+            body = "".join(nl + self.indent + text + "," for text in appended)
+            kept = [s for s in self.order if s not in deletes]
+            if kept:
+                value_end, span_end = self.entries[kept[-1]][2:]
+                if span_end == value_end:
+                    body = "," + body
+                edits.append((span_end, span_end, body))
+            else:
+                edits.append((self.open + 1, self.open + 1, body))
+
+        edits.sort(key=lambda e: (e[0], e[1]))
+        out = []
+        pos = 0
+        for start, end, text in edits:
+            if start < pos:
+                raise ValueError("Overlapping edits")
+            out.append(self.content[pos:start])
+            out.append(text)
+            pos = end
+        out.append(self.content[pos:])
+        return "".join(out)
+
+
+def load_fragments(paths):
+    # A fragment file holds one or more `"slug": { ... }` entries, as pasted into
+    # INTERNAL_ARTICLES.
+    fragments = {}
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        for slug, line_start, key_start, value_end, span_end in parse_entries(text):
+            fragments[slug] = text[key_start:value_end]
+    return fragments
+
+
+def load_split_articles(directory=ARTICLES_DIR):
+    # {slug: fields} from the per-slug JSON files, in listing order.
+    with open(os.path.join(directory, "index.json"), "r", encoding="utf-8") as f:
+        listing = json.load(f)
+    articles = {}
+    for item in listing:
+        with open(os.path.join(directory, item["slug"] + ".json"), "r", encoding="utf-8") as f:
+            articles[item["slug"]] = json.load(f)
+    return articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List, insert, replace or delete INTERNAL_ARTICLES entries in one pass.")
+    parser.add_argument("--page", default=DEFAULT_PAGE, help="TSX file containing INTERNAL_ARTICLES")
+    parser.add_argument("--upsert", nargs="*", default=[], metavar="FRAGMENT", help="Files with entries to insert or replace")
+    parser.add_argument("--delete", nargs="*", default=[], metavar="SLUG", help="Slugs to remove")
+    args = parser.parse_args()
+
+    with open(args.page, "rb") as f:
+        original = f.read()
+    index = ArticlesIndex(original.decode("utf-8"))
+
+    if not args.upsert and not args.delete:
+        for slug in index.order:
+            start, end = index.span(slug)
+            print(f"{slug}: {start}-{end} ({end - start} chars)")
+        return
+
+    upserts = load_fragments(args.upsert)
+    content = index.splice(upserts, set(args.delete))
+    if write_if_changed(args.page, content.encode("utf-8"), original):
+        replaced = sum(1 for slug in upserts if slug in index.entries)
+        print(f"Patched {args.page}: {replaced} replaced, {len(upserts) - replaced} inserted, {len(args.delete)} deleted.")
+    else:
+        print("No changes.")
+
+
+if __name__ == "__main__":
+    main()
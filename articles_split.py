@@ -0,0 +1,209 @@
+import os
+import re
+import json
+import argparse
+
+from articles_index import ARTICLES_DIR, DEFAULT_PAGE, ArticlesIndex, entry_fields, load_split_articles
+from search_index import excerpt, strip_html
+from sync_manifest import write_if_changed
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Moves INTERNAL_ARTICLES out of berita/[slug]/page.tsx into per-slug JSON files.
+#
+#   src/data/articles/<slug>.json   title, image, date, author, body (+ any extra fields)
+#   src/data/articles/index.json    listing manifest: slug, title, date, image, author, excerpt
+#
+# The TSX is then patched in one pass per file (the same ArticlesIndex offsets
+# fix_file_2.py splices with): the literal is dropped from the article page,
+# which loads a body by slug through src/lib/internalArticles.ts, and the home
+# and listing pages import only the manifest. Dates written as expressions
+# (`new Date()...`) are stored as null and still resolved at render time.
+#
+# Running it again after the split only refreshes the manifest. write_article()
+# is the entry point for tools that used to splice articles into the page.
+
+HOME_PAGE = os.path.join(repo_root, "src", "app", "page.tsx")
+LISTING_PAGE = os.path.join(repo_root, "src", "app", "berita", "page.tsx")
+EXCERPT_CHARS = 160
+FIELD_ORDER = ("title", "image", "date", "author", "body")
+
+# (file, old, new): each rewrite must apply exactly once.
+REWRITES = [
+    (DEFAULT_PAGE,
+     "import { processSocialLinks } from '@/lib/socialEmbed';",
+     "import { processSocialLinks } from '@/lib/socialEmbed';\n"
+     "import { getInternalArticle } from '@/lib/internalArticles';"),
+    (DEFAULT_PAGE,
+     "const internalArticle = INTERNAL_ARTICLES[decodedSlug];",
+     "const internalArticle = await getInternalArticle(decodedSlug);"),
+    (DEFAULT_PAGE,
+     "let detail = INTERNAL_ARTICLES[effectiveUrl];",
+     "let detail: NewsDetail | null = await getInternalArticle(effectiveUrl);"),
+    (HOME_PAGE,
+     'import { INTERNAL_ARTICLES } from "@/app/berita/[slug]/page";',
+     'import { INTERNAL_ARTICLE_LIST, internalArticleDate } from "@/lib/internalArticles";'),
+    (HOME_PAGE,
+     "Object.entries(INTERNAL_ARTICLES).map(([slug, article]) => ({\n"
+     "    id: slug,\n"
+     "    title: article.title,\n"
+     "    slug: slug,\n"
+     "    image: article.image,\n"
+     "    date: article.date,",
+     "INTERNAL_ARTICLE_LIST.map((article) => ({\n"
+     "    id: article.slug,\n"
+     "    title: article.title,\n"
+     "    slug: article.slug,\n"
+     "    image: article.image,\n"
+     "    date: internalArticleDate(article.date),"),
+    # The listing page imported the whole literal without using it.
+    (LISTING_PAGE, 'import { INTERNAL_ARTICLES } from "@/app/berita/[slug]/page";\n', ""),
+]
+
+_IMPORT_RE = re.compile(r"""^\s*import\s[^'"]*?from\s*['"]([^'"]+)['"]""", re.M)
+
+
+def article_record(slug, fields):
+    # Known fields first, in the order the literal used, then anything extra.
+    record = {"slug": slug}
+    for key in FIELD_ORDER:
+        record[key] = fields.get(key)
+    record.update({k: v for k, v in fields.items() if k not in record})
+    return record
+
+
+def summary(record):
+    body = record.get("body") or ""
+    if isinstance(body, list):
+        body = " ".join(body)
+    return {"slug": record["slug"], "title": record["title"], "date": record.get("date"),
+            "image": record.get("image"), "author": record.get("author"),
+            "excerpt": excerpt(strip_html(body), EXCERPT_CHARS)}
+
+
+def _dump(data):
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def write_articles(records, directory=ARTICLES_DIR):
+    # records: {slug: record} in listing order. Returns the files written.
+    os.makedirs(directory, exist_ok=True)
+    written = []
+    for slug, record in records.items():
+        if write_if_changed(os.path.join(directory, slug + ".json"), _dump(record)):
+            written.append(slug + ".json")
+    if write_if_changed(os.path.join(directory, "index.json"), _dump([summary(r) for r in records.values()])):
+        written.append("index.json")
+    return written
+
+
+def write_article(slug, fields, directory=ARTICLES_DIR):
+    # Insert or replace one article, keeping its place in the listing.
+    records = load_split_articles(directory) if os.path.exists(os.path.join(directory, "index.json")) else {}
+    records[slug] = article_record(slug, fields)
+    return write_articles(records, directory)
+
+
+def fragment_fields(source):
+    # Fields of a `"slug": { ... }` fragment as returned by load_fragments().
+    return entry_fields(source, source.index("{"), len(source))
+
+
+def _resolve(spec, importer):
+    if spec.startswith("@/"):
+        base = os.path.join(repo_root, "src", spec[2:])
+    elif spec.startswith("."):
+        base = os.path.join(os.path.dirname(importer), spec)
+    else:
+        return None  # packages are the same before and after
+    for candidate in (base, base + ".ts", base + ".tsx", base + ".json", os.path.join(base, "index.ts")):
+        if os.path.isfile(candidate):
+            return os.path.normpath(candidate)
+    return None
+
+
+def static_bytes(entry):
+    # Source bytes of the entry and every local module it imports statically.
+    # Dynamic import() chunks are loaded on demand and are not counted.
+    seen = set()
+    stack = [entry]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        if path.endswith((".ts", ".tsx")):
+            with open(path, "r", encoding="utf-8") as f:
+                for spec in _IMPORT_RE.findall(f.read()):
+                    resolved = _resolve(spec, path)
+                    if resolved:
+                        stack.append(resolved)
+    return sum(os.path.getsize(p) for p in seen)
+
+
+def rewrite_pages(page_text, index):
+    # Returns {path: new text} for every file the split touches.
+    start = page_text.rfind("\n", 0, page_text.index("export const INTERNAL_ARTICLES")) + 1
+    previous = page_text.rfind("\n", 0, start - 1) + 1
+    if page_text[previous:start].strip().startswith("//"):
+        start = previous  # the "Dictionary of Internal Static Articles" comment goes too
+    end = index.close + 1
+    if page_text[end:end + 1] == ";":
+        end += 1
+    texts = {DEFAULT_PAGE: page_text[:start].rstrip() + index.newline * 2 + page_text[end:].lstrip("\r\n")}
+
+    for path, old, new in REWRITES:
+        if path not in texts:
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                texts[path] = f.read()
+        newline = "\r\n" if "\r\n" in texts[path] else "\n"
+        old, new = old.replace("\n", newline), new.replace("\n", newline)
+        count = texts[path].count(old)
+        if count != 1:
+            raise ValueError(f"Expected one match in {os.path.relpath(path, repo_root)}, found {count}: {old[:60]!r}")
+        texts[path] = texts[path].replace(old, new)
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split INTERNAL_ARTICLES into per-slug JSON files loaded on demand.")
+    parser.add_argument("--out", default=ARTICLES_DIR)
+    parser.add_argument("-n", "--dry-run", action="store_true", help="Report bundle sizes without writing")
+    args = parser.parse_args()
+
+    entries = [DEFAULT_PAGE, HOME_PAGE, LISTING_PAGE]
+    before = {p: static_bytes(p) for p in entries}
+
+    with open(DEFAULT_PAGE, "r", encoding="utf-8", newline="") as f:
+        page_text = f.read()
+    if "INTERNAL_ARTICLES" not in page_text:
+        records = load_split_articles(args.out)
+        written = [] if args.dry_run else write_articles(records, args.out)
+        print(f"Already split: {len(records)} articles, {len(written)} files refreshed.")
+        return
+
+    index = ArticlesIndex(page_text)
+    records = {slug: article_record(slug, index.fields(slug)) for slug in index.order}
+    texts = rewrite_pages(page_text, index)
+
+    if args.dry_run:
+        body_bytes = sum(len(_dump(r)) for r in records.values())
+        print(f"{len(records)} articles, {body_bytes / 1024:.1f} KB would move to {os.path.relpath(args.out, repo_root)}")
+        for path in entries:
+            print(f"  {os.path.relpath(path, repo_root)}: {before[path] / 1024:.1f} KB static")
+        return
+
+    written = write_articles(records, args.out)
+    for path, text in texts.items():
+        write_if_changed(path, text.encode("utf-8"))
+    print(f"{len(records)} articles -> {os.path.relpath(args.out, repo_root)} ({len(written)} files written)")
+
+    for path in entries:
+        after = static_bytes(path)
+        print(f"  {os.path.relpath(path, repo_root)}: {before[path] / 1024:.1f} KB -> {after / 1024:.1f} KB static")
+    chunks = sum(os.path.getsize(os.path.join(args.out, s + ".json")) for s in records)
+    print(f"  on-demand article chunks: {chunks / 1024:.1f} KB in {len(records)} files")
+
+
+if __name__ == "__main__":
+    main()
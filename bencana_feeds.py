@@ -0,0 +1,234 @@
+import os
+import json
+import time
+import asyncio
+import hashlib
+import argparse
+from datetime import datetime, timezone
+
+from response_cache import ResponseCache
+from sync_manifest import atomic_write, write_if_changed
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Server-side aggregator for the feeds /bencana fetches from every browser.
+#
+# Each poll requests all feeds concurrently over one aiohttp session, sending
+# If-None-Match / If-Modified-Since from the previous answer so unchanged feeds
+# cost a 304. The results are merged into one snapshot:
+#
+#   public/data/bencana/snapshot.json
+#       {"version": n, "updated": ..., "feeds": {name: {"success", "data", "updated", "stale"}}}
+#
+# The version only moves (and the file is only rewritten) when some feed's data
+# actually changed. A failing feed keeps its last good data, marked stale.
+# Validators, last data and per-feed latency live in .cache/bencana_state.json.
+#
+# Reverse geocodes go through ReverseGeocoder, which snaps coordinates to a
+# GRID-degree bucket (0.01 deg is about 1.1 km) and caches one Nominatim answer
+# per bucket, so nearby visitors share a lookup and Nominatim sees at most one
+# request per second from us.
+
+BASE_URL = os.environ.get('BENCANA_BASE_URL', 'https://monitor-bencana.vercel.app')
+NOMINATIM_URL = os.environ.get('NOMINATIM_URL', 'https://nominatim.openstreetmap.org')
+USER_AGENT = 'KarangTaruna-AstaWiraDipta/1.0 (+https://astawiradipta.my.id/bencana)'
+FEEDS = {
+    'quake': '/quake',
+    'quake_recent': '/quake/recent',
+    'quake_felt': '/quake/felt',
+    'flood': '/flood',
+    'volcano': '/volcano',
+    'tsunami': '/tsunami',
+    'weather': '/weather/jawa-tengah/surakarta',
+}
+SNAPSHOT_PATH = os.path.join(repo_root, 'public', 'data', 'bencana', 'snapshot.json')
+STATE_PATH = os.path.join(repo_root, '.cache', 'bencana_state.json')
+GEOCODE_CACHE_PATH = os.path.join(repo_root, '.cache', 'geocode.sqlite3')
+GEOCODE_TTL = 30 * 24 * 60 * 60
+GRID = 0.01
+POLL_INTERVAL = 5 * 60  # what the page used to refresh on
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z')
+
+
+def _hash(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class FeedAggregator:
+    def __init__(self, base_url=BASE_URL, feeds=FEEDS, state_path=STATE_PATH, timeout=15):
+        self.base_url = base_url.rstrip('/')
+        self.feeds = feeds
+        self.state_path = state_path
+        self.timeout = timeout
+        self.state = {'version': 0, 'feeds': {}}
+        if os.path.exists(state_path):
+            with open(state_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+
+    async def _fetch(self, session, name, path):
+        import aiohttp
+
+        feed = self.state['feeds'].setdefault(name, {})
+        headers = {}
+        if feed.get('etag'):
+            headers['If-None-Match'] = feed['etag']
+        if feed.get('last_modified'):
+            headers['If-Modified-Since'] = feed['last_modified']
+
+        start = time.perf_counter()
+        try:
+            async with session.get(self.base_url + path, headers=headers) as res:
+                if res.status == 304:
+                    outcome = 'not-modified'
+                else:
+                    res.raise_for_status()
+                    body = await res.json(content_type=None)
+                    if not isinstance(body, dict) or not body.get('success'):
+                        raise ValueError('feed answered success=false')
+                    if _hash(body.get('data')) != feed.get('hash'):
+                        feed.update(data=body.get('data'), hash=_hash(body.get('data')), updated=_now())
+                    feed.update(etag=res.headers.get('ETag'), last_modified=res.headers.get('Last-Modified'))
+                    outcome = 'ok'
+                feed['stale'] = False
+                feed['error'] = None
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            outcome = 'error'
+            feed['stale'] = True
+            feed['error'] = repr(e)
+        feed['latency_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        feed['outcome'] = outcome
+        return name, outcome
+
+    async def poll(self):
+        import aiohttp
+
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(timeout=timeout, headers={'User-Agent': USER_AGENT}) as session:
+            return dict(await asyncio.gather(*(self._fetch(session, n, p) for n, p in self.feeds.items())))
+
+    def snapshot(self):
+        feeds = {name: {'success': 'data' in f, 'data': f.get('data'), 'updated': f.get('updated'),
+                        'stale': f.get('stale', False)}
+                 for name, f in ((n, self.state['feeds'].get(n, {})) for n in self.feeds)}
+        digest = _hash(feeds)
+        if digest != self.state.get('hash'):
+            self.state.update(hash=digest, version=self.state.get('version', 0) + 1, updated=_now())
+        return {'version': self.state['version'], 'updated': self.state['updated'], 'feeds': feeds}
+
+    def save_state(self):
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        atomic_write(self.state_path, json.dumps(self.state, ensure_ascii=False).encode('utf-8'))
+
+    def latency(self):
+        return {n: {k: self.state['feeds'].get(n, {}).get(k) for k in ('outcome', 'latency_ms', 'error')}
+                for n in self.feeds}
+
+
+async def poll_once(aggregator, snapshot_path=SNAPSHOT_PATH):
+    start = time.perf_counter()
+    await aggregator.poll()
+    snapshot = aggregator.snapshot()
+    os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+    changed = write_if_changed(snapshot_path, json.dumps(snapshot, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    aggregator.save_state()
+    return {'version': snapshot['version'], 'changed': changed,
+            'seconds': round(time.perf_counter() - start, 3), 'feeds': aggregator.latency()}
+
+
+class ReverseGeocoder:
+    def __init__(self, cache=None, base_url=NOMINATIM_URL, grid=GRID, min_interval=1.0):
+        self.cache = cache or ResponseCache(GEOCODE_CACHE_PATH, ttl=GEOCODE_TTL, max_entries=20000)
+        self.base_url = base_url.rstrip('/')
+        self.grid = grid
+        self.min_interval = min_interval
+        self.lock = asyncio.Lock()
+        self.last_request = 0.0
+        self.requests_made = 0
+
+    def bucket(self, lat, lon):
+        # Snap to the bucket centre so every point in a cell resolves the same way.
+        i, j = round(lat / self.grid), round(lon / self.grid)
+        return f'reverse:{self.grid}:{i}:{j}', round(i * self.grid, 6), round(j * self.grid, 6)
+
+    async def reverse(self, session, lat, lon):
+        key, blat, blon = self.bucket(lat, lon)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        async with self.lock:  # Nominatim's usage policy: at most one request per second
+            wait = self.last_request + self.min_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self.last_request = time.monotonic()
+            self.requests_made += 1
+            params = {'format': 'json', 'lat': str(blat), 'lon': str(blon), 'zoom': '18', 'addressdetails': '1'}
+            async with session.get(self.base_url + '/reverse', params=params,
+                                   headers={'Accept-Language': 'id', 'User-Agent': USER_AGENT}) as res:
+                if res.status != 200:
+                    return None
+                data = await res.json(content_type=None)
+
+        # Same fields the page pulls out of the Nominatim answer.
+        address = data.get('address') or {}
+        result = {
+            'address': data.get('display_name'),
+            'city': address.get('city') or address.get('town') or address.get('municipality')
+            or address.get('county') or address.get('village') or address.get('suburb'),
+            'province': address.get('state') or address.get('region'),
+            'country': address.get('country'),
+        }
+        self.cache.put(key, result)
+        return result
+
+
+async def reverse_many(points, base_url=NOMINATIM_URL, cache=None):
+    import aiohttp
+
+    geocoder = ReverseGeocoder(cache, base_url)
+    async with aiohttp.ClientSession() as session:
+        results = [await geocoder.reverse(session, lat, lon) for lat, lon in points]
+    return results, geocoder
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Poll the disaster feeds into one versioned snapshot.")
+    parser.add_argument('--base-url', default=BASE_URL)
+    parser.add_argument('--out', default=SNAPSHOT_PATH)
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('poll', help="Poll every feed once")
+    w = sub.add_parser('watch', help="Poll on a schedule until interrupted")
+    w.add_argument('--interval', type=int, default=POLL_INTERVAL)
+    g = sub.add_parser('geocode', help="Reverse-geocode LAT,LON pairs through the bucket cache")
+    g.add_argument('points', nargs='+', help="LAT,LON")
+    g.add_argument('--nominatim-url', default=NOMINATIM_URL)
+    args = parser.parse_args()
+
+    if args.command == 'geocode':
+        points = [tuple(float(v) for v in p.split(',')) for p in args.points]
+        start = time.perf_counter()
+        results, geocoder = asyncio.run(reverse_many(points, args.nominatim_url))
+        for (lat, lon), result in zip(points, results):
+            print(f"{lat:.5f},{lon:.5f}  {geocoder.bucket(lat, lon)[0]}  {(result or {}).get('address')}")
+        print(f"{len(points)} lookups, {geocoder.requests_made} requests, {geocoder.cache.hits} cache hits "
+              f"in {time.perf_counter() - start:.2f}s")
+        geocoder.cache.close()
+        return
+
+    aggregator = FeedAggregator(args.base_url)
+    while True:
+        result = asyncio.run(poll_once(aggregator, args.out))
+        for name, feed in result['feeds'].items():
+            note = f"  {feed['error']}" if feed['error'] else ''
+            print(f"  {name:<13} {feed['outcome']:<13} {feed['latency_ms']:>8.1f} ms{note}")
+        print(f"snapshot v{result['version']}{'' if result['changed'] else ' (unchanged)'} in {result['seconds']:.2f}s")
+        if args.command != 'watch':
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == '__main__':
+    main()
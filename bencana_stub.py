@@ -0,0 +1,147 @@
+import json
+import time
+import hashlib
+import threading
+import argparse
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for monitor-bencana.vercel.app and Nominatim's /reverse.
+#
+# Serves one fixture per feed in the {"success": true, "data": ...} envelope the
+# /bencana page expects, shaped after the interfaces in bencana/page.tsx. Every
+# response carries an ETag and Last-Modified and honours If-None-Match, so the
+# aggregator's conditional requests can be exercised. DELAY adds latency per
+# request; bump() changes a feed so the next poll sees new content.
+
+FIXTURES = {
+    '/quake': {
+        'tanggal': '17 Okt 2026', 'jam': '08:12:45 WIB', 'datetime': '2026-10-17T01:12:45+00:00',
+        'coordinates': '-8.45,110.32', 'lintang': '8.45 LS', 'bujur': '110.32 BT', 'magnitude': '4.9',
+        'kedalaman': '10 km', 'wilayah': 'Pusat gempa berada di laut 72 km BaratDaya Gunungkidul',
+        'potensi': 'Tidak berpotensi tsunami', 'dirasakan': 'III Yogyakarta, II Surakarta',
+        'shakemap': '20261017081245.mmi.jpg',
+    },
+    '/quake/recent': [
+        {'Tanggal': '17 Okt 2026', 'Jam': '08:12:45 WIB', 'DateTime': '2026-10-17T01:12:45+00:00',
+         'Coordinates': '-8.45,110.32', 'Lintang': '8.45 LS', 'Bujur': '110.32 BT', 'Magnitude': '4.9',
+         'Kedalaman': '10 km', 'Wilayah': '72 km BaratDaya GUNUNGKIDUL-DIY', 'Potensi': 'Tidak berpotensi tsunami'},
+        {'Tanggal': '16 Okt 2026', 'Jam': '21:03:10 WIB', 'DateTime': '2026-10-16T14:03:10+00:00',
+         'Coordinates': '-7.80,112.60', 'Lintang': '7.80 LS', 'Bujur': '112.60 BT', 'Magnitude': '3.1',
+         'Kedalaman': '12 km', 'Wilayah': '15 km Tenggara MALANG-JATIM', 'Potensi': 'Tidak berpotensi tsunami'},
+    ],
+    '/quake/felt': [
+        {'Tanggal': '17 Okt 2026', 'Jam': '08:12:45 WIB', 'DateTime': '2026-10-17T01:12:45+00:00',
+         'Coordinates': '-8.45,110.32', 'Lintang': '8.45 LS', 'Bujur': '110.32 BT', 'Magnitude': '4.9',
+         'Kedalaman': '10 km', 'Wilayah': '72 km BaratDaya GUNUNGKIDUL-DIY', 'Dirasakan': 'III Yogyakarta, II Surakarta'},
+    ],
+    '/flood': [
+        {'region': 'Surakarta', 'title': 'Pos Jurug', 'location': 'Bengawan Solo - Jurug', 'status': 'Normal',
+         'height_desc': 'TMA 2.10 m', 'weather_support': 'Berawan', 'image_url': None,
+         'coordinates': {'lat': -7.5664, 'lon': 110.8581}, 'updated_at': '2026-10-17T07:00:00+07:00'},
+    ],
+    '/volcano': [
+        {'name': 'Merapi', 'status': 'Level III (Siaga)', 'link': 'https://magma.esdm.go.id/v1/gunung-api/tingkat-aktivitas'},
+        {'name': 'Lawu', 'status': 'Level I (Normal)', 'link': 'https://magma.esdm.go.id/v1/gunung-api/tingkat-aktivitas'},
+    ],
+    '/tsunami': {
+        'status': 'Tidak ada peringatan', 'description': 'Tidak ada peringatan dini tsunami saat ini.',
+        'gempa_terkait': {'magnitude': '4.9', 'wilayah': '72 km BaratDaya GUNUNGKIDUL-DIY', 'jam': '08:12:45 WIB',
+                          'tanggal': '17 Okt 2026', 'coordinates': '-8.45,110.32'},
+    },
+    '/weather/jawa-tengah/surakarta': {
+        'current_weather': {'temperature': 29.4, 'windspeed': 7.2, 'winddirection': 140, 'is_day': 1, 'weathercode': 2},
+        'precision_aqi': {'source': 'stub', 'aqi': 62, 'pm2_5': 18.1, 'pm10': 30.2, 'time': '2026-10-17T08:00'},
+        'description': 'Berawan',
+    },
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    feeds = {}
+    delay = 0.0
+    lock = threading.Lock()
+    requests_seen = 0
+    not_modified = 0
+    reverse_seen = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b'', headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def _reverse(self, query):
+        type(self).reverse_seen += 1
+        lat = float(query.get('lat', ['0'])[0])
+        lon = float(query.get('lon', ['0'])[0])
+        payload = {'display_name': f'Stub {lat:.4f}, {lon:.4f}, Surakarta, Jawa Tengah, Indonesia',
+                   'address': {'city': 'Surakarta', 'state': 'Jawa Tengah', 'country': 'Indonesia'}}
+        return self._send(200, json.dumps(payload).encode('utf-8'))
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if self.delay:
+            time.sleep(self.delay)
+        with self.lock:
+            type(self).requests_seen += 1
+        if url.path == '/reverse':
+            return self._reverse(parse_qs(url.query))
+
+        feed = self.feeds.get(url.path)
+        if feed is None:
+            return self._send(404, b'{"success":false}')
+        body, etag, modified = feed
+        headers = {'ETag': etag, 'Last-Modified': modified, 'Cache-Control': 'no-cache'}
+        if self.headers.get('If-None-Match') == etag:
+            with self.lock:
+                type(self).not_modified += 1
+            return self._send(304, headers=headers)
+        return self._send(200, body, headers)
+
+
+def _encode(data):
+    body = json.dumps({'success': True, 'data': data}).encode('utf-8')
+    etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+    return body, etag, time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime())
+
+
+def bump(server, path, data):
+    # Replace one feed's payload (new ETag), as if upstream had new data.
+    server.RequestHandlerClass.feeds[path] = _encode(data)
+
+
+def start_stub_server(port=0, delay=0.0, fixtures=FIXTURES):
+    # Runs in a daemon thread; returns (server, base_url). Call server.shutdown() when done.
+    handler = type('Handler', (StubHandler,), {
+        'feeds': {path: _encode(data) for path, data in fixtures.items()}, 'delay': delay,
+    })
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve stub disaster feeds and a stub reverse geocoder locally.")
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--delay', type=float, default=0.0, help="Seconds to wait before each response")
+    args = parser.parse_args()
+
+    server, url = start_stub_server(args.port, args.delay)
+    print(f"Bencana stub listening on {url} (BENCANA_BASE_URL={url} NOMINATIM_URL={url})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,349 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import base64
+import argparse
+import platform
+import tracemalloc
+import multiprocessing
+from datetime import datetime, timedelta, timezone
+
+from sync_manifest import atomic_write
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Benchmark harness for the data/*.json flat-file content store.
+#
+# Generates synthetic content.json / gallery.json corpora (a share of the posts
+# carry an inline base64 image, like the current "tes" post; gallery has one
+# entry per five posts, looked up by id), then times each storage strategy on
+# both in a fresh process so peak RSS is per case:
+#
+#   json     stdlib json.load / json.dump of the whole array (what the API does)
+#   stream   incremental array parsing (ijson when installed, else a stdlib
+#            raw_decode reader); lookups stop at the first match
+#   indexed  same file plus a sidecar {slug: [offset, length]} written alongside,
+#            so a lookup seeks and decodes one record
+#
+# Results go to a JSON file; pass --baseline with an earlier file to flag cases
+# that got slower than --threshold.
+
+WORK_DIR = os.path.join(repo_root, '.cache', 'bench')
+RESULTS_PATH = os.path.join(WORK_DIR, 'content_bench.json')
+DEFAULT_SIZES = [1, 100, 1000, 10000]
+BACKENDS = ('json', 'stream', 'indexed')
+CORPORA = {'posts': 'content', 'gallery': 'gallery'}  # corpus -> file name
+CHUNK_SIZE = 64 * 1024
+CATEGORIES = ['Kegiatan', 'Pengumuman', 'Sosial', 'Olahraga', 'Design', 'Pendidikan']
+WORDS = ('karang taruna kelurahan warga kegiatan sosial pemuda kerja bakti lomba agustus '
+         'posyandu rapat pengurus surakarta mojo pasar kliwon lingkungan bersih budaya').split()
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _paragraphs(rng, n):
+    return ''.join('<p>' + ' '.join(rng.choice(WORDS) for _ in range(rng.randint(30, 80))).capitalize() + '.</p>'
+                   for _ in range(n))
+
+
+def generate_corpus(size, image_ratio=0.1, image_bytes=256 * 1024, seed=1):
+    rng = random.Random(seed)
+    # One shared payload keeps generation fast; the parsers still see every byte.
+    image = 'data:image/png;base64,' + base64.b64encode(rng.randbytes(image_bytes * 3 // 4)).decode('ascii')
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    posts = []
+    for i in range(size):
+        date = (start + timedelta(hours=i)).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+        content = _paragraphs(rng, rng.randint(3, 8))
+        if rng.random() < image_ratio:
+            content += f'<img src="{image}" style="width: 342px; max-width: 100%;">'
+        posts.append({
+            'id': f'{i:08x}-0000-4000-8000-{rng.getrandbits(48):012x}',
+            'title': f'Post {i} ' + ' '.join(rng.choice(WORDS) for _ in range(4)),
+            'content': content,
+            'status': 'published' if rng.random() < 0.9 else 'draft',
+            'image': f'/uploads/post-{i}.webp',
+            'categories': rng.sample(CATEGORIES, 2),
+            'tags': rng.sample(WORDS, 3),
+            'date': date,
+            'slug': f'post-{i}',
+            'createdAt': date,
+            'updatedAt': date,
+        })
+    gallery = [{'id': str(i), 'title': f'Galeri {i}', 'description': ' '.join(rng.choice(WORDS) for _ in range(12)),
+                'imageUrl': f'/images/galeri/{i}.webp', 'category': rng.choice(CATEGORIES),
+                'date': posts[i]['date'][:10] if i < size else '2024-01-01'}
+               for i in range(max(1, size // 5))]
+    return posts, gallery
+
+
+def write_indexed(path, records, key='slug'):
+    # Writes the same JSON array json.dump would produce plus a sidecar index of
+    # byte ranges, one serialization per record.
+    offsets = {}
+    parts = [b'[']
+    pos = 1
+    for n, record in enumerate(records):
+        if n:
+            parts.append(b',')
+            pos += 1
+        raw = json.dumps(record, ensure_ascii=False).encode('utf-8')
+        offsets[record[key]] = [pos, len(raw)]
+        parts.append(raw)
+        pos += len(raw)
+    parts.append(b']')
+    atomic_write(path, b''.join(parts))
+    atomic_write(path + '.idx', json.dumps(offsets, separators=(',', ':')).encode('utf-8'))
+
+
+def iter_array(path):
+    # Streams the elements of a top-level JSON array without loading the file.
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+        return
+
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buf = f.read(CHUNK_SIZE).lstrip()
+        if not buf.startswith('['):
+            raise ValueError(f'{path} is not a JSON array')
+        buf = buf[1:]
+        eof = False
+        while True:
+            buf = buf.lstrip().lstrip(',').lstrip()
+            if buf.startswith(']'):
+                return
+            try:
+                item, end = decoder.raw_decode(buf)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                more = f.read(max(CHUNK_SIZE, len(buf)))
+                eof = not more
+                buf += more
+                continue
+            yield item
+            buf = buf[end:]
+            if len(buf) < CHUNK_SIZE and not eof:
+                more = f.read(CHUNK_SIZE)
+                eof = not more
+                buf += more
+
+
+class JsonStore:
+    def __init__(self, path, key='slug'):
+        self.path = path
+        self.key = key
+
+    def load_all(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def lookup(self, slug):
+        return next((p for p in self.load_all() if p.get(self.key) == slug), None)
+
+    def update(self, slug, changes):
+        posts = self.load_all()
+        for post in posts:
+            if post.get(self.key) == slug:
+                post.update(changes)
+        atomic_write(self.path, json.dumps(posts, indent=2, ensure_ascii=False).encode('utf-8'))
+
+
+class StreamStore(JsonStore):
+    def load_all(self):
+        return list(iter_array(self.path))
+
+    def lookup(self, slug):
+        return next((p for p in iter_array(self.path) if p.get(self.key) == slug), None)
+
+    def update(self, slug, changes):
+        # Rewriting still has to visit every record, but never holds the
+        # decoded array: records are re-serialized as they stream past.
+        def records():
+            for post in iter_array(self.path):
+                if post.get(self.key) == slug:
+                    post.update(changes)
+                yield json.dumps(post, ensure_ascii=False).encode('utf-8')
+        atomic_write(self.path, b'[' + b','.join(records()) + b']')
+
+
+class IndexedStore(JsonStore):
+    def __init__(self, path, key='slug'):
+        super().__init__(path, key)
+        with open(path + '.idx', 'r', encoding='utf-8') as f:
+            self.index = json.load(f)
+
+    def lookup(self, slug):
+        span = self.index.get(slug)
+        if span is None:
+            return None
+        with open(self.path, 'rb') as f:
+            f.seek(span[0])
+            return json.loads(f.read(span[1]))
+
+    def update(self, slug, changes):
+        posts = self.load_all()
+        for post in posts:
+            if post.get(self.key) == slug:
+                post.update(changes)
+        write_indexed(self.path, posts, self.key)
+        with open(self.path + '.idx', 'r', encoding='utf-8') as f:
+            self.index = json.load(f)
+
+
+STORES = {'json': JsonStore, 'stream': StreamStore, 'indexed': IndexedStore}
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss  # bytes on macOS, KiB elsewhere
+
+
+def run_case(backend, path, key, target, trace=False):
+    # Runs in a fresh process so ru_maxrss is the peak for this case alone. The
+    # lookup goes first, so lookup_rss_kb is not inflated by the full parse.
+    # tracemalloc hooks every allocation and slows the JSON parse far more than
+    # an indexed lookup, so the timings come from an untraced run and the heap
+    # figures from a separate run with trace=True.
+    if trace:
+        tracemalloc.start()
+    store = STORES[backend](path, key)
+    found, lookup_s = _timed(store.lookup, target)
+    lookup_heap = tracemalloc.get_traced_memory()[1] if trace else 0
+    lookup_rss = _peak_rss_kb()
+    records, parse_s = _timed(store.load_all)
+    count = len(records)
+    del records
+    _, rewrite_s = _timed(store.update, target, {'title': 'Updated', 'updatedAt': '2026-01-01T00:00:00.000Z'})
+    if trace:
+        _, heap_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {'lookup_heap_kb': lookup_heap // 1024, 'heap_peak_kb': heap_peak // 1024}
+    return {'records': count, 'found': found is not None, 'parse_s': round(parse_s, 5),
+            'lookup_s': round(lookup_s, 5), 'rewrite_s': round(rewrite_s, 5),
+            'lookup_rss_kb': lookup_rss, 'peak_rss_kb': _peak_rss_kb()}
+
+
+def prepare(size, work_dir, image_ratio, image_bytes):
+    # -> {corpus: (key field, target value, {backend: path}, file bytes)}
+    posts, gallery = generate_corpus(size, image_ratio, image_bytes)
+    case_dir = os.path.join(work_dir, str(size))
+    os.makedirs(case_dir, exist_ok=True)
+    cases = {}
+    for corpus, records, key in (('posts', posts, 'slug'), ('gallery', gallery, 'id')):
+        name = CORPORA[corpus]
+        paths = {}
+        for backend in BACKENDS:
+            path = os.path.join(case_dir, f'{name}.{backend}.json')
+            if backend == 'indexed':
+                write_indexed(path, records, key)
+            else:
+                atomic_write(path, json.dumps(records, indent=2, ensure_ascii=False).encode('utf-8'))
+            paths[backend] = path
+        # The last record is the worst case for a linear scan.
+        cases[corpus] = (key, records[-1][key], paths, os.path.getsize(paths['json']))
+    return cases
+
+
+def compare(results, baseline, threshold):
+    # Results from before gallery was measured have no corpus: they are posts.
+    previous = {(r.get('corpus', 'posts'), r['backend'], r['size']): r for r in baseline.get('results', [])}
+    regressions = []
+    for r in results:
+        old = previous.get((r['corpus'], r['backend'], r['size']))
+        if not old:
+            continue
+        for metric in ('parse_s', 'lookup_s', 'rewrite_s'):
+            if old[metric] > 0 and r[metric] > old[metric] * (1 + threshold):
+                regressions.append({'corpus': r['corpus'], 'backend': r['backend'], 'size': r['size'], 'metric': metric,
+                                    'before': old[metric], 'after': r[metric]})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the flat-file content store against streaming and indexed alternatives.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per case; the fastest is kept")
+    parser.add_argument('--image-ratio', type=float, default=0.1, help="Share of posts with an inline base64 image")
+    parser.add_argument('--image-kb', type=int, default=256)
+    parser.add_argument('--work-dir', default=WORK_DIR)
+    parser.add_argument('-o', '--out', default=RESULTS_PATH)
+    parser.add_argument('--baseline', help="Earlier results file to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25)
+    args = parser.parse_args()
+
+    # The parent never holds a corpus: Linux carries the peak RSS over fork/exec,
+    # so generation and every measurement run in their own worker process.
+    ctx = multiprocessing.get_context('spawn')
+    results = []
+    for size in args.sizes:
+        with ctx.Pool(1) as pool:
+            cases = pool.apply(prepare, (size, args.work_dir, args.image_ratio, args.image_kb * 1024))
+        for corpus, (key, target, paths, file_bytes) in cases.items():
+            print(f"{size} posts, {CORPORA[corpus]}.json {file_bytes / 1024 / 1024:.1f} MB")
+            for backend in args.backends:
+
+                def run(trace):
+                    # Rewrites mutate the file, so every run starts from a fresh copy.
+                    run_path = paths[backend] + '.run'
+                    shutil.copyfile(paths[backend], run_path)
+                    if backend == 'indexed':
+                        shutil.copyfile(paths[backend] + '.idx', run_path + '.idx')
+                    with ctx.Pool(1) as pool:
+                        return pool.apply(run_case, (backend, run_path, key, target, trace))
+
+                runs = [run(False) for _ in range(args.repeat)]
+                best = min(runs, key=lambda r: r['parse_s'] + r['lookup_s'] + r['rewrite_s'])
+                best.update(run(True))
+                best.update({'corpus': corpus, 'backend': backend, 'size': size, 'file_bytes': file_bytes})
+                results.append(best)
+                print(f"  {backend:<8} parse {best['parse_s'] * 1000:9.1f} ms  lookup {best['lookup_s'] * 1000:9.2f} ms  "
+                      f"rewrite {best['rewrite_s'] * 1000:9.1f} ms  lookup rss {best['lookup_rss_kb'] or 0:>7} KB  "
+                      f"peak rss {best['peak_rss_kb'] or 0:>7} KB")
+
+    report = {
+        'generated': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'stream_parser': 'ijson' if ijson else 'stdlib',
+        'image_ratio': args.image_ratio,
+        'image_kb': args.image_kb,
+        'results': results,
+    }
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            report['regressions'] = compare(results, json.load(f), args.threshold)
+        for r in report['regressions']:
+            print(f"REGRESSION {r['corpus']}/{r['backend']}/{r['size']} {r['metric']}: {r['before']} -> {r['after']}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    atomic_write(args.out, json.dumps(report, indent=2).encode('utf-8'))
+    print(f"\nResults -> {args.out}")
+    if report.get('regressions'):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+import os
+import ast
+import json
+import time
+import sqlite3
+import argparse
+import contextlib
+
+from sync_manifest import write_if_changed
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# SQLite store for the data/*.json flat files (posts, gallery, videos, users).
+#
+# Each record is kept whole as a JSON document, next to the columns we look up
+# and filter on (slug, status, date, categories), so a single post is read or
+# saved through an index instead of parsing and rewriting the whole array.
+# Saves run in one IMMEDIATE transaction keyed by id (falling back to slug), so
+# two concurrent saves of the same post update one row rather than appending a
+# duplicate. `export` writes the JSON files back byte-for-byte in the original
+# order and formatting for anything that still reads them.
+
+DATA_DIR = os.path.join(repo_root, 'data')
+DB_PATH = os.path.join(DATA_DIR, 'content.sqlite3')
+
+# collection -> (file name, indexed columns)
+COLLECTIONS = {
+    'posts': ('content.json', ('slug', 'status', 'date')),
+    'gallery': ('gallery.json', ('category', 'date')),
+    'videos': ('videos.json', ('date',)),
+    'users': ('users.json', ('username',)),
+}
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT PRIMARY KEY, position INTEGER NOT NULL, slug TEXT, status TEXT, date TEXT, doc TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS posts_slug ON posts (slug);
+CREATE INDEX IF NOT EXISTS posts_status_date ON posts (status, date);
+CREATE INDEX IF NOT EXISTS posts_date ON posts (date);
+CREATE TABLE IF NOT EXISTS post_categories (
+    post_id TEXT NOT NULL REFERENCES posts (id) ON DELETE CASCADE, category TEXT NOT NULL,
+    PRIMARY KEY (category, post_id)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS post_categories_post ON post_categories (post_id);
+CREATE TABLE IF NOT EXISTS gallery (
+    id TEXT PRIMARY KEY, position INTEGER NOT NULL, category TEXT, date TEXT, doc TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS gallery_category ON gallery (category);
+CREATE INDEX IF NOT EXISTS gallery_date ON gallery (date);
+CREATE TABLE IF NOT EXISTS videos (
+    id TEXT PRIMARY KEY, position INTEGER NOT NULL, date TEXT, doc TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS videos_date ON videos (date);
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY, position INTEGER NOT NULL, username TEXT, doc TEXT NOT NULL);
+CREATE UNIQUE INDEX IF NOT EXISTS users_username ON users (username);
+'''
+
+
+def parse_list(value):
+    # Older saves stored lists as Python reprs ("['Design']"); accept both.
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    if isinstance(value, str) and value.strip().startswith('['):
+        with contextlib.suppress(ValueError, SyntaxError):
+            return [str(v) for v in ast.literal_eval(value)]
+    return [value] if isinstance(value, str) and value else []
+
+
+class ContentStore:
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self.db = sqlite3.connect(path, isolation_level=None, timeout=30)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute('PRAGMA foreign_keys=ON')
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        # IMMEDIATE takes the write lock up front, so concurrent saves queue
+        # instead of both reading "not found" and inserting twice.
+        self.db.execute('BEGIN IMMEDIATE')
+        try:
+            yield self.db
+        except BaseException:
+            self.db.execute('ROLLBACK')
+            raise
+        self.db.execute('COMMIT')
+
+    def _put(self, db, collection, record, position=None, replace=True):
+        columns = COLLECTIONS[collection][1]
+        if position is None:
+            row = db.execute(f'SELECT position FROM {collection} WHERE id = ?', (record['id'],)).fetchone()
+            position = row[0] if row else db.execute(f'SELECT COALESCE(MIN(position), 0) - 1 FROM {collection}').fetchone()[0]
+        values = [record['id'], position] + [record.get(c) for c in columns]
+        names = ', '.join(('id', 'position') + columns)
+        marks = ', '.join('?' * (len(values) + 1))
+        verb = 'INSERT OR REPLACE' if replace else 'INSERT'
+        db.execute(f'{verb} INTO {collection} ({names}, doc) VALUES ({marks})',
+                   values + [json.dumps(record, ensure_ascii=False)])
+        if collection == 'posts':
+            db.execute('DELETE FROM post_categories WHERE post_id = ?', (record['id'],))
+            db.executemany('INSERT OR IGNORE INTO post_categories (post_id, category) VALUES (?, ?)',
+                           [(record['id'], c) for c in parse_list(record.get('categories'))])
+
+    def migrate(self, data_dir=DATA_DIR):
+        # Plain INSERTs: a duplicate id (or username) fails the whole migration
+        # instead of one record silently replacing another.
+        counts = {}
+        conflicts = []
+        with self.transaction() as db:
+            for collection, (name, _) in COLLECTIONS.items():
+                path = os.path.join(data_dir, name)
+                if not os.path.exists(path):
+                    continue
+                with open(path, 'r', encoding='utf-8') as f:
+                    records = json.load(f)
+                db.execute(f'DELETE FROM {collection}')
+                for position, record in enumerate(records):
+                    if record.get('id') is None:
+                        record = dict(record, id=record.get('slug') or f'{collection}-{position}')
+                    try:
+                        self._put(db, collection, record, position, replace=False)
+                    except sqlite3.IntegrityError as e:
+                        conflicts.append(f"{collection}[{position}] id={record['id']!r}: {e}")
+                counts[collection] = len(records)
+            if conflicts:
+                raise ValueError('conflicting records, nothing migrated:\n  ' + '\n  '.join(conflicts))
+        return counts
+
+    def export(self, data_dir=DATA_DIR):
+        # Same layout the JSON files were written with (2-space indent, UTF-8,
+        # no trailing newline); unchanged files are not touched.
+        written = []
+        for collection, (name, _) in COLLECTIONS.items():
+            rows = self.db.execute(f'SELECT doc FROM {collection} ORDER BY position').fetchall()
+            data = json.dumps([json.loads(doc) for doc, in rows], indent=2, ensure_ascii=False)
+            if write_if_changed(os.path.join(data_dir, name), data.encode('utf-8')):
+                written.append(name)
+        return written
+
+    def get(self, collection, id):
+        row = self.db.execute(f'SELECT doc FROM {collection} WHERE id = ?', (id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_post(self, slug=None, id=None):
+        if id is not None:
+            return self.get('posts', id)
+        row = self.db.execute('SELECT doc FROM posts WHERE slug = ? ORDER BY position LIMIT 1', (slug,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list_posts(self, status=None, category=None, limit=20, offset=0):
+        # Newest first, as the listing pages show them.
+        sql = 'SELECT p.doc FROM posts p'
+        where, args = [], []
+        if category:
+            sql += ' JOIN post_categories c ON c.post_id = p.id'
+            where.append('c.category = ?')
+            args.append(category)
+        if status:
+            where.append('p.status = ?')
+            args.append(status)
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY p.date DESC LIMIT ? OFFSET ?'
+        return [json.loads(doc) for doc, in self.db.execute(sql, args + [limit, offset])]
+
+    def save_post(self, post):
+        # Upsert by id, or by slug for clients that resend a post without its id.
+        with self.transaction() as db:
+            if post.get('id') is None and post.get('slug'):
+                row = db.execute('SELECT id FROM posts WHERE slug = ?', (post['slug'],)).fetchone()
+                if row:
+                    post = dict(post, id=row[0])
+            if post.get('id') is None:
+                raise ValueError('post needs an id or an existing slug')
+            current = self.get('posts', post['id']) or {}
+            merged = dict(current, **post)
+            self._put(db, 'posts', merged)
+        return merged
+
+    def delete(self, collection, id):
+        with self.transaction() as db:
+            return db.execute(f'DELETE FROM {collection} WHERE id = ?', (id,)).rowcount
+
+    def counts(self):
+        return {c: self.db.execute(f'SELECT COUNT(*) FROM {c}').fetchone()[0] for c in COLLECTIONS}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate data/*.json into SQLite, query it, and export it back.")
+    parser.add_argument('--db', default=DB_PATH)
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('migrate', help="Load the JSON files into the database (replaces its contents)")
+    sub.add_parser('export', help="Regenerate the JSON files from the database")
+    g = sub.add_parser('get', help="Print one post by slug (or --id)")
+    g.add_argument('slug', nargs='?')
+    g.add_argument('--id')
+    ls = sub.add_parser('list', help="List posts, newest first")
+    ls.add_argument('--status')
+    ls.add_argument('--category')
+    ls.add_argument('-n', '--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with ContentStore(args.db) as store:
+        if args.command == 'migrate':
+            try:
+                counts = store.migrate(args.data_dir)
+            except ValueError as e:
+                parser.error(str(e))
+            for collection, n in counts.items():
+                print(f"{collection}: {n} records")
+        elif args.command == 'export':
+            written = store.export(args.data_dir)
+            print(f"Wrote {', '.join(written)}" if written else "All JSON files up to date")
+        elif args.command == 'get':
+            post = store.get_post(args.slug, args.id)
+            print(json.dumps(post, indent=2, ensure_ascii=False)[:2000] if post else "Not found")
+        elif args.command == 'list':
+            for post in store.list_posts(args.status, args.category, args.limit):
+                print(f"{post.get('date', '')[:10]}  {post.get('status', ''):<9} {post.get('slug')}  {post.get('title')}")
+    print(f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+import os
+import io
+import sys
+import re
+import base64
+import hashlib
+import argparse
+import tempfile
+
+from sync_manifest import atomic_write
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Moves inline data:image/...;base64 payloads out of post HTML into a
+# content-addressed store under public/uploads/inline/.
+#
+# The JSON file is streamed in chunks through a small scanner: text outside a
+# data URI is copied straight through, base64 payloads are decoded incrementally
+# into a temp file while being hashed, so memory stays bounded even for multi-MB
+# images. Each image is saved once as <sha256 of the original bytes>.webp and the
+# data URI is replaced with its public URL.
+
+CONTENT_PATH = os.path.join(repo_root, 'data', 'content.json')
+STORE_DIR = os.path.join(repo_root, 'public', 'uploads', 'inline')
+URL_PREFIX = '/uploads/inline/'
+
+PREFIX = 'data:image/'
+MARKER = ';base64,'
+CHUNK_SIZE = 64 * 1024
+BASE64_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=')
+SUBTYPE_RE = re.compile(r'[a-z0-9.+-]+')
+EXTENSIONS = {'jpeg': '.jpg', 'svg+xml': '.svg'}
+
+
+class InlineImageExtractor:
+    def __init__(self, store_dir=STORE_DIR, url_prefix=URL_PREFIX, dry_run=False):
+        self.store_dir = store_dir
+        self.url_prefix = url_prefix
+        self.dry_run = dry_run
+        self.stats = {'found': 0, 'stored': 0, 'deduplicated': 0, 'payload_bytes': 0}
+
+    def _store(self, tmp_path, digest, subtype):
+        # Content-addressed: the same picture pasted into several posts is kept once.
+        for ext in ('.webp', EXTENSIONS.get(subtype, '.' + subtype)):
+            if os.path.exists(os.path.join(self.store_dir, digest + ext)):
+                self.stats['deduplicated'] += 1
+                return digest + ext
+
+        name = digest + '.webp'
+        if self.dry_run:
+            self.stats['stored'] += 1
+            return name
+
+        os.makedirs(self.store_dir, exist_ok=True)
+        try:
+            from PIL import Image
+
+            with Image.open(tmp_path) as img:
+                img = img.convert('RGBA' if img.mode in ('RGBA', 'LA', 'P') else 'RGB')
+                buf = io.BytesIO()
+                img.save(buf, 'WEBP', quality=85, method=6)
+            data = buf.getvalue()
+        except Exception:
+            # Not something Pillow can read (e.g. SVG): keep the original bytes.
+            name = digest + EXTENSIONS.get(subtype, '.' + subtype)
+            with open(tmp_path, 'rb') as f:
+                data = f.read()
+
+        atomic_write(os.path.join(self.store_dir, name), data)
+        self.stats['stored'] += 1
+        return name
+
+    def process(self, src, dst):
+        # Copy text from src to dst, replacing each inline image with its URL.
+        reader = _Reader(src)
+        while True:
+            idx = reader.buf.find(PREFIX)
+            if idx == -1:
+                if reader.eof:
+                    dst.write(reader.buf)
+                    return self.stats
+                # Keep a tail in case the prefix straddles two chunks.
+                keep = len(PREFIX) - 1
+                if len(reader.buf) > keep:
+                    dst.write(reader.buf[:-keep])
+                    reader.buf = reader.buf[-keep:]
+                reader.fill()
+                continue
+
+            dst.write(reader.buf[:idx])
+            reader.buf = reader.buf[idx:]
+            while len(reader.buf) < 64 and not reader.eof:
+                reader.fill()
+            marker_at = reader.buf.find(MARKER, 0, 64)
+            if marker_at == -1:
+                # A data:image/ URI that is not base64 (or plain text mentioning it).
+                dst.write(reader.buf[:len(PREFIX)])
+                reader.buf = reader.buf[len(PREFIX):]
+                continue
+
+            # data:image/svg+xml;charset=utf-8;base64,... -> svg+xml. Anything
+            # that isn't a plain subtype would end up in the file name: leave it.
+            subtype = reader.buf[len(PREFIX):marker_at].split(';', 1)[0].lower()
+            if not SUBTYPE_RE.fullmatch(subtype):
+                dst.write(reader.buf[:len(PREFIX)])
+                reader.buf = reader.buf[len(PREFIX):]
+                continue
+            reader.buf = reader.buf[marker_at + len(MARKER):]
+            dst.write(self._consume_payload(reader, subtype))
+
+    def _consume_payload(self, reader, subtype):
+        hasher = hashlib.sha256()
+        pending = ''
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(prefix='.inline-')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                while True:
+                    buf = reader.buf
+                    i = 0
+                    n = len(buf)
+                    while i < n:
+                        c = buf[i]
+                        if c in BASE64_CHARS:
+                            i += 1
+                        elif c == '\\' and buf.startswith('\\/', i):
+                            # JSON may escape "/" as "\/".
+                            i += 2
+                        else:
+                            break
+                    pending += buf[:i].replace('\\/', '/')
+                    reader.buf = buf[i:]
+
+                    usable = len(pending) - len(pending) % 4
+                    if usable:
+                        data = base64.b64decode(pending[:usable])
+                        hasher.update(data)
+                        out.write(data)
+                        size += len(data)
+                        pending = pending[usable:]
+
+                    # Stop at the first non-base64 character, unless it is a lone
+                    # backslash cut off at the end of the chunk.
+                    if (reader.buf and reader.buf != '\\') or reader.eof:
+                        break
+                    reader.fill()
+
+                if pending:
+                    data = base64.b64decode(pending + '=' * (-len(pending) % 4))
+                    hasher.update(data)
+                    out.write(data)
+                    size += len(data)
+
+            self.stats['found'] += 1
+            self.stats['payload_bytes'] += size
+            return self.url_prefix + self._store(tmp_path, hasher.hexdigest(), subtype)
+        finally:
+            os.remove(tmp_path)
+
+
+class _Reader:
+    def __init__(self, src):
+        self.src = src
+        self.buf = ''
+        self.eof = False
+
+    def fill(self):
+        chunk = self.src.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+        self.buf += chunk
+
+
+def externalize_html(html, store_dir=STORE_DIR, url_prefix=URL_PREFIX):
+    # Runtime entry point: clean a single post body before it is saved.
+    out = io.StringIO()
+    InlineImageExtractor(store_dir, url_prefix).process(io.StringIO(html), out)
+    return out.getvalue()
+
+
+def migrate(path=CONTENT_PATH, dry_run=False):
+    before = os.path.getsize(path)
+    extractor = InlineImageExtractor(dry_run=dry_run)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', dir=directory)
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as src, \
+                os.fdopen(fd, 'w', encoding='utf-8', newline='') as dst:
+            stats = extractor.process(src, dst)
+        after = os.path.getsize(tmp_path)
+        if stats['found'] and not dry_run:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+            os.replace(tmp_path, path)
+        else:
+            os.remove(tmp_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    print(f"{stats['found']} inline images ({stats['payload_bytes'] // 1024} KB decoded), "
+          f"{stats['stored']} stored, {stats['deduplicated']} deduplicated")
+    print(f"{os.path.relpath(path, repo_root)}: {before // 1024} KB -> {after // 1024} KB"
+          + (" (dry run)" if dry_run else ""))
+    return stats
+
+
+def verify(path=CONTENT_PATH):
+    # Streams the file looking for any remaining data: URI image.
+    offset = 0
+    tail = ''
+    remaining = []
+    with open(path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            text = tail + chunk
+            start = 0
+            while True:
+                idx = text.find(PREFIX, start)
+                if idx == -1:
+                    break
+                remaining.append(offset - len(tail) + idx)
+                start = idx + 1
+            tail = text[-(len(PREFIX) - 1):]
+            offset += len(chunk)
+
+    name = os.path.relpath(path, repo_root)
+    if remaining:
+        print(f"{name}: {len(remaining)} inline images remain (at character offsets {remaining[:10]})")
+        return False
+    print(f"{name}: no inline images")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract inline base64 images from content.json into public/uploads/inline.")
+    parser.add_argument('mode', nargs='?', choices=['migrate', 'verify'], default='migrate')
+    parser.add_argument('--file', default=CONTENT_PATH, help="JSON file to process (default: data/content.json)")
+    parser.add_argument('-n', '--dry-run', action='store_true', help="Report without writing anything")
+    args = parser.parse_args()
+
+    if args.mode == 'verify':
+        sys.exit(0 if verify(args.file) else 1)
+    migrate(args.file, args.dry_run)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,355 @@
+import os
+import io
+import json
+import time
+import argparse
+import threading
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ProcessPoolExecutor
+
+from sync_manifest import atomic_write
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Near-duplicate detection for the gallery images.
+#
+# Every image gets two 64-bit perceptual hashes, both insensitive to size and
+# re-encoding: a dHash (sign of horizontal gradients on a 9x8 greyscale
+# thumbnail) and a pHash (sign of the low 8x8 DCT coefficients of a 32x32
+# thumbnail against their median). Workers only decode and shrink; the hashes
+# of a whole batch are computed at once in NumPy.
+#
+# The dHashes go into a BK-tree, so a lookup only visits the branches whose
+# edge distance can still be within the Hamming radius; the pHash then
+# confirms the match. Hashes are cached in .cache/image_hashes.json by path,
+# size and mtime, so a rescan only decodes new or changed files.
+#
+# Gallery uploads go to Cloudinary, not public/, so the upload route also
+# registers every accepted one with POST /add; those entries are keyed by their
+# URL and kept across rescans.
+#
+#   scan      hash everything, print the duplicate clusters
+#   check     look up one or more files against the index
+#   serve     POST /check with the raw image bytes -> {"duplicate", "matches", "ms"}
+#             POST /add?key=<url> with the raw image bytes -> {"added": url}
+#             (the upload route calls both when IMAGE_DEDUP_URL is set)
+
+ROOTS = ['public/images/galeri', 'public/uploads/gallery']
+GALLERY_PATH = os.path.join(repo_root, 'data', 'gallery.json')
+CACHE_PATH = os.path.join(repo_root, '.cache', 'image_hashes.json')
+EXTENSIONS = ('.webp', '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.avif')
+CACHE_VERSION = 1
+DHASH_DISTANCE = 10  # of 64 bits
+PHASH_DISTANCE = 12
+
+
+def image_paths(roots=ROOTS, gallery_path=GALLERY_PATH):
+    paths = []
+    for root in roots:
+        for dirpath, _, filenames in os.walk(os.path.join(repo_root, root)):
+            paths.extend(os.path.join(dirpath, n) for n in sorted(filenames) if n.lower().endswith(EXTENSIONS))
+    # Gallery entries that point into public/ but live outside the roots.
+    if os.path.exists(gallery_path):
+        with open(gallery_path, 'r', encoding='utf-8') as f:
+            for item in json.load(f):
+                url = item.get('imageUrl') or ''
+                path = os.path.normpath(os.path.join(repo_root, 'public', url.lstrip('/')))
+                if url.startswith('/') and not url.startswith('//') and os.path.isfile(path) and path not in paths:
+                    paths.append(path)
+    return paths
+
+
+def thumbnails(source):
+    # Worker: source is a path or raw bytes. Returns the 32x32 and 9x8 greyscale
+    # thumbnails as bytes (PIL images don't cross process boundaries cheaply).
+    from PIL import Image
+
+    with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as img:
+        img.draft('L', (64, 64))  # JPEG: decode at reduced scale
+        factor = min(img.size) // 64
+        grey = (img.reduce(factor) if factor > 1 else img).convert('L')
+    return (grey.resize((32, 32), Image.Resampling.LANCZOS).tobytes(),
+            grey.resize((9, 8), Image.Resampling.LANCZOS).tobytes())
+
+
+_DCT = None
+
+
+def _dct_matrix(n=32):
+    import numpy as np
+
+    global _DCT
+    if _DCT is None:
+        k = np.arange(n)[:, None]
+        m = np.cos(np.pi * (2 * np.arange(n)[None, :] + 1) * k / (2 * n)) * np.sqrt(2 / n)
+        m[0] /= np.sqrt(2)
+        _DCT = m
+    return _DCT
+
+
+def _pack(bits):
+    # (n, 64) bool -> list of Python ints, first bit most significant.
+    import numpy as np
+
+    return [int(v) for v in np.packbits(bits, axis=1).view('>u8').ravel()]
+
+
+def hash_batch(thumbs):
+    # thumbs: [(32x32 bytes, 9x8 bytes)] -> [(dhash, phash)], all rows at once.
+    import numpy as np
+
+    if not thumbs:
+        return []
+    small = np.frombuffer(b''.join(t[1] for t in thumbs), dtype=np.uint8).reshape(-1, 8, 9).astype(np.int16)
+    dhash = (small[:, :, 1:] > small[:, :, :-1]).reshape(-1, 64)
+
+    big = np.frombuffer(b''.join(t[0] for t in thumbs), dtype=np.uint8).reshape(-1, 32, 32).astype(np.float64)
+    d = _dct_matrix()
+    low = (d @ big @ d.T)[:, :8, :8].reshape(-1, 64)
+    median = np.median(low[:, 1:], axis=1, keepdims=True)  # the DC term would skew it
+    phash = low > median
+    return list(zip(_pack(dhash), _pack(phash)))
+
+
+def hamming(a, b):
+    return (a ^ b).bit_count()
+
+
+class BKTree:
+    # Node: [hash, [items], {distance: child}]
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def add(self, value, item):
+        self.size += 1
+        if self.root is None:
+            self.root = [value, [item], {}]
+            return
+        node = self.root
+        while True:
+            d = hamming(value, node[0])
+            if d == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [value, [item], {}]
+                return
+            node = child
+
+    def search(self, value, radius):
+        # Yields (distance, item); by the triangle inequality only children whose
+        # edge lies within radius of d can hold a match.
+        if self.root is None:
+            return
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            d = hamming(value, node[0])
+            if d <= radius:
+                for item in node[1]:
+                    yield d, item
+            for edge, child in node[2].items():
+                if d - radius <= edge <= d + radius:
+                    stack.append(child)
+
+
+class HashIndex:
+    def __init__(self, cache_path=CACHE_PATH, dhash_distance=DHASH_DISTANCE, phash_distance=PHASH_DISTANCE):
+        self.cache_path = cache_path
+        self.dhash_distance = dhash_distance
+        self.phash_distance = phash_distance
+        self.entries = {}
+        self.tree = BKTree()
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == CACHE_VERSION:
+                    self.entries = data['entries']
+            except (OSError, ValueError, KeyError):
+                self.entries = {}
+
+    def refresh(self, paths, workers=None):
+        # Hash new or changed files, drop vanished ones, rebuild the tree.
+        # Uploads registered with add() are kept. Returns the number of files
+        # decoded.
+        keep = {rel: entry for rel, entry in self.entries.items() if entry.get('remote')}
+        stale = []
+        for path in paths:
+            rel = os.path.relpath(path, repo_root)
+            st = os.stat(path)
+            entry = self.entries.get(rel)
+            if entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+                keep[rel] = entry
+            else:
+                stale.append((rel, path, st))
+
+        if stale:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                thumbs = list(pool.map(thumbnails, [path for rel, path, st in stale], chunksize=8))
+            for (rel, path, st), (dhash, phash) in zip(stale, hash_batch(thumbs)):
+                keep[rel] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+                             'dhash': f'{dhash:016x}', 'phash': f'{phash:016x}'}
+
+        self.entries = keep
+        self.tree = BKTree()
+        for rel, entry in keep.items():
+            self.tree.add(int(entry['dhash'], 16), rel)
+        return len(stale)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        data = {'version': CACHE_VERSION, 'entries': self.entries}
+        atomic_write(self.cache_path, json.dumps(data, indent=1, sort_keys=True).encode('utf-8'))
+
+    def matches(self, dhash, phash, exclude=None):
+        found = []
+        for d, rel in self.tree.search(dhash, self.dhash_distance):
+            if rel == exclude:
+                continue
+            p = hamming(phash, int(self.entries[rel]['phash'], 16))
+            if p <= self.phash_distance:
+                found.append({'path': rel, 'dhash_distance': d, 'phash_distance': p})
+        return sorted(found, key=lambda m: (m['dhash_distance'] + m['phash_distance'], m['path']))
+
+    def check(self, data):
+        # Raw image bytes -> matches, decoded in-process (one image is quicker
+        # than a round trip to a worker).
+        dhash, phash = hash_batch([thumbnails(data)])[0]
+        return self.matches(dhash, phash)
+
+    def add(self, key, data):
+        # Registers an uploaded image (raw bytes) under key, e.g. its URL.
+        dhash, phash = hash_batch([thumbnails(data)])[0]
+        if key not in self.entries:
+            self.tree.add(dhash, key)
+        elif int(self.entries[key]['dhash'], 16) != dhash:
+            self.tree = BKTree()  # re-uploaded under the same key with new content
+            for rel, entry in self.entries.items():
+                if rel != key:
+                    self.tree.add(int(entry['dhash'], 16), rel)
+            self.tree.add(dhash, key)
+        self.entries[key] = {'size': len(data), 'remote': True, 'dhash': f'{dhash:016x}', 'phash': f'{phash:016x}'}
+
+    def clusters(self):
+        # Connected components of the near-duplicate graph, largest first.
+        parent = {rel: rel for rel in self.entries}
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for rel, entry in self.entries.items():
+            for m in self.matches(int(entry['dhash'], 16), int(entry['phash'], 16), exclude=rel):
+                parent[find(m['path'])] = find(rel)
+        groups = {}
+        for rel in self.entries:
+            groups.setdefault(find(rel), []).append(rel)
+        return sorted((sorted(g) for g in groups.values() if len(g) > 1), key=lambda g: (-len(g), g))
+
+
+class CheckHandler(BaseHTTPRequestHandler):
+    index = None
+    max_bytes = 20 * 1024 * 1024
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path not in ('/check', '/add'):
+            return self._send(404, {'error': 'not found'})
+        query = parse_qs(url.query)
+        if url.path == '/add' and not query.get('key', [''])[0]:
+            return self._send(400, {'error': 'expected ?key=<url of the upload>'})
+        length = int(self.headers.get('Content-Length') or 0)
+        if not 0 < length <= self.max_bytes:
+            return self._send(413 if length else 400, {'error': 'expected the image bytes as the request body'})
+        data = self.rfile.read(length)
+        start = time.perf_counter()
+        try:
+            with self.lock:
+                if url.path == '/add':
+                    self.index.add(query['key'][0], data)
+                    self.index.save()
+                    return self._send(200, {'added': query['key'][0],
+                                            'ms': round((time.perf_counter() - start) * 1000, 2)})
+                matches = self.index.check(data)
+        except (OSError, ValueError) as e:  # PIL raises UnidentifiedImageError (an OSError)
+            return self._send(415, {'error': repr(e)})
+        limit = int(query.get('limit', ['5'])[0])
+        self._send(200, {'duplicate': bool(matches), 'matches': matches[:limit],
+                         'ms': round((time.perf_counter() - start) * 1000, 2)})
+
+
+def start_check_server(index, host='127.0.0.1', port=0):
+    # Runs in a daemon thread; returns (server, base_url).
+    handler = type('Handler', (CheckHandler,), {'index': index})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://{host}:{server.server_address[1]}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find near-duplicate gallery images by perceptual hash.")
+    parser.add_argument('--dhash-distance', type=int, default=DHASH_DISTANCE)
+    parser.add_argument('--phash-distance', type=int, default=PHASH_DISTANCE)
+    parser.add_argument('-j', '--workers', type=int, default=None)
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('scan', help="Hash all images and report duplicate clusters")
+    c = sub.add_parser('check', help="Look up files against the index")
+    c.add_argument('files', nargs='+')
+    s = sub.add_parser('serve', help="Serve POST /check for the upload route")
+    s.add_argument('--host', default='127.0.0.1')
+    s.add_argument('--port', type=int, default=8767)
+    args = parser.parse_args()
+
+    index = HashIndex(dhash_distance=args.dhash_distance, phash_distance=args.phash_distance)
+    start = time.perf_counter()
+    paths = image_paths()
+    decoded = index.refresh(paths, args.workers)
+    index.save()
+    print(f"{len(paths)} images indexed ({decoded} hashed) in {time.perf_counter() - start:.2f}s")
+
+    if args.command == 'scan':
+        clusters = index.clusters()
+        for group in clusters:
+            print(f"  {len(group)} near-duplicates:")
+            for rel in group:
+                print(f"    {rel} ({index.entries[rel]['size']} bytes)")
+        wasted = sum(index.entries[rel]['size'] for group in clusters for rel in group[1:])
+        print(f"{len(clusters)} clusters, {wasted / 1024:.1f} KB in redundant copies")
+    elif args.command == 'check':
+        for path in args.files:
+            with open(path, 'rb') as f:
+                data = f.read()
+            t = time.perf_counter()
+            matches = index.check(data)
+            ms = (time.perf_counter() - t) * 1000
+            best = f"{matches[0]['path']} (d={matches[0]['dhash_distance']}, p={matches[0]['phash_distance']})" if matches else '-'
+            print(f"  {path}: {'DUPLICATE of ' + best if matches else 'unique'} [{ms:.1f} ms]")
+    else:
+        server, url = start_check_server(index, args.host, args.port)
+        print(f"Duplicate check listening on {url}/check (IMAGE_DEDUP_URL={url})")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+import os
+import re
+import json
+import time
+import hashlib
+import argparse
+
+from section_injector import ORDER_NAME
+from sync_manifest import atomic_write, write_if_changed
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Renders the "6. Ensiklopedia 54 Kelurahan" block from structured records.
+#
+# kelurahan_data.json holds the heading, the intro and one record per kecamatan
+# with its kelurahan. The block is rendered as a flat run of sections, one file
+# each in kelurahan_fragments/, named by slug:
+#
+#   header                     comment, outer <div>, heading and intro
+#   kec-pasar-kliwon           kecamatan header and the opening of its grid
+#   kel-mojo, kel-semanggi...  one card per kelurahan
+#   kec-pasar-kliwon-end       closing tags of the kecamatan
+#   ...
+#   footer                     closing tag of the outer <div>
+#
+# Page order is written to the directory's .order file, so adding a kelurahan
+# adds one fragment without renaming the ones after it (the cards after it in
+# the same kecamatan are still re-rendered: their numbers change), and
+# section_injector (via fix_file_3.py) can splice each one individually.
+# A fragment is only re-rendered when the hash of its record (plus
+# TEMPLATE_VERSION) differs from .hashes.json, and fragments whose record is
+# gone are removed. The combined block is also written to kelurahan_details.txt
+# for the single-section mode of fix_file_3.py.
+#
+# `extract` rebuilds kelurahan_data.json from an existing hand-written block.
+
+DATA_PATH = os.path.join(repo_root, 'kelurahan_data.json')
+FRAGMENT_DIR = os.path.join(repo_root, 'kelurahan_fragments')
+COMBINED_PATH = os.path.join(repo_root, 'kelurahan_details.txt')
+HASHES_NAME = '.hashes.json'
+TEMPLATE_VERSION = 1
+INDENT = ' ' * 16  # the block sits inside the article's template literal
+
+HEADER = '''<!-- 6. DAFTAR KELURAHAN (DETAILED) -->
+<div>
+    <h3 class="text-3xl font-bold text-gray-900 dark:text-white mb-6 mt-10 border-b-2 border-gray-200 pb-2">{heading}</h3>
+    <p class="mb-6">{intro}</p>
+'''
+
+KECAMATAN_OPEN = '''
+    <!-- {comment} -->
+    <div class="mb-8">
+        <div class="bg-{color}-100 dark:bg-{color}-900/30 p-4 rounded-t-xl border-b-4 border-{color}-500">
+            <h4 class="text-2xl font-bold text-{color}-800 dark:text-{color}-200">{emoji} {numeral}. Kecamatan {name} ({count} Kelurahan)</h4>
+            <p class="text-sm text-{color}-700 dark:text-{color}-300 mt-1">Kode Pos: {postal} | {tagline}</p>
+        </div>
+        <div class="grid {columns} gap-4 bg-white dark:bg-gray-800 p-4 rounded-b-xl shadow-sm border border-gray-100 dark:border-gray-700">
+'''
+
+CARD = '''            <div class="p-4 border rounded-lg hover:shadow-md transition-shadow">
+                <strong class="text-lg text-primary block mb-1">{number}. Kelurahan {name}</strong>
+                <p class="text-sm text-gray-600 dark:text-gray-300">{description}</p>
+            </div>
+'''
+
+KECAMATAN_CLOSE = '''        </div>
+    </div>
+'''
+
+FOOTER = '''</div>
+'''
+
+_KECAMATAN_RE = re.compile(
+    r'<!--\s*(?P<comment>[^>]*?)\s*-->\s*<div class="mb-8">\s*'
+    r'<div class="bg-(?P<color>\w+)-100[^"]*">\s*'
+    r'<h4[^>]*>(?P<emoji>\S+)\s+(?P<numeral>[IVX]+)\.\s+Kecamatan\s+(?P<name>.+?)\s+\(\d+ Kelurahan\)</h4>\s*'
+    r'<p[^>]*>Kode Pos:\s*(?P<postal>\S+)\s*\|\s*(?P<tagline>.+?)</p>\s*</div>\s*'
+    r'<div class="grid (?P<columns>[^"]*?) gap-4', re.S)
+_CARD_RE = re.compile(
+    r'<strong[^>]*>\d+\.\s+Kelurahan\s+(?P<name>.+?)</strong>\s*<p[^>]*>(?P<description>.*?)</p>', re.S)
+_HEADING_RE = re.compile(r'<h3[^>]*>(?P<heading>.*?)</h3>\s*<p[^>]*>(?P<intro>.*?)</p>', re.S)
+
+
+def slugify(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def _safe(text):
+    # The fragments end up inside a JS template literal.
+    return text.replace('`', '&#96;').replace('${', '&#36;{')
+
+
+def _indent(block):
+    return ''.join(INDENT + line if line.strip() else '\n' for line in block.splitlines(keepends=True))
+
+
+def extract(text):
+    header = _HEADING_RE.search(text)
+    data = {'heading': header['heading'].strip(), 'intro': header['intro'].strip(), 'kecamatan': []}
+    matches = list(_KECAMATAN_RE.finditer(text))
+    for n, m in enumerate(matches):
+        body = text[m.end():matches[n + 1].start() if n + 1 < len(matches) else len(text)]
+        data['kecamatan'].append({
+            'name': m['name'].strip(), 'comment': m['comment'], 'emoji': m['emoji'], 'numeral': m['numeral'],
+            'color': m['color'], 'postal': m['postal'], 'tagline': m['tagline'].strip(), 'columns': m['columns'],
+            'kelurahan': [{'name': c['name'].strip(), 'description': ' '.join(c['description'].split())}
+                          for c in _CARD_RE.finditer(body)],
+        })
+    return data
+
+
+def plan(data):
+    # Returns [(section name, renderer, record)] in page order; the record is
+    # what the fragment hash covers.
+    sections = [('header', lambda r: HEADER.format(heading=_safe(r['heading']), intro=_safe(r['intro'])),
+                 {'heading': data['heading'], 'intro': data['intro']})]
+    for kec in data['kecamatan']:
+        slug = slugify(kec['name'])
+        head = {k: v for k, v in kec.items() if k != 'kelurahan'} | {'count': len(kec['kelurahan'])}
+        sections.append((f'kec-{slug}', lambda r: KECAMATAN_OPEN.format(
+            **{k: _safe(str(v)) for k, v in r.items()}), head))
+        for j, kel in enumerate(kec['kelurahan'], 1):
+            record = {'number': j, 'name': kel['name'], 'description': kel['description']}
+            sections.append((f'kel-{slugify(kel["name"])}', lambda r: CARD.format(
+                **{k: _safe(str(v)) for k, v in r.items()}), record))
+        sections.append((f'kec-{slug}-end', lambda r: KECAMATAN_CLOSE, {}))
+    sections.append(('footer', lambda r: FOOTER, {}))
+    return sections
+
+
+def record_hash(record):
+    raw = json.dumps([TEMPLATE_VERSION, INDENT, record], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def build(data, fragment_dir=FRAGMENT_DIR, combined_path=COMBINED_PATH, force=False):
+    os.makedirs(fragment_dir, exist_ok=True)
+    hashes_path = os.path.join(fragment_dir, HASHES_NAME)
+    old_hashes = {}
+    if os.path.exists(hashes_path) and not force:
+        with open(hashes_path, 'r', encoding='utf-8') as f:
+            old_hashes = json.load(f)
+
+    hashes = {}
+    rendered = []
+    combined = []
+    for name, render, record in plan(data):
+        path = os.path.join(fragment_dir, name + '.html')
+        digest = record_hash(record)
+        hashes[name] = digest
+        if digest == old_hashes.get(name) and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                combined.append(f.read())
+            continue
+        text = _indent(render(record))
+        # Fragment files hold the section body only: the injector adds the markers.
+        if write_if_changed(path, text.rstrip('\n').encode('utf-8')):
+            rendered.append(name)
+        combined.append(text.rstrip('\n'))
+
+    removed = []
+    for entry in os.listdir(fragment_dir):
+        if entry.endswith('.html') and entry[:-5] not in hashes:
+            os.remove(os.path.join(fragment_dir, entry))
+            removed.append(entry[:-5])
+
+    atomic_write(hashes_path, json.dumps(hashes, indent=2).encode('utf-8'))
+    write_if_changed(os.path.join(fragment_dir, ORDER_NAME), ''.join(name + '\n' for name in hashes).encode('utf-8'))
+    combined_changed = False
+    if combined_path:
+        combined_changed = write_if_changed(combined_path, ('\n'.join(combined) + '\n').encode('utf-8'))
+    return {'sections': len(hashes), 'rendered': rendered, 'removed': removed, 'combined_changed': combined_changed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the kelurahan encyclopedia block from kelurahan_data.json.")
+    parser.add_argument('--data', default=DATA_PATH)
+    sub = parser.add_subparsers(dest='command', required=True)
+    b = sub.add_parser('build', help="Render changed fragments and the combined block")
+    b.add_argument('--out', default=FRAGMENT_DIR)
+    b.add_argument('--combined', default=COMBINED_PATH, help="Combined block path ('' to skip)")
+    b.add_argument('-f', '--force', action='store_true', help="Ignore stored hashes and re-render everything")
+    e = sub.add_parser('extract', help="Rebuild the data file from a hand-written block")
+    e.add_argument('source', nargs='?', default=COMBINED_PATH)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == 'extract':
+        with open(args.source, 'r', encoding='utf-8') as f:
+            data = extract(f.read())
+        write_if_changed(args.data, json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
+        count = sum(len(k['kelurahan']) for k in data['kecamatan'])
+        print(f"{len(data['kecamatan'])} kecamatan, {count} kelurahan -> {os.path.relpath(args.data, repo_root)}")
+    else:
+        with open(args.data, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        result = build(data, args.out, args.combined or None, args.force)
+        print(f"{result['sections']} sections, {len(result['rendered'])} rendered, {len(result['removed'])} removed"
+              f"{', combined block updated' if result['combined_changed'] else ''}")
+    print(f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+
+if __name__ == '__main__':
+    main()
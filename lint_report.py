@@ -0,0 +1,318 @@
+import io
+import os
+import re
+import json
+import time
+import codecs
+import hashlib
+import argparse
+from datetime import datetime, timezone
+
+from sync_manifest import atomic_write
+
+try:
+    import ijson
+except ImportError:  # optional: fall back to decoding one file entry at a time
+    ijson = None
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Triage for the ESLint dump (lint.json) and the `next build` log
+# (build-log.txt), both saved from PowerShell as UTF-16.
+#
+# Reports are decoded as they are read (the encoding is sniffed from the BOM),
+# never loaded whole. lint.json goes through ijson's event stream when ijson is
+# installed, so the per-file "source" text is skipped instead of built;
+# without ijson one file entry at a time is decoded. The build log is parsed a
+# paragraph at a time: PowerShell hard-wraps every line at the console width,
+# so each paragraph is re-joined, ANSI colours are dropped and cp437 mojibake
+# ("ΓÜá" for "⚠") is repaired before type errors and warnings are matched.
+#
+# Every finding is keyed by (rule, message), not by line, so unrelated edits
+# above it don't make it look new. Each file's findings are stored with a digest
+# in .cache/lint/<report>.json; the next run only compares the files whose
+# digest changed, and prints just the new and fixed findings.
+
+SNAPSHOT_DIR = os.path.join(repo_root, '.cache', 'lint')
+DEFAULT_REPORTS = [os.path.join(repo_root, 'lint.json'), os.path.join(repo_root, 'build-log.txt')]
+SNAPSHOT_VERSION = 1
+SEVERITY = {1: 'warning', 2: 'error'}
+CHUNK_SIZE = 64 * 1024
+
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+_PS_WRAPPER_RE = re.compile(r'^\S+\.exe : |At line:\d+ char:\d+.*?NativeCommandError')
+_TYPE_ERROR_RE = re.compile(r'(?P<file>\S+?):(?P<line>\d+):\s*(?P<col>\d+)\s*(?P<kind>Type error|Error):\s*'
+                            r'(?P<message>.+?[.!?])(?=\s|$)')
+_WARNING_RE = re.compile(r'⚠\s*(?P<message>.+?[.!?])(?=\s|$)')
+_EXIT_RE = re.compile(r'build worker exited with code: (?P<code>\d+)')
+_APP_MARKERS = ('/src/', '/scripts/', '/public/')
+
+
+def sniff_encoding(head):
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    if len(head) >= 2 and head[1] == 0:
+        return 'utf-16-le'
+    if len(head) >= 2 and head[0] == 0:
+        return 'utf-16-be'
+    return 'utf-8'
+
+
+def open_report(path):
+    # Returns (text stream decoded incrementally, True if it holds a JSON array).
+    raw = open(path, 'rb')
+    head = raw.peek(64)[:64]
+    encoding = sniff_encoding(head)
+    is_json = head.decode(encoding, errors='ignore').lstrip('\ufeff \t\r\n').startswith('[')
+    return io.TextIOWrapper(raw, encoding=encoding, newline=''), is_json
+
+
+class _Utf8Reader:
+    # ijson wants bytes: re-encode the decoded text a chunk at a time.
+    def __init__(self, text):
+        self.text = text
+
+    def read(self, size=-1):
+        return self.text.read(CHUNK_SIZE if size is None or size < 0 else size).encode('utf-8')
+
+
+def relative_path(path):
+    # ESLint reports absolute Windows paths from whichever machine ran it.
+    path = path.replace('\\', '/')
+    root = repo_root.replace('\\', '/').rstrip('/') + '/'
+    if path.startswith(root):
+        return path[len(root):]
+    for marker in _APP_MARKERS:
+        idx = path.find(marker)
+        if idx != -1:
+            return path[idx + 1:]
+    return path.lstrip('./')
+
+
+def _finding(rule, severity, line, column, message):
+    return [rule or '(parse)', severity, line, column, ' '.join(str(message).split())]
+
+
+def iter_eslint(stream):
+    # Yields (file, [finding]) per linted file; suppressed messages are ignored.
+    if ijson is not None:
+        path, findings, message = None, [], None
+        for prefix, event, value in ijson.parse(_Utf8Reader(stream)):
+            if prefix == 'item.filePath':
+                path = value
+            elif prefix == 'item.messages.item' and event == 'start_map':
+                message = {}
+            elif prefix == 'item.messages.item' and event == 'end_map':
+                findings.append(_finding(message.get('ruleId'), message.get('severity', 1), message.get('line'),
+                                         message.get('column'), message.get('message', '')))
+                message = None
+            elif message is not None and prefix.startswith('item.messages.item.') and prefix.count('.') == 3:
+                message[prefix.rsplit('.', 1)[1]] = int(value) if event == 'number' else value
+            elif prefix == 'item' and event == 'end_map':
+                yield relative_path(path or '?'), findings
+                path, findings = None, []
+        return
+
+    decoder = json.JSONDecoder()
+    buf = stream.read(CHUNK_SIZE).lstrip()
+    if not buf.startswith('['):
+        raise ValueError('not an ESLint JSON report')
+    buf = buf[1:]
+    eof = False
+    while True:
+        buf = buf.lstrip().lstrip(',').lstrip()
+        if buf.startswith(']'):
+            return
+        try:
+            entry, end = decoder.raw_decode(buf)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            more = stream.read(max(CHUNK_SIZE, len(buf)))
+            eof = not more
+            buf += more
+            continue
+        buf = buf[end:]
+        yield relative_path(entry.get('filePath', '?')), [
+            _finding(m.get('ruleId'), m.get('severity', 1), m.get('line'), m.get('column'), m.get('message', ''))
+            for m in entry.get('messages', [])]
+        if len(buf) < CHUNK_SIZE and not eof:
+            more = stream.read(CHUNK_SIZE)
+            eof = not more
+            buf += more
+
+
+def _repair(line):
+    # UTF-8 output read back through the cp437 console code page.
+    try:
+        return line.encode('cp437').decode('utf-8')
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return line
+
+
+def _paragraphs(stream):
+    lines = []
+    for line in stream:
+        line = _repair(line.rstrip('\r\n'))
+        if line.strip():
+            lines.append(line)
+        elif lines:
+            yield lines
+            lines = []
+    if lines:
+        yield lines
+
+
+def iter_build_log(stream):
+    # Yields (file, [finding]) for `next build` type errors, warnings and failures.
+    found = {}
+    for lines in _paragraphs(stream):
+        # Wrapped lines end in a space when the break fell between words, and
+        # colour codes can be split across two lines, so join before stripping.
+        text = _PS_WRAPPER_RE.sub(' ', ' '.join(_ANSI_RE.sub('', ''.join(lines)).split()))
+        for m in _TYPE_ERROR_RE.finditer(text):
+            found.setdefault(relative_path(m['file']), []).append(_finding(
+                'build/' + m['kind'].lower().replace(' ', '-'), 2, int(m['line']), int(m['col']), m['message']))
+        for m in _WARNING_RE.finditer(text):
+            found.setdefault('(build)', []).append(_finding('build/warning', 1, None, None, m['message']))
+        if 'Failed to compile.' in text:
+            found.setdefault('(build)', []).append(_finding('build/failed', 2, None, None, 'Failed to compile.'))
+        m = _EXIT_RE.search(text)
+        if m:
+            found.setdefault('(build)', []).append(
+                _finding('build/failed', 2, None, None, f"Build worker exited with code {m['code']}."))
+    yield from found.items()
+
+
+def _key(finding):
+    return finding[0], finding[4]
+
+
+def file_digest(findings):
+    raw = json.dumps(sorted(_key(f) for f in findings), ensure_ascii=False)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def analyze(path):
+    # Returns ({file: {"digest", "findings"}}, aggregates).
+    totals = {'files': 0, 'findings': 0, 'by_severity': {}, 'by_rule': {}, 'by_file': {}}
+    files = {}
+    stream, is_json = open_report(path)
+    with stream:
+        for name, findings in (iter_eslint if is_json else iter_build_log)(stream):
+            totals['files'] += 1
+            if not findings:
+                continue
+            entry = files.setdefault(name, {'findings': []})
+            entry['findings'].extend(findings)
+            for rule, severity, *_ in findings:
+                label = SEVERITY.get(severity, str(severity))
+                totals['by_severity'][label] = totals['by_severity'].get(label, 0) + 1
+                totals['by_rule'][rule] = totals['by_rule'].get(rule, 0) + 1
+                totals['by_file'][name] = totals['by_file'].get(name, 0) + 1
+                totals['findings'] += 1
+    for entry in files.values():
+        entry['digest'] = file_digest(entry['findings'])
+    return files, totals
+
+
+def diff(previous, current):
+    # Only files whose digest moved are compared, finding by finding.
+    new, fixed = [], []
+    compared = 0
+    for name in previous.keys() | current.keys():
+        old = previous.get(name)
+        now = current.get(name)
+        if old and now and old['digest'] == now['digest']:
+            continue
+        compared += 1
+        remaining = {}
+        for f in (old or {}).get('findings', []):
+            remaining.setdefault(_key(f), []).append(f)
+        for f in (now or {}).get('findings', []):
+            bucket = remaining.get(_key(f))
+            if bucket:
+                bucket.pop()
+            else:
+                new.append([name] + f)
+        fixed.extend([name] + f for bucket in remaining.values() for f in bucket)
+    return sorted(new, key=str), sorted(fixed, key=str), compared
+
+
+def snapshot_path(report, directory=SNAPSHOT_DIR):
+    return os.path.join(directory, os.path.basename(report) + '.json')
+
+
+def load_snapshot(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if data.get('version') == SNAPSHOT_VERSION else None
+    except (OSError, ValueError):
+        return None
+
+
+def save_snapshot(path, report, files, totals):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {'version': SNAPSHOT_VERSION, 'report': os.path.basename(report),
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z'),
+            'totals': {k: totals[k] for k in ('files', 'findings', 'by_severity')}, 'files': files}
+    atomic_write(path, json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+def _top(counts, n):
+    return sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[:n]
+
+
+def _describe(finding):
+    name, rule, severity, line, column, message = finding
+    where = f"{name}:{line}:{column}" if line else name
+    return f"{SEVERITY.get(severity, severity):<7} {where}  {message}  [{rule}]"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize ESLint/next build reports and diff them against the last run.")
+    parser.add_argument('reports', nargs='*', default=DEFAULT_REPORTS)
+    parser.add_argument('--snapshots', default=SNAPSHOT_DIR)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--no-save', action='store_true', help="Don't replace the stored snapshot")
+    parser.add_argument('--json', action='store_true', help="Print the result as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for report in args.reports:
+        start = time.perf_counter()
+        files, totals = analyze(report)
+        path = snapshot_path(report, args.snapshots)
+        previous = load_snapshot(path)
+        new, fixed, compared = diff(previous['files'], files) if previous else (None, None, 0)
+        if not args.no_save:
+            save_snapshot(path, report, files, totals)
+        results.append({'report': os.path.relpath(report, repo_root), 'totals': totals, 'new': new, 'fixed': fixed,
+                        'files_compared': compared, 'ms': round((time.perf_counter() - start) * 1000, 1)})
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+
+    for r in results:
+        t = r['totals']
+        severities = ', '.join(f"{n} {label}s" for label, n in sorted(t['by_severity'].items()))
+        print(f"{r['report']}: {t['findings']} findings in {len(t['by_file'])} of {t['files']} files"
+              f"{' (' + severities + ')' if severities else ''} [{r['ms']} ms]")
+        for title, key in (('rules', 'by_rule'), ('files', 'by_file')):
+            if t[key]:
+                print(f"  top {title}: " + ', '.join(f"{name} ({n})" for name, n in _top(t[key], args.top)))
+        if r['new'] is None:
+            print("  no previous snapshot; this run is the baseline")
+            continue
+        print(f"  since last run: {len(r['new'])} new, {len(r['fixed'])} fixed ({r['files_compared']} files compared)")
+        for label, findings in (('+', r['new']), ('-', r['fixed'])):
+            for finding in findings:
+                print(f"    {label} {_describe(finding)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,368 @@
+import os
+import hmac
+import json
+import time
+import uuid
+import base64
+import random
+import asyncio
+import hashlib
+import argparse
+import itertools
+from datetime import datetime, timezone
+
+from articles_index import ARTICLES_DIR
+from sync_manifest import write_if_changed
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Load generator for the site's hot routes, run against a local `next start`.
+#
+# A scenario (loadtest/*.json) is a weighted mix of requests plus the load
+# model:
+#
+#   "concurrency": n            closed model: n virtual users, back to back
+#   "rate": r                   open model: Poisson arrivals at r req/s, at most
+#                               `concurrency` in flight (the rest are counted as
+#                               dropped); latency runs from the scheduled start,
+#                               so a stalled server can't hide its queueing delay
+#   "poll": {"every", "clients"} on a request: that many clients hit it on a
+#                               fixed interval, outside the mix (the way
+#                               AdminSessionContext polls /api/auth/session-status)
+#
+# Paths and bodies can use {slug} (a random internal article slug), {n} (a
+# running number) and {uuid}. Requests marked "auth": "admin" carry an
+# admin_session cookie signed like src/lib/session.ts. Requests in the mix take
+# the `admin_sessions` in turn (pollers keep one each, like a dashboard), so the
+# per-user limit of checkRateLimitAndKillSwitch (20 POSTs a minute) allows
+# 20 x admin_sessions admin POSTs a minute in total; keep the rate under that
+# or the limiter is what gets measured. 429s are counted as errors and also
+# reported on their own. Results (p50/p95/p99, throughput, error rate per
+# request and overall) go to .cache/loadtest/<scenario>-<time>.json.
+#
+# `env` prints what `next start` needs to run on stubs: UPSTASH_REDIS_REST_*
+# for upstash_stub.py and FIRESTORE_EMULATOR_HOST with throwaway Firebase
+# Admin credentials for the Firestore emulator. When FIRESTORE_EMULATOR_HOST is
+# set, `run` first seeds the emulator with the sessions and users it signs.
+
+SCENARIO_DIR = os.path.join(repo_root, 'loadtest')
+RESULTS_DIR = os.path.join(repo_root, '.cache', 'loadtest')
+BASE_URL = os.environ.get('LOADTEST_BASE_URL', 'http://127.0.0.1:3000')
+# Same fallback as src/lib/session.ts, so a local server without SESSION_SECRET accepts the cookies.
+SESSION_SECRET = os.environ.get('SESSION_SECRET', 'karang_taruna_default_secure_key_12345!@#')
+EMULATOR_PROJECT = 'demo-karangtaruna'
+PERCENTILES = (50, 95, 99)
+
+
+def sign_session(payload, secret=SESSION_SECRET):
+    data = base64.b64encode(json.dumps(payload, separators=(',', ':')).encode('utf-8')).decode('ascii')
+    signature = hmac.new(secret.encode('utf-8'), data.encode('ascii'), hashlib.sha256).hexdigest()
+    return f'{data}.{signature}'
+
+
+def admin_sessions(count):
+    return [{'id': f'loadtest-{i}', 'sessionId': f'loadtest-session-{i}', 'username': f'loadtest-{i}@example.com',
+             'role': 'admin', 'permissions': [], 'name': f'Load Test {i}', 'location': None, 'clientDevice': None}
+            for i in range(count)]
+
+
+def internal_slugs(directory=ARTICLES_DIR):
+    with open(os.path.join(directory, 'index.json'), 'r', encoding='utf-8') as f:
+        return [a['slug'] for a in json.load(f)]
+
+
+def load_scenario(name):
+    path = name if os.path.exists(name) else os.path.join(SCENARIO_DIR, name + '.json')
+    with open(path, 'r', encoding='utf-8') as f:
+        scenario = json.load(f)
+    scenario.setdefault('name', os.path.splitext(os.path.basename(path))[0])
+    scenario.setdefault('duration', 30)
+    scenario.setdefault('warmup', 5)
+    scenario.setdefault('concurrency', 10)
+    scenario.setdefault('rate', None)
+    scenario.setdefault('timeout', 30)
+    scenario.setdefault('admin_sessions', 10)
+    for spec in scenario['requests']:
+        spec.setdefault('method', 'GET')
+        spec.setdefault('weight', 1)
+        spec.setdefault('expect', [200])
+    return scenario
+
+
+class Expander:
+    def __init__(self, slugs):
+        self.slugs = slugs
+        self.counter = 0
+
+    def __call__(self, value):
+        if isinstance(value, dict):
+            return {k: self(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self(v) for v in value]
+        if isinstance(value, str) and '{' in value:
+            self.counter += 1
+            return (value.replace('{slug}', random.choice(self.slugs)).replace('{n}', str(self.counter))
+                    .replace('{uuid}', str(uuid.uuid4())))
+        return value
+
+
+class Recorder:
+    def __init__(self):
+        self.recording = False
+        self.latencies = {}
+        self.statuses = {}
+        self.errors = {}
+        self.dropped = 0
+        self.started = self.stopped = None
+
+    def start(self):
+        self.recording = True
+        self.started = time.perf_counter()
+
+    def stop(self):
+        self.recording = False
+        self.stopped = time.perf_counter()
+
+    def add(self, name, seconds, status, ok):
+        if not self.recording:
+            return
+        self.latencies.setdefault(name, []).append(seconds)
+        codes = self.statuses.setdefault(name, {})
+        codes[status] = codes.get(status, 0) + 1
+        if not ok:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+
+def percentile(ordered, p):
+    # Nearest-rank on an already sorted list.
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, -(-p * len(ordered) // 100) - 1))]
+
+
+def _stats(latencies, errors, elapsed):
+    ordered = sorted(latencies)
+    stats = {'requests': len(ordered), 'errors': errors,
+             'error_rate': round(errors / len(ordered), 4) if ordered else 0.0,
+             'throughput_rps': round(len(ordered) / elapsed, 2) if elapsed else 0.0}
+    for p in PERCENTILES:
+        value = percentile(ordered, p)
+        stats[f'p{p}_ms'] = round(value * 1000, 2) if value is not None else None
+    stats['mean_ms'] = round(sum(ordered) / len(ordered) * 1000, 2) if ordered else None
+    stats['max_ms'] = round(ordered[-1] * 1000, 2) if ordered else None
+    return stats
+
+
+def _rate_limited(statuses):
+    return statuses.get(429, 0)
+
+
+def summarize(recorder, scenario, base_url):
+    elapsed = (recorder.stopped or time.perf_counter()) - recorder.started
+    everything = [s for values in recorder.latencies.values() for s in values]
+    overall = _stats(everything, sum(recorder.errors.values()), elapsed)
+    overall['dropped'] = recorder.dropped
+    overall['rate_limited'] = sum(_rate_limited(codes) for codes in recorder.statuses.values())
+    return {
+        'scenario': scenario['name'], 'base_url': base_url,
+        'started': datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z'),
+        'model': 'open' if scenario['rate'] else 'closed', 'concurrency': scenario['concurrency'],
+        'rate': scenario['rate'], 'duration_s': round(elapsed, 2),
+        'overall': overall,
+        'routes': {name: dict(_stats(values, recorder.errors.get(name, 0), elapsed),
+                              rate_limited=_rate_limited(recorder.statuses[name]),
+                              statuses={str(k): v for k, v in sorted(recorder.statuses[name].items(), key=str)})
+                   for name, values in recorder.latencies.items()},
+    }
+
+
+class Runner:
+    def __init__(self, scenario, base_url=BASE_URL, slugs=None):
+        self.scenario = scenario
+        self.base_url = base_url.rstrip('/')
+        self.expand = Expander(slugs or internal_slugs())
+        self.cookies = [sign_session(s) for s in admin_sessions(scenario['admin_sessions'])]
+        self.accounts = itertools.count()
+        self.mix = [s for s in scenario['requests'] if 'poll' not in s]
+        self.pollers = [s for s in scenario['requests'] if 'poll' in s]
+        self.recorder = Recorder()
+
+    async def fire(self, session, spec, user, scheduled=None, account=None):
+        # account picks the admin session (default: the user's own).
+        import aiohttp
+
+        headers = dict(spec.get('headers') or {})
+        if spec.get('auth') == 'admin':
+            account = user if account is None else account
+            headers['Cookie'] = f'admin_session={self.cookies[account % len(self.cookies)]}'
+        # Each virtual user looks like its own visitor to /api/visitor.
+        headers.setdefault('X-Forwarded-For', f'10.{user // 65536 % 256}.{user // 256 % 256}.{user % 256}')
+        body = self.expand(spec['json']) if 'json' in spec else None
+        start = scheduled if scheduled is not None else time.perf_counter()
+        try:
+            async with session.request(spec['method'], self.base_url + self.expand(spec['path']),
+                                       json=body, headers=headers, allow_redirects=False) as res:
+                await res.read()
+                status = res.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = type(e).__name__
+        self.recorder.add(spec['name'], time.perf_counter() - start, status, status in spec['expect'])
+
+    def pick(self):
+        return random.choices(self.mix, weights=[s['weight'] for s in self.mix])[0]
+
+    async def closed_user(self, session, user, deadline):
+        while time.perf_counter() < deadline:
+            await self.fire(session, self.pick(), user, account=next(self.accounts))
+
+    async def open_arrivals(self, session, deadline):
+        in_flight = set()
+        next_at = time.perf_counter()
+        user = 0
+        while next_at < deadline:
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= self.scenario['concurrency']:
+                if self.recorder.recording:
+                    self.recorder.dropped += 1
+            else:
+                task = asyncio.create_task(self.fire(session, self.pick(), user, scheduled=next_at))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            user += 1
+            next_at += random.expovariate(self.scenario['rate'])
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+    async def poller(self, session, spec, client, deadline):
+        every = spec['poll']['every']
+        await asyncio.sleep(random.uniform(0, every))  # clients don't all start in step
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await self.fire(session, spec, client)
+            await asyncio.sleep(max(0.0, every - (time.perf_counter() - started)))
+
+    async def run(self):
+        import aiohttp
+
+        scenario = self.scenario
+        warmup_end = time.perf_counter() + scenario['warmup']
+        deadline = warmup_end + scenario['duration']
+        connector = aiohttp.TCPConnector(limit=0)
+        timeout = aiohttp.ClientTimeout(total=scenario['timeout'])
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, cookie_jar=aiohttp.DummyCookieJar()) as session:
+            tasks = []
+            if self.mix:
+                if scenario['rate']:
+                    tasks.append(self.open_arrivals(session, deadline))
+                else:
+                    tasks.extend(self.closed_user(session, u, deadline) for u in range(scenario['concurrency']))
+            for spec in self.pollers:
+                tasks.extend(self.poller(session, spec, c, deadline) for c in range(spec['poll']['clients']))
+
+            async def measure():
+                await asyncio.sleep(max(0.0, warmup_end - time.perf_counter()))
+                self.recorder.start()
+                await asyncio.sleep(max(0.0, deadline - time.perf_counter()))
+                self.recorder.stop()
+
+            await asyncio.gather(measure(), *tasks)
+        return summarize(self.recorder, scenario, self.base_url)
+
+
+async def seed_emulator(sessions, host=None, project=EMULATOR_PROJECT):
+    # Writes active_sessions/<sessionId> and users/<id> so session-status answers
+    # valid: true and admin writes behave as for a logged-in user.
+    import aiohttp
+
+    host = host or os.environ['FIRESTORE_EMULATOR_HOST']
+    base = f'http://{host}/v1/projects/{project}/databases/(default)/documents'
+    now = int(time.time() * 1000)
+    async with aiohttp.ClientSession(headers={'Authorization': 'Bearer owner'}) as session:
+        for s in sessions:
+            docs = {
+                f"active_sessions/{s['sessionId']}": {
+                    'userId': {'stringValue': s['id']}, 'sessionId': {'stringValue': s['sessionId']},
+                    'userName': {'stringValue': s['name']}, 'role': {'stringValue': s['role']},
+                    'createdAt': {'integerValue': str(now)}, 'lastActive': {'integerValue': str(now)}},
+                f"users/{s['id']}": {
+                    'email': {'stringValue': s['username']}, 'name': {'stringValue': s['name']},
+                    'role': {'stringValue': s['role']}},
+            }
+            for path, fields in docs.items():
+                async with session.patch(f'{base}/{path}', json={'fields': fields}) as res:
+                    res.raise_for_status()
+
+
+def stub_env(upstash_url, upstash_token, emulator_host, project=EMULATOR_PROJECT):
+    # The Firebase Admin SDK insists on a parseable service account key even
+    # when it talks to the emulator, so generate a throwaway one.
+    import subprocess
+
+    key = subprocess.run(['openssl', 'genrsa', '2048'], capture_output=True, text=True, check=True).stdout
+    return {
+        'UPSTASH_REDIS_REST_URL': upstash_url,
+        'UPSTASH_REDIS_REST_TOKEN': upstash_token,
+        'FIRESTORE_EMULATOR_HOST': emulator_host,
+        'FIREBASE_ADMIN_PROJECT_ID': project,
+        'FIREBASE_ADMIN_CLIENT_EMAIL': f'loadtest@{project}.iam.gserviceaccount.com',
+        'FIREBASE_ADMIN_PRIVATE_KEY': key.strip().replace('\n', '\\n'),
+        'SESSION_SECRET': SESSION_SECRET,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the site's hot routes and report latency percentiles.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    r = sub.add_parser('run', help="Run a scenario")
+    r.add_argument('scenario', help="Name in loadtest/ or a path")
+    r.add_argument('--base-url', default=BASE_URL)
+    r.add_argument('--duration', type=float)
+    r.add_argument('--warmup', type=float)
+    r.add_argument('-c', '--concurrency', type=int)
+    r.add_argument('--rate', type=float, help="Open model: arrivals per second")
+    r.add_argument('--out', help="Result path (default .cache/loadtest/<scenario>-<time>.json)")
+    sub.add_parser('list', help="List the scenarios")
+    e = sub.add_parser('env', help="Print the environment for `next start` on stubs")
+    e.add_argument('--upstash-url', default='http://127.0.0.1:8079')
+    e.add_argument('--upstash-token', default='local-stub-token')
+    e.add_argument('--emulator-host', default='127.0.0.1:8080')
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        for name in sorted(os.listdir(SCENARIO_DIR)):
+            if name.endswith('.json'):
+                scenario = load_scenario(os.path.join(SCENARIO_DIR, name))
+                print(f"  {scenario['name']:<16} {scenario.get('description', '')}")
+        return
+    if args.command == 'env':
+        for name, value in stub_env(args.upstash_url, args.upstash_token, args.emulator_host).items():
+            print(f'{name}="{value}"')
+        return
+
+    scenario = load_scenario(args.scenario)
+    for key in ('duration', 'warmup', 'concurrency', 'rate'):
+        if getattr(args, key) is not None:
+            scenario[key] = getattr(args, key)
+    runner = Runner(scenario, args.base_url)
+    if os.environ.get('FIRESTORE_EMULATOR_HOST') and any(s.get('auth') == 'admin' for s in scenario['requests']):
+        asyncio.run(seed_emulator(admin_sessions(scenario['admin_sessions'])))
+
+    result = asyncio.run(runner.run())
+    out = args.out or os.path.join(RESULTS_DIR, f"{scenario['name']}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    write_if_changed(out, (json.dumps(result, indent=2) + '\n').encode('utf-8'))
+
+    print(f"{'route':<22} {'reqs':>7} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'err%':>6} {'429':>6}")
+    for name, stats in list(result['routes'].items()) + [('overall', result['overall'])]:
+        print(f"{name:<22} {stats['requests']:>7} {stats['throughput_rps']:>8.1f} {stats['p50_ms'] or 0:>8.1f} "
+              f"{stats['p95_ms'] or 0:>8.1f} {stats['p99_ms'] or 0:>8.1f} {stats['error_rate'] * 100:>6.2f} "
+              f"{stats['rate_limited']:>6}")
+    if result['overall']['dropped']:
+        print(f"{result['overall']['dropped']} arrivals dropped at the concurrency cap")
+    print(f"-> {os.path.relpath(out, repo_root)}")
+
+
+if __name__ == '__main__':
+    main()
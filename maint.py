@@ -0,0 +1,166 @@
+import os
+import sys
+import time
+import argparse
+
+from run_log import RUN_LOG_PATH, RunLog
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# One entry point for the page maintenance scripts:
+#
+#   python maint.py sync-pages            synchronize_pages.py
+#   python maint.py sync-home [--force]   sync_home_and_news.py
+#   python maint.py restore-pemerintahan  fix_file_2.py
+#   python maint.py inject-kelurahan [DIR]  fix_file_3.py
+#   python maint.py icons [--force]       optimize_icons.py
+#   python maint.py embeds [--force]      social_embeds.py build
+#   python maint.py pddikti-student       test_api.py
+#   python maint.py pddikti-university    test_university.py
+#   python maint.py all                   inject-kelurahan, embeds
+#
+# Only argparse and run_log are imported up front; each command imports its
+# script (and through it PIL, aiohttp, ...) when it runs, so --help and the
+# light commands start instantly. Every run is timed per stage into
+# .cache/runs.jsonl (see run_log.py); --profile also writes a cProfile dump per
+# command to .cache/profiles/ and prints the top functions.
+#
+# `all` is the routine rebuild of what is generated from tracked data, and
+# leaves a clean checkout unchanged. sync-pages and sync-home are one-off
+# content migrations (already applied to the pages), restore-pemerintahan
+# restores a backup, and icons re-encodes the logo (the bytes depend on the
+# Pillow build), so those only run when asked for.
+
+PROFILE_DIR = os.path.join(repo_root, '.cache', 'profiles')
+COMMANDS = {}
+
+
+def command(name, help, args=()):
+    # args: [(flags, add_argument kwargs)]
+    def register(fn):
+        COMMANDS[name] = (fn, help, args)
+        return fn
+    return register
+
+
+@command('sync-pages', "Apply the Surakarta title/description rules to the home and news pages")
+def sync_pages(args, log):
+    with log.stage('sync-pages') as stage:
+        import synchronize_pages
+        results = synchronize_pages.main()
+        stage['changed'] = sum(1 for r in results if r.get('changed'))
+    return 1 if any('error' in r for r in results) else 0
+
+
+@command('sync-home', "Sync the featured card on the home page and the news listing",
+         [(('-f', '--force'), {'action': 'store_true', 'help': "Ignore the manifest"})])
+def sync_home(args, log):
+    with log.stage('sync-home'):
+        import sync_home_and_news
+        sync_home_and_news.main(force=args.force)
+    return 0
+
+
+@command('restore-pemerintahan', "Restore the pemerintahan article from restore_pemerintahan.txt")
+def restore_pemerintahan(args, log):
+    with log.stage('restore-pemerintahan'):
+        import fix_file_2
+        return fix_file_2.main()
+
+
+@command('inject-kelurahan', "Inject the kelurahan block (or a fragment directory) into its article",
+         [(('fragments',), {'nargs': '?', 'help': "Fragment directory, e.g. kelurahan_fragments"})])
+def inject_kelurahan(args, log):
+    with log.stage('inject-kelurahan'):
+        import fix_file_3
+        return fix_file_3.main([args.fragments] if args.fragments else [])
+
+
+@command('icons', "Regenerate the site icons from the logo",
+         [(('-f', '--force'), {'action': 'store_true', 'help': "Ignore the manifest"})])
+def icons(args, log):
+    with log.stage('icons'):
+        import optimize_icons
+        optimize_icons.generate_icons(force=args.force)
+    return 0
+
+
+@command('embeds', "Pre-render the social link cards in article bodies",
+         [(('-f', '--force'), {'action': 'store_true', 'help': "Re-render every body"})])
+def embeds(args, log):
+    with log.stage('embeds') as stage:
+        import social_embeds
+        stage['bodies'] = len(social_embeds.build(force=args.force))
+    return 0
+
+
+@command('pddikti-student', "Search a student on PDDikti and fetch the first detail")
+def pddikti_student(args, log):
+    with log.stage('pddikti-student'):
+        import test_api
+        test_api.test_api()
+    return 0
+
+
+@command('pddikti-university', "Search a university on PDDikti and fetch the first detail")
+def pddikti_university(args, log):
+    with log.stage('pddikti-university'):
+        import test_university
+        test_university.test_university()
+    return 0
+
+
+@command('all', "Run inject-kelurahan and embeds in order",
+         [(('-f', '--force'), {'action': 'store_true', 'help': "Ignore the manifests"})])
+def run_all(args, log):
+    args.fragments = None
+    status = 0
+    for step in (inject_kelurahan, embeds):
+        status = max(status, step(args, log) or 0)
+    return status
+
+
+def profiled(fn, args, log, name):
+    import cProfile
+    import pstats
+
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(fn, args, log)
+    finally:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = os.path.join(PROFILE_DIR, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}.prof")
+        profile.dump_stats(path)
+        print(f"\nProfile -> {os.path.relpath(path, repo_root)} (open with: python -m pstats {path})")
+        pstats.Stats(profile).sort_stats('cumulative').print_stats(15)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the page maintenance scripts with per-stage timing.")
+    parser.add_argument('--log', default=RUN_LOG_PATH, help="Run log (JSON lines); '' disables it")
+    parser.add_argument('--profile', action='store_true', help="Write a cProfile dump for the command")
+    parser.add_argument('--trace-memory', action='store_true', help="Record each stage's peak Python allocations")
+    sub = parser.add_subparsers(dest='command', required=True)
+    for name, (fn, help, options) in COMMANDS.items():
+        p = sub.add_parser(name, help=help)
+        for flags, kwargs in options:
+            p.add_argument(*flags, **kwargs)
+    args = parser.parse_args(argv)
+
+    # The scripts resolve their paths from their own location, but relative
+    # arguments (fragment directories) are meant relative to the repo.
+    os.chdir(repo_root)
+    log = RunLog(args.command, argv, path=args.log or None, trace_memory=args.trace_memory)
+    fn = COMMANDS[args.command][0]
+    status = 1
+    try:
+        status = (profiled(fn, args, log, args.command) if args.profile else fn(args, log)) or 0
+    finally:
+        entry = log.finish(status)
+        print(f"\n{args.command}: {entry['wall_s'] * 1000:.1f} ms, exit {status}")
+        print(log.summary())
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,249 @@
+import os
+import re
+import json
+import glob
+import time
+import hashlib
+import argparse
+from html.parser import HTMLParser
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree.ElementTree import iterparse
+
+from sync_manifest import write_if_changed
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Offline ingestion of saved surakarta.go.id captures (news listings, article
+# pages and sitemaps) into normalized JSON records.
+#
+# Every file is fed to an incremental parser in CHUNK_SIZE pieces, so memory is
+# bounded by what we keep (titles, links, paragraphs), not by the capture size.
+# Sitemaps go through iterparse. Captures are deduplicated on a hash of the
+# extracted content rather than the raw bytes, because each Livewire render
+# carries fresh wire:id / checksum / CSRF tokens. Soft 404s (the "Halaman tidak
+# ditemukan" page served with 200) are flagged and produce no records.
+
+SOURCES = ['surakarta_news*.html', 'surakarta_sitemap*.xml']
+OUTPUT_PATH = os.path.join(repo_root, 'data', 'surakarta_news.json')
+CHUNK_SIZE = 64 * 1024
+ARTICLE_LINK = re.compile(r'/detail-berita/([\w-]+)')
+SOFT_404_MARKERS = ('halaman tidak ditemukan', 'page not found', 'not-found-page')
+SKIP_TAGS = {'script', 'style', 'noscript', 'nav', 'header', 'footer', 'svg'}
+
+MONTHS = {
+    'januari': 1, 'februari': 2, 'maret': 3, 'april': 4, 'mei': 5, 'juni': 6, 'juli': 7,
+    'agustus': 8, 'september': 9, 'oktober': 10, 'november': 11, 'desember': 12,
+}
+_DATE_ID = re.compile(r'\b(\d{1,2})\s+(' + '|'.join(MONTHS) + r')\s+(\d{4})\b', re.I)
+_VIEWS = re.compile(r'dilihat\s+(\d+)', re.I)
+_DATE_NUM = re.compile(r'\b(\d{4})-(\d{2})-(\d{2})\b|\b(\d{2})-(\d{2})-(\d{4})\b')
+
+
+def parse_date(text):
+    if not text:
+        return None
+    m = _DATE_ID.search(text)
+    if m:
+        return f'{int(m.group(3)):04d}-{MONTHS[m.group(2).lower()]:02d}-{int(m.group(1)):02d}'
+    m = _DATE_NUM.search(text)
+    if m:
+        if m.group(1):
+            return f'{m.group(1)}-{m.group(2)}-{m.group(3)}'
+        return f'{m.group(6)}-{m.group(5)}-{m.group(4)}'
+    return None
+
+
+def _clean(text):
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+class NewsPageParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ''
+        self.meta = {}
+        self.headings = []
+        self.paragraphs = []
+        self.links = {}
+        self.soft_404 = False
+        self._skip = 0
+        self._text = []
+        self._capture = None
+        self._link = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in SKIP_TAGS:
+            self._skip += 1
+        if any(m in (attrs.get('wire:snapshot') or '') for m in SOFT_404_MARKERS):
+            self.soft_404 = True
+        if tag == 'meta':
+            key = attrs.get('property') or attrs.get('name')
+            if key and attrs.get('content'):
+                self.meta[key] = attrs['content']
+        elif tag == 'a':
+            m = ARTICLE_LINK.search(attrs.get('href') or '')
+            if m:
+                self._link = self.links.setdefault(m.group(1), {'slug': m.group(1), 'url': attrs['href']})
+        elif tag == 'img' and self._link is not None and attrs.get('src'):
+            self._link.setdefault('image', attrs['src'])
+        elif tag in ('title', 'h1', 'h2', 'h3', 'h4', 'h5', 'p', 'time') and not self._skip:
+            if self._capture is None:
+                self._capture = tag
+                self._text = []
+                if tag == 'time' and attrs.get('datetime'):
+                    self.meta.setdefault('time', attrs['datetime'])
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS and self._skip:
+            self._skip -= 1
+        if tag == 'a':
+            self._link = None
+        if tag != self._capture:
+            return
+        text = _clean(''.join(self._text))
+        self._capture = None
+        if not text:
+            return
+        if tag == 'title':
+            self.title = text
+        elif tag in ('h1', 'h2', 'h3', 'h4', 'h5'):
+            if self._link is not None:
+                self._link['title'] = text
+            else:
+                self.headings.append(text)
+        elif tag == 'p' and self._link is not None:
+            views = _VIEWS.search(text)
+            if views:
+                self._link['views'] = int(views.group(1))
+        elif tag == 'p':
+            self.paragraphs.append(text)
+        elif tag == 'time':
+            self.meta.setdefault('time', text)
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._text.append(data)
+        if not self.soft_404 and 'tidak ditemukan' in data.lower():
+            self.soft_404 = any(m in data.lower() for m in SOFT_404_MARKERS)
+
+
+def parse_html(path):
+    parser = NewsPageParser()
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+    parser.close()
+
+    if parser.title.startswith('404') or parser.soft_404:
+        return {'kind': 'soft404', 'title': parser.title, 'records': []}
+
+    links = [link for link in parser.links.values() if link.get('title')]
+    title = parser.meta.get('og:title') or (parser.headings[0] if parser.headings else parser.title)
+    body = [p for p in parser.paragraphs if len(p) > 40]
+    if len(links) >= 3 and len(' '.join(body)) < 500:
+        return {'kind': 'listing', 'title': title, 'records': [
+            {'slug': link['slug'], 'url': link['url'], 'title': link['title'],
+             'image': link.get('image'), 'views': link.get('views'), 'date': parse_date(link['title'])}
+            for link in links]}
+
+    date = parse_date(parser.meta.get('article:published_time') or parser.meta.get('time')
+                      or ' '.join(parser.paragraphs[:5]))
+    return {'kind': 'article', 'title': title, 'records': [{
+        'slug': None, 'url': parser.meta.get('og:url'), 'title': title, 'date': date,
+        'image': parser.meta.get('og:image'), 'description': parser.meta.get('og:description') or parser.meta.get('description'),
+        'body': body}]}
+
+
+def parse_sitemap(path):
+    records = []
+    entry = {}
+    for event, elem in iterparse(path, events=('end',)):
+        tag = elem.tag.rsplit('}', 1)[-1]
+        if tag in ('loc', 'lastmod'):
+            entry[tag] = (elem.text or '').strip()
+        elif tag in ('url', 'sitemap'):
+            m = ARTICLE_LINK.search(entry.get('loc', ''))
+            records.append({'slug': m.group(1) if m else None, 'url': entry.get('loc'),
+                            'date': parse_date(entry.get('lastmod'))})
+            entry = {}
+        elem.clear()
+    return {'kind': 'sitemap', 'title': None, 'records': records}
+
+
+def ingest_file(path):
+    start = time.perf_counter()
+    with open(path, 'rb') as f:
+        head = f.read(512).lstrip().lower()
+    raw_hash = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b''):
+            raw_hash.update(block)
+
+    # A ".xml" capture is not necessarily XML: the saved sitemap is an HTML 404.
+    if head.startswith((b'<?xml', b'<urlset', b'<sitemapindex')):
+        result = parse_sitemap(path)
+    else:
+        result = parse_html(path)
+
+    content = json.dumps([result['kind'], result['title'], result['records']], sort_keys=True, ensure_ascii=False)
+    result.update({
+        'source': os.path.relpath(path, repo_root),
+        'bytes': os.path.getsize(path),
+        'sha256': raw_hash.hexdigest(),
+        'content_hash': hashlib.sha256(content.encode('utf-8')).hexdigest(),
+        'seconds': round(time.perf_counter() - start, 4),
+    })
+    return result
+
+
+def ingest(paths, workers=None):
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        captures = list(pool.map(ingest_file, paths))
+
+    seen = {}
+    articles = {}
+    for capture in captures:
+        first = seen.setdefault(capture['content_hash'], capture['source'])
+        if first != capture['source']:
+            capture['duplicate_of'] = first
+            continue
+        for record in capture['records']:
+            key = record.get('slug') or record.get('url') or record.get('title')
+            merged = articles.setdefault(key, {})
+            merged.update({k: v for k, v in record.items() if v is not None})
+            merged.setdefault('sources', []).append(capture['source'])
+
+    summary = [{k: c[k] for k in ('source', 'kind', 'title', 'bytes', 'sha256', 'content_hash', 'duplicate_of')
+                if k in c} | {'records': len(c['records'])} for c in captures]
+    timings = {c['source']: c['seconds'] for c in captures}
+    return summary, timings, sorted(articles.values(), key=lambda r: (r.get('date') or '', r.get('title') or ''), reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse saved surakarta.go.id captures into normalized news records.")
+    parser.add_argument('files', nargs='*', help="Capture files (default: %s)" % ', '.join(SOURCES))
+    parser.add_argument('-o', '--out', default=OUTPUT_PATH)
+    parser.add_argument('-j', '--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    paths = args.files or sorted(p for pattern in SOURCES for p in glob.glob(os.path.join(repo_root, pattern)))
+    start = time.perf_counter()
+    captures, timings, articles = ingest(paths, args.workers)
+
+    for c in captures:
+        note = f" duplicate of {c['duplicate_of']}" if 'duplicate_of' in c else ''
+        print(f"{c['source']}: {c['kind']}, {c['records']} records, {c['bytes'] // 1024} KB, "
+              f"{timings[c['source']] * 1000:.0f} ms{note}")
+
+    data = json.dumps({'captures': captures, 'articles': articles}, indent=2, ensure_ascii=False)
+    changed = write_if_changed(args.out, data.encode('utf-8'))
+    print(f"\n{len(articles)} unique articles -> {os.path.relpath(args.out, repo_root)}"
+          f"{'' if changed else ' (unchanged)'} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,45 +1,133 @@
-from PIL import Image
 import os
+import io
+import sys
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+from sync_manifest import Manifest, write_if_changed
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Source candidates, first existing one wins.
+SOURCES = ['public/logo-kt.png', 'public/logo-kt.webp']
+
+# Declarative target table: (path, size, format, save options).
+# The site serves the WebP icons (manifest.json, Navbar, Footer); the PNGs are
+# picked up by Next.js from src/app, AVIF is an extra for browsers that take it.
+TARGETS = [
+    ('src/app/icon.png', 128, 'PNG', {'optimize': True}),      # High-res for tab (32->128 is better)
+    ('src/app/apple-icon.png', 180, 'PNG', {'optimize': True}),
+    ('public/icon-192.webp', 192, 'WEBP', {'quality': 90, 'method': 6}),
+    ('public/icon-512.webp', 512, 'WEBP', {'quality': 90, 'method': 6}),
+    ('public/icon-192.avif', 192, 'AVIF', {'quality': 70}),
+    ('public/icon-512.avif', 512, 'AVIF', {'quality': 70}),
+]
+
+MANIFEST_PATH = os.path.join(repo_root, '.icon_manifest.json')
+
+
+def find_source():
+    for rel in SOURCES:
+        path = os.path.join(repo_root, rel)
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No icon source found (tried {', '.join(SOURCES)})")
+
+
+def target_fingerprint(source_hash, size, fmt, options):
+    params = f"{source_hash}|{size}|{fmt}|{sorted(options.items())}"
+    return hashlib.sha256(params.encode('utf-8')).hexdigest()[:16]
+
+
+def square_source(src_path):
+    from PIL import Image
 
-def generate_icons():
-    # Load source
-    src_path = 'public/logo-kt.png'
     img = Image.open(src_path).convert('RGBA')
-    
+
     # 1. Crop to content (remove transparent padding)
     bbox = img.getbbox()
     if bbox:
         img = img.crop(bbox)
         print(f"Cropped to {bbox}, new size: {img.size}")
-    
-    # 2. Make square canvas
-    # We want valid square icons.
-    # Dimensions of content
+
+    # 2. Center on a square transparent canvas
     w, h = img.size
     max_dim = max(w, h)
-    
-    # Create new square transparent canvas
-    # Use max_dim as base size
-    final_size = (max_dim, max_dim)
-    square_img = Image.new('RGBA', final_size, (0, 0, 0, 0))
-    
-    # Center the cropped content
-    offset = ((max_dim - w) // 2, (max_dim - h) // 2)
-    square_img.paste(img, offset)
-    
-    # 3. Generate sizes
-    targets = [
-        ('src/app/icon.png', 128),      # High-res for tab (32->128 is better)
-        ('src/app/apple-icon.png', 180),
-        ('public/icon-192.png', 192),
-        ('public/icon-512.png', 512)
-    ]
-    
-    for path, size in targets:
-        # Resize with high quality
-        resized = square_img.resize((size, size), Image.Resampling.LANCZOS)
-        resized.save(path, 'PNG')
-        print(f"Generated {path} ({size}x{size})")
+    square_img = Image.new('RGBA', (max_dim, max_dim), (0, 0, 0, 0))
+    square_img.paste(img, ((max_dim - w) // 2, (max_dim - h) // 2))
+    return square_img
+
+
+def resize_cascade(square_img, sizes):
+    # Each size is derived from the next-larger one instead of from the full
+    # resolution source, so every resize works on a much smaller input.
+    from PIL import Image
+
+    masters = {}
+    current = square_img
+    for size in sorted(set(sizes), reverse=True):
+        if current.size[0] != size:
+            current = current.resize((size, size), Image.Resampling.LANCZOS)
+        masters[size] = current
+    return masters
+
+
+def encode(raw, size, fmt, options):
+    from PIL import Image
+
+    img = Image.frombytes('RGBA', (size, size), raw)
+    buf = io.BytesIO()
+    img.save(buf, fmt, **options)
+    return buf.getvalue()
+
+
+def format_supported(fmt):
+    from PIL import features
+
+    return fmt == 'PNG' or features.check(fmt.lower())
+
+
+def generate_icons(force=False, workers=None):
+    src_path = find_source()
+    with open(src_path, 'rb') as f:
+        source_hash = hashlib.sha256(f.read()).hexdigest()
+
+    manifest = Manifest(MANIFEST_PATH)
+    pending = []
+    for rel, size, fmt, options in TARGETS:
+        path = os.path.join(repo_root, rel)
+        fingerprint = target_fingerprint(source_hash, size, fmt, options)
+        if not force and manifest.is_current(path, fingerprint):
+            print(f"Up to date {rel} ({size}x{size})")
+            continue
+        pending.append((rel, path, size, fmt, options, fingerprint))
+
+    if not pending:
+        return
+
+    supported = []
+    for target in pending:
+        if format_supported(target[3]):
+            supported.append(target)
+        else:
+            print(f"Skipped {target[0]}: this Pillow build has no {target[3]} support")
+    pending = supported
+    if not pending:
+        return
+
+    # 3. Resize once per distinct size, then encode in parallel.
+    masters = resize_cascade(square_source(src_path), [t[2] for t in pending])
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = [pool.submit(encode, masters[size].tobytes(), size, fmt, options)
+                for rel, path, size, fmt, options, fingerprint in pending]
+        for (rel, path, size, fmt, options, fingerprint), job in zip(pending, jobs):
+            data = job.result()
+            write_if_changed(path, data)
+            manifest.record(path, data, fingerprint)
+            print(f"Generated {rel} ({size}x{size}, {len(data)} bytes)")
+
+    manifest.save()
+
 
 if __name__ == '__main__':
-    generate_icons()
+    generate_icons(force='--force' in sys.argv[1:])
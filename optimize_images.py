@@ -0,0 +1,186 @@
+import os
+import io
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from sync_manifest import write_if_changed
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Bulk WebP optimizer for the static images under public/.
+#
+# Mirrors the upload route (api/upload/route.ts): fit inside 1200px, WebP, aim for
+# 100 KB. Instead of stepping down through fixed qualities, the highest quality
+# that fits the budget is found by binary search, so every image costs about
+# log2(quality range) encodes. WebP sources are only rewritten when the result is
+# smaller. Non-WebP sources get a .webp sibling next to the original, named
+# after the whole file name (foo.png -> foo.png.webp) so foo.png, foo.jpg and a
+# real foo.webp never overwrite each other; nothing points at it until
+# gallery.json / the posts are updated, so siblings are reported as bytes
+# added, not saved.
+#
+# Generated images are left alone: the icons (optimize_icons.py), the
+# responsive variants under public/_variants/ (responsive_images.py) and the
+# siblings this script wrote.
+
+ROOTS = ['public', 'public/uploads/gallery']
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp')
+MAX_SIZE = 100 * 1024  # 100KB, same budget as the upload route
+MAX_DIM = 1200
+MIN_QUALITY = 30
+MAX_QUALITY = 90
+FALLBACK_DIM = 800
+
+
+def managed_icons():
+    # Icons are produced by optimize_icons.py, leave them alone.
+    from optimize_icons import TARGETS
+    return {os.path.normpath(os.path.join(repo_root, rel)) for rel, size, fmt, options in TARGETS}
+
+
+def generated_dirs():
+    from responsive_images import VARIANTS_URL
+    return {os.path.normpath(os.path.join(repo_root, 'public', VARIANTS_URL.lstrip('/')))}
+
+
+def find_images(roots):
+    skip = managed_icons()
+    skip_dirs = generated_dirs()
+    seen = set()
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(repo_root, root)):
+            dirnames[:] = sorted(d for d in dirnames if os.path.normpath(os.path.join(dirpath, d)) not in skip_dirs)
+            names = set(filenames)
+            for name in sorted(filenames):
+                path = os.path.normpath(os.path.join(dirpath, name))
+                if not name.lower().endswith(IMAGE_EXTENSIONS) or path in skip or path in seen:
+                    continue
+                if is_sibling(name, names):
+                    continue
+                seen.add(path)
+                yield path
+
+
+def sibling_path(path):
+    return path + '.webp'
+
+
+def is_sibling(name, names):
+    # foo.png.webp next to foo.png was written by optimize_image().
+    source = name[:-len('.webp')]
+    return (name.lower().endswith('.webp') and source in names
+            and source.lower().endswith(IMAGE_EXTENSIONS) and not source.lower().endswith('.webp'))
+
+
+def _encode(img, quality):
+    buf = io.BytesIO()
+    img.save(buf, 'WEBP', quality=quality, method=6)
+    return buf.getvalue()
+
+
+def fit_budget(img, budget, lo=MIN_QUALITY, hi=MAX_QUALITY):
+    # Highest quality whose output is <= budget, or the lowest quality output if
+    # nothing fits. Returns (data, quality, encodes).
+    best = None
+    smallest = None
+    encodes = 0
+    while lo <= hi:
+        q = (lo + hi) // 2
+        data = _encode(img, q)
+        encodes += 1
+        if smallest is None or q < smallest[1]:
+            smallest = (data, q)
+        if len(data) <= budget:
+            best = (data, q)
+            lo = q + 1
+        else:
+            hi = q - 1
+    if best:
+        return best[0], best[1], encodes
+    return smallest[0], smallest[1], encodes
+
+
+def optimize_image(path, budget=MAX_SIZE, max_dim=MAX_DIM, dry_run=False):
+    from PIL import Image
+
+    start = time.perf_counter()
+    original_size = os.path.getsize(path)
+    is_webp = path.lower().endswith('.webp')
+    out_path = path if is_webp else sibling_path(path)
+    result = {'path': os.path.relpath(path, repo_root), 'out': os.path.relpath(out_path, repo_root),
+              'before': original_size, 'after': original_size, 'quality': None, 'encodes': 0}
+
+    if is_webp and original_size <= budget:
+        # Already within budget; recompressing lossy WebP only loses quality.
+        result['skipped'] = 'within budget'
+        result['seconds'] = time.perf_counter() - start
+        return result
+    if not is_webp and os.path.exists(out_path) and os.path.getmtime(out_path) >= os.path.getmtime(path):
+        result.update({'after': os.path.getsize(out_path), 'skipped': 'up to date'})
+        result['seconds'] = time.perf_counter() - start
+        return result
+
+    with Image.open(path) as src:
+        img = src.convert('RGBA' if src.mode in ('RGBA', 'LA', 'P') else 'RGB')
+    img.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+
+    data, quality, encodes = fit_budget(img, budget)
+    if len(data) > budget and max(img.size) > FALLBACK_DIM:
+        # Very rare: even the lowest quality is too big, shrink like the upload route does.
+        img.thumbnail((FALLBACK_DIM, FALLBACK_DIM), Image.Resampling.LANCZOS)
+        data, quality, more = fit_budget(img, budget)
+        encodes += more
+
+    result.update({'quality': quality, 'encodes': encodes})
+    if is_webp and len(data) >= original_size:
+        result['skipped'] = 'no gain'
+    else:
+        result['after'] = len(data)
+        if not dry_run:
+            write_if_changed(out_path, data)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def _optimize_safe(args):
+    path, budget, max_dim, dry_run = args
+    try:
+        return optimize_image(path, budget, max_dim, dry_run)
+    except Exception as e:
+        return {'path': os.path.relpath(path, repo_root), 'error': str(e)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompress images under public/ to WebP within a byte budget.")
+    parser.add_argument('roots', nargs='*', default=ROOTS, help="Directories to walk, relative to the repo (default: %(default)s)")
+    parser.add_argument('--budget', type=int, default=MAX_SIZE // 1024, help="Target size in KB (default: %(default)s)")
+    parser.add_argument('--max-dim', type=int, default=MAX_DIM, help="Fit inside this many pixels (default: %(default)s)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="Process pool size (default: CPU count)")
+    parser.add_argument('-n', '--dry-run', action='store_true', help="Report savings without writing files")
+    args = parser.parse_args()
+
+    jobs = [(path, args.budget * 1024, args.max_dim, args.dry_run) for path in find_images(args.roots)]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(_optimize_safe, jobs))
+
+    saved = added = 0
+    for r in results:
+        if 'error' in r:
+            print(f"Error {r['path']}: {r['error']}")
+            continue
+        if r['out'] == r['path']:
+            saved += r['before'] - r['after']
+        elif 'skipped' not in r:
+            added += r['after']
+        note = f" ({r['skipped']})" if 'skipped' in r else f" -> {r['out']} q={r['quality']}"
+        print(f"{r['path']}: {r['before'] // 1024} KB -> {r['after'] // 1024} KB, "
+              f"{r['encodes']} encodes, {r['seconds'] * 1000:.0f} ms{note}")
+
+    print(f"\n{len(results)} images, {saved / 1024:.1f} KB saved in place, "
+          f"{added / 1024:.1f} KB of .webp siblings added (originals kept) in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+import os
+import re
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from sync_manifest import atomic_write
+
+# Single-pass, multi-rule text patcher.
+#
+# All "old" strings are compiled into one alternation regex (longest first, so a
+# rule that is a prefix of another never shadows it) and every file is scanned
+# exactly once. Unlike chained str.replace calls, the output of one rule is never
+# re-matched by a later rule.
+
+
+def compile_rules(rules):
+    # No rules compile to no pattern: "" would match at every position.
+    if not rules:
+        return None, {}
+    olds = []
+    index = {}
+    for i, rule in enumerate(rules):
+        old = rule["old"]
+        if not old:
+            raise ValueError(f"Rule {i} has an empty 'old' string")
+        if old in index:
+            raise ValueError(f"Duplicate rule for '{old[:30]}...'")
+        index[old] = i
+        olds.append(old)
+
+    olds.sort(key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(old) for old in olds))
+    return pattern, index
+
+
+def apply_rules(content, rules, compiled=None):
+    pattern, index = compiled or compile_rules(rules)
+    hits = [0] * len(rules)
+    if pattern is None:
+        return content, hits
+
+    def substitute(match):
+        i = index[match.group(0)]
+        hits[i] += 1
+        return rules[i]["new"]
+
+    return pattern.sub(substitute, content), hits
+
+
+def patch_file(path, rules, compiled=None, dry_run=False):
+    with open(path, "rb") as f:
+        content = f.read().decode("utf-8")
+
+    new_content, hits = apply_rules(content, rules, compiled)
+    changed = new_content != content
+
+    if changed and not dry_run:
+        atomic_write(path, new_content.encode("utf-8"))
+
+    return {"path": path, "changed": changed, "hits": hits}
+
+
+_worker_rules = None
+_worker_compiled = None
+
+
+def _init_worker(rules):
+    global _worker_rules, _worker_compiled
+    _worker_rules = rules
+    _worker_compiled = compile_rules(rules)
+
+
+def _patch_in_worker(path, dry_run):
+    try:
+        return patch_file(path, _worker_rules, _worker_compiled, dry_run)
+    except Exception as e:
+        return {"path": path, "changed": False, "hits": [0] * len(_worker_rules), "error": str(e)}
+
+
+def patch_files(paths, rules, workers=None, dry_run=False):
+    # Compile once up front so bad rule lists fail before any worker starts.
+    compile_rules(rules)
+
+    if len(paths) <= 1 or workers == 1:
+        _init_worker(rules)
+        return [_patch_in_worker(path, dry_run) for path in paths]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(rules,)) as pool:
+        return list(pool.map(_patch_in_worker, paths, [dry_run] * len(paths)))
+
+
+def report(results, rules):
+    totals = [0] * len(rules)
+    for result in results:
+        name = os.path.basename(result["path"])
+        if "error" in result:
+            print(f"Error updating {result['path']}: {result['error']}")
+            continue
+        changes = sum(result["hits"])
+        if result["changed"]:
+            print(f"Updated {name} with {changes} changes.")
+        else:
+            print(f"No changes made to {name}.")
+        for i, count in enumerate(result["hits"]):
+            totals[i] += count
+
+    print("\nPer-rule hits:")
+    for rule, count in zip(rules, totals):
+        flag = "" if count else "  <-- not found in any file"
+        print(f"  {count:5d}  '{rule['old'][:30]}...'{flag}")
+    return totals
+
+
+def load_rules(path):
+    with open(path, "r", encoding="utf-8") as f:
+        rules = json.load(f)
+    if isinstance(rules, dict):
+        rules = [{"old": old, "new": new} for old, new in rules.items()]
+    return rules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply a list of old/new text rules to many files in one pass each.")
+    parser.add_argument("rules", help="JSON file: list of {\"old\", \"new\"} objects or an {old: new} mapping")
+    parser.add_argument("files", nargs="+", help="Files to patch in place")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="Count hits without writing files")
+    args = parser.parse_args()
+
+    rules = load_rules(args.rules)
+    results = patch_files(args.files, rules, args.workers, args.dry_run)
+    report(results, rules)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import os
+import json
+import time
+import random
+import asyncio
+import argparse
+from urllib.parse import quote
+
+from response_cache import ResponseCache
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Async client for the PDDikti proxy used by /alat/pddikti.
+#
+# One pooled aiohttp session is shared by every request, concurrency is capped
+# with a semaphore, transient failures (connection errors, 429, 5xx) are retried
+# with exponential backoff and jitter, and successful responses are kept in an
+# on-disk LRU + TTL cache so repeated lookups never leave the machine.
+
+BASE_URL = os.environ.get('PDDIKTI_BASE_URL', 'https://univppdikti.vercel.app')
+SEARCH_TYPES = ('mahasiswa', 'dosen', 'university')
+CACHE_PATH = os.path.join(repo_root, '.cache', 'pddikti.sqlite3')
+CACHE_TTL = 24 * 60 * 60
+CACHE_MAX_ENTRIES = 5000
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def normalize_results(data):
+    # The search endpoint answers either with a bare list or with {"data": [...]}.
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and isinstance(data.get('data'), list):
+        return data['data']
+    return []
+
+
+def open_cache():
+    return ResponseCache(CACHE_PATH, CACHE_TTL, CACHE_MAX_ENTRIES)
+
+
+class PDDiktiClient:
+    def __init__(self, base_url=BASE_URL, concurrency=8, retries=3, backoff=0.5, timeout=15, cache=None):
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache
+        self.session = None
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.requests_made = 0
+
+    async def __aenter__(self):
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=30)
+        self.session = aiohttp.ClientSession(connector=connector,
+                                             timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+
+    async def _get_json(self, path):
+        import aiohttp
+
+        # Keyed on the full URL: stub and production runs share the cache file.
+        url = self.base_url + path
+        if self.cache:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached
+
+        for attempt in range(self.retries + 1):
+            delay = self.backoff * (2 ** attempt) * (0.5 + random.random())
+            try:
+                async with self.semaphore:
+                    self.requests_made += 1
+                    async with self.session.get(url) as res:
+                        if res.status in RETRY_STATUSES and attempt < self.retries:
+                            retry_after = res.headers.get('Retry-After', '')
+                            if retry_after.isdigit():
+                                delay = max(delay, int(retry_after))
+                        elif res.status == 404:
+                            return None
+                        else:
+                            res.raise_for_status()
+                            data = await res.json(content_type=None)
+                            if self.cache and data:
+                                self.cache.put(url, data)
+                            return data
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == self.retries:
+                    raise
+            await asyncio.sleep(delay)
+
+    async def search(self, type, query):
+        return normalize_results(await self._get_json(f'/search/{type}/{quote(query, safe="")}'))
+
+    async def detail(self, type, id):
+        return await self._get_json(f'/detail/{type}/{quote(id, safe="")}')
+
+    async def search_many(self, type, queries):
+        return await asyncio.gather(*(self.search(type, q) for q in queries), return_exceptions=True)
+
+    async def detail_many(self, type, ids):
+        return await asyncio.gather(*(self.detail(type, i) for i in ids), return_exceptions=True)
+
+
+async def _run(coro_factory, base_url=BASE_URL, use_cache=True, **kwargs):
+    cache = open_cache() if use_cache else None
+    try:
+        async with PDDiktiClient(base_url, cache=cache, **kwargs) as client:
+            return await coro_factory(client)
+    finally:
+        if cache:
+            cache.close()
+
+
+def search(type, query, **kwargs):
+    return asyncio.run(_run(lambda c: c.search(type, query), **kwargs))
+
+
+def detail(type, id, **kwargs):
+    return asyncio.run(_run(lambda c: c.detail(type, id), **kwargs))
+
+
+def search_many(type, queries, **kwargs):
+    return asyncio.run(_run(lambda c: c.search_many(type, queries), **kwargs))
+
+
+def detail_many(type, ids, **kwargs):
+    return asyncio.run(_run(lambda c: c.detail_many(type, ids), **kwargs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the PDDikti proxy with pooling, retries and a local cache.")
+    parser.add_argument('command', choices=['search', 'detail'])
+    parser.add_argument('type', choices=SEARCH_TYPES)
+    parser.add_argument('terms', nargs='+', help="Search queries or detail ids")
+    parser.add_argument('--base-url', default=BASE_URL)
+    parser.add_argument('-j', '--concurrency', type=int, default=8)
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args()
+
+    fn = search_many if args.command == 'search' else detail_many
+    start = time.perf_counter()
+    results = fn(args.type, args.terms, base_url=args.base_url, use_cache=not args.no_cache,
+                 concurrency=args.concurrency)
+    for term, result in zip(args.terms, results):
+        if isinstance(result, Exception):
+            print(f"{term}: error {result!r}")
+        elif args.command == 'search':
+            print(f"{term}: {len(result)} results")
+            for row in result[:5]:
+                print(f"  {row.get('id', '')[:16]}...  {row.get('nama', '')}")
+        else:
+            print(json.dumps(result, indent=2)[:2000] if result else f"{term}: not found")
+    print(f"\n{len(args.terms)} lookups in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
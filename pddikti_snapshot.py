@@ -0,0 +1,139 @@
+import os
+import re
+import json
+import time
+import asyncio
+import argparse
+
+import pddikti_client
+from sync_manifest import write_if_changed
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Offline snapshot of common PDDikti lookups for /alat/pddikti.
+#
+# Crawls the configured queries through pddikti_client, normalizes the search
+# responses and writes a sharded static index under public/data/pddikti/:
+#
+#   index.json                  types, shard list and generation time
+#   <type>/<xx>.json            records whose name has a word starting with "xx",
+#                               plus a prefix table (3..6 chars -> record indices)
+#
+# A query is answered by loading one shard (first two letters of its first word)
+# and looking up its first PREFIX_MAX characters; longer queries filter the hits.
+
+CONFIG_PATH = os.path.join(repo_root, 'pddikti_snapshot.json')
+OUTPUT_DIR = os.path.join(repo_root, 'public', 'data', 'pddikti')
+SHARD_CHARS = 2
+PREFIX_MIN = 3  # the page refuses shorter queries
+PREFIX_MAX = 6
+DROP_FIELDS = {'logo_base64'}
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+def words(text):
+    return _WORD_RE.findall(str(text).lower())
+
+
+def compact(record):
+    return {k: v.strip() if isinstance(v, str) else v for k, v in record.items()
+            if k not in DROP_FIELDS and v not in ('', None, [], {})}
+
+
+async def crawl(config, base_url, concurrency, with_details):
+    cache = pddikti_client.open_cache()
+    results = {}
+    try:
+        async with pddikti_client.PDDiktiClient(base_url, concurrency=concurrency, cache=cache) as client:
+            for type, queries in config.items():
+                records = {}
+                for query, rows in zip(queries, await client.search_many(type, queries)):
+                    if isinstance(rows, Exception):
+                        print(f"  {type}/{query}: error {rows!r}")
+                        continue
+                    print(f"  {type}/{query}: {len(rows)} results")
+                    for row in rows:
+                        if row.get('id'):
+                            records[row['id']] = compact(row)
+                if with_details and records:
+                    ids = list(records)
+                    for id, found in zip(ids, await client.detail_many(type, ids)):
+                        if isinstance(found, dict):
+                            records[id]['detail'] = compact(found)
+                results[type] = records
+        print(f"{client.requests_made} requests, {cache.hits} cache hits")
+    finally:
+        cache.close()
+    return results
+
+
+def build_shards(records):
+    shards = {}
+    for record in sorted(records.values(), key=lambda r: str(r.get('nama', ''))):
+        tokens = words(record.get('nama', ''))
+        keys = {t[:SHARD_CHARS] for t in tokens if len(t) >= PREFIX_MIN}
+        for key in keys:
+            shard = shards.setdefault(key, {'records': [], 'prefixes': {}})
+            idx = len(shard['records'])
+            shard['records'].append(record)
+            for token in tokens:
+                if not token.startswith(key):
+                    continue
+                for n in range(PREFIX_MIN, min(len(token), PREFIX_MAX) + 1):
+                    hits = shard['prefixes'].setdefault(token[:n], [])
+                    if not hits or hits[-1] != idx:
+                        hits.append(idx)
+    return shards
+
+
+def write_snapshot(results, output_dir=OUTPUT_DIR):
+    written = 0
+    total_bytes = 0
+    index = {'version': 1, 'generated': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+             'shardChars': SHARD_CHARS, 'prefixMin': PREFIX_MIN, 'prefixMax': PREFIX_MAX, 'types': {}}
+
+    for type, records in results.items():
+        type_dir = os.path.join(output_dir, type)
+        os.makedirs(type_dir, exist_ok=True)
+        shards = build_shards(records)
+        for key, shard in shards.items():
+            data = json.dumps(shard, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            total_bytes += len(data)
+            if write_if_changed(os.path.join(type_dir, key + '.json'), data):
+                written += 1
+        # Drop shards from earlier runs that no longer have records.
+        for name in os.listdir(type_dir):
+            if name.endswith('.json') and name[:-5] not in shards:
+                os.remove(os.path.join(type_dir, name))
+        index['types'][type] = {'records': len(records), 'shards': sorted(shards)}
+
+    # Only bump the index (and its timestamp) when a shard actually changed.
+    index_path = os.path.join(output_dir, 'index.json')
+    if written or not os.path.exists(index_path):
+        write_if_changed(index_path, json.dumps(index, indent=2).encode('utf-8'))
+    return written, total_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefetch PDDikti queries into a static sharded prefix index.")
+    parser.add_argument('--config', default=CONFIG_PATH, help="JSON {type: [queries]} (default: pddikti_snapshot.json)")
+    parser.add_argument('--out', default=OUTPUT_DIR)
+    parser.add_argument('--base-url', default=pddikti_client.BASE_URL)
+    parser.add_argument('-j', '--concurrency', type=int, default=4)
+    parser.add_argument('--details', action='store_true', help="Also fetch and embed detail responses")
+    args = parser.parse_args()
+
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    start = time.perf_counter()
+    results = asyncio.run(crawl(config, args.base_url, args.concurrency, args.details))
+    written, total_bytes = write_snapshot(results, args.out)
+    count = sum(len(r) for r in results.values())
+    print(f"{count} records, {written} shards written, {total_bytes // 1024} KB total "
+          f"in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+import os
+import json
+import threading
+import argparse
+from urllib.parse import unquote, urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pddikti_client import normalize_results
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Local stand-in for univppdikti.vercel.app that replays the captured responses:
+#
+#   api_result.json        -> /search/mahasiswa/... ({"data": [...], "count": N})
+#   univ_detail_test.json  -> console log of test_university.py, holding the
+#                             /search/university result and its /detail response
+#
+# Searches match case-insensitively on "nama"; unknown detail ids answer 404.
+# Set FAIL_FIRST to make every path fail with 503 that many times first, which
+# exercises the client's retry path.
+
+FIXTURES = {
+    'mahasiswa': os.path.join(repo_root, 'api_result.json'),
+    'university': os.path.join(repo_root, 'univ_detail_test.json'),
+}
+
+
+def _json_after(text, label):
+    # Pull the JSON value printed right after a label in a console capture.
+    idx = text.find(label)
+    if idx == -1:
+        return None
+    start = text.find('{', idx + len(label))
+    value, end = json.JSONDecoder().raw_decode(text, start)
+    return value
+
+
+def load_fixtures(fixtures=FIXTURES):
+    search = {}
+    detail = {}
+    for type, path in fixtures.items():
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        if text.lstrip().startswith(('{', '[')):
+            search[type] = normalize_results(json.loads(text))
+            detail[type] = {}
+        else:
+            first = _json_after(text, 'First Result:')
+            search[type] = [first] if first else []
+            found = _json_after(text, 'Detail Response:')
+            detail[type] = {found['id']: found} if found else {}
+    return search, detail
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    search = {}
+    detail = {}
+    fail_first = 0
+    failures = {}
+    lock = threading.Lock()
+    requests_seen = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        with self.lock:
+            type(self).requests_seen += 1
+            seen = self.failures.get(path, 0)
+            if seen < self.fail_first:
+                self.failures[path] = seen + 1
+                return self._send(503, {'error': 'stub failure'})
+
+        parts = [unquote(p) for p in path.strip('/').split('/')]
+        if len(parts) != 3:
+            return self._send(404, {'error': 'not found'})
+        action, kind, term = parts
+
+        if action == 'search':
+            rows = [r for r in self.search.get(kind, []) if term.lower() in str(r.get('nama', '')).lower()]
+            return self._send(200, {'data': rows, 'count': len(rows)})
+        if action == 'detail':
+            found = self.detail.get(kind, {}).get(term)
+            if found:
+                return self._send(200, found)
+        return self._send(404, {'error': 'not found'})
+
+
+def start_stub_server(port=0, fail_first=0, fixtures=FIXTURES):
+    # Runs in a daemon thread; returns (server, base_url). Call server.shutdown() when done.
+    search, detail = load_fixtures(fixtures)
+    handler = type('Handler', (StubHandler,), {
+        'search': search, 'detail': detail, 'fail_first': fail_first, 'failures': {},
+    })
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the captured PDDikti responses locally.")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fail-first', type=int, default=0, help="Answer 503 this many times per path first")
+    args = parser.parse_args()
+
+    server, url = start_stub_server(args.port, args.fail_first)
+    print(f"PDDikti stub listening on {url} (PDDIKTI_BASE_URL={url})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import os
+import json
+import time
+import sqlite3
+
+# On-disk LRU + TTL cache for JSON responses, shared by the API clients
+# (pddikti_client.py, bencana_feeds.py).
+#
+# One SQLite table keyed by request: a hit refreshes the entry's last use, a put
+# evicts the least recently used entries beyond max_entries, and expired entries
+# read as misses until purge_expired() drops them. path may be ':memory:'.
+
+
+class ResponseCache:
+    def __init__(self, path, ttl, max_entries):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('CREATE TABLE IF NOT EXISTS responses ('
+                        'key TEXT PRIMARY KEY, body TEXT NOT NULL, expires REAL NOT NULL, used REAL NOT NULL)')
+        self.db.execute('CREATE INDEX IF NOT EXISTS responses_used ON responses (used)')
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        now = time.time()
+        row = self.db.execute('SELECT body, expires FROM responses WHERE key = ?', (key,)).fetchone()
+        if not row or row[1] < now:
+            self.misses += 1
+            return None
+        self.db.execute('UPDATE responses SET used = ? WHERE key = ?', (now, key))
+        self.db.commit()
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key, value):
+        now = time.time()
+        self.db.execute('INSERT OR REPLACE INTO responses (key, body, expires, used) VALUES (?, ?, ?, ?)',
+                        (key, json.dumps(value), now + self.ttl, now))
+        # Least recently used entries go first once the cache is full.
+        self.db.execute('DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY used DESC LIMIT -1 OFFSET ?)',
+                        (self.max_entries,))
+        self.db.commit()
+
+    def purge_expired(self):
+        self.db.execute('DELETE FROM responses WHERE expires < ?', (time.time(),))
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,190 @@
+import os
+import io
+import re
+import json
+import base64
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from sync_manifest import Manifest, write_if_changed
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Pre-renders the site's local photos at the next/image device widths, so the
+# hosted optimizer never has to transcode them on a cold request.
+#
+#   public/_variants/<path>-<width>w.webp   one WebP per width, quality 75
+#   src/data/images.json                    {"/surakarta.webp": {"width", "height", "hash",
+#                                             "placeholder", "variants": [{"width", "src", "bytes"}]}}
+#
+# CoverImage (behind NewsImage and GalleryImage) renders an entry as a static
+# srcset through src/lib/responsiveImages.ts.
+#
+# Widths come from deviceSizes in next.config.ts. Sources are never upscaled:
+# widths above the intrinsic width are dropped and the intrinsic width itself
+# is rendered instead, or the source itself is listed when re-encoding it at
+# full size would not make it smaller. The placeholder is a PLACEHOLDER_WIDTH px
+# blurred WebP as a data URI, small enough to inline as a background image.
+#
+# A variant is skipped when .variants_manifest.json says it was written from
+# the same source hash and settings and the file is unchanged since; a source
+# whose variants are all current is not decoded at all, its manifest entry is
+# carried over as is.
+
+SOURCES = ['public/surakarta.webp', 'public/kelurahan-mojo.webp']
+GALLERY_PATH = os.path.join(repo_root, 'data', 'gallery.json')
+NEXT_CONFIG = os.path.join(repo_root, 'next.config.ts')
+OUTPUT_PATH = os.path.join(repo_root, 'src', 'data', 'images.json')
+MANIFEST_PATH = os.path.join(repo_root, '.variants_manifest.json')
+DEVICE_SIZES = [640, 750, 828, 1080, 1200]  # fallback if next.config.ts can't be read
+QUALITY = 75  # same as the optimizer (see next.config.ts)
+PLACEHOLDER_WIDTH = 16
+VARIANTS_URL = '/_variants'
+
+
+def device_sizes(config_path=NEXT_CONFIG):
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            m = re.search(r'deviceSizes:\s*\[([\d,\s]+)\]', f.read())
+    except OSError:
+        m = None
+    return sorted(int(v) for v in m.group(1).split(',') if v.strip()) if m else DEVICE_SIZES
+
+
+def source_urls(gallery_path=GALLERY_PATH):
+    # Site paths ("/surakarta.webp"); gallery entries hosted elsewhere are skipped.
+    urls = ['/' + rel[len('public/'):] for rel in SOURCES]
+    if os.path.exists(gallery_path):
+        with open(gallery_path, 'r', encoding='utf-8') as f:
+            for item in json.load(f):
+                url = item.get('imageUrl') or ''
+                if url.startswith('/') and not url.startswith('//') and url not in urls:
+                    urls.append(url)
+    return urls
+
+
+def widths_for(intrinsic, sizes):
+    widths = [w for w in sizes if w < intrinsic]
+    widths.append(min(intrinsic, max(sizes)))
+    return widths
+
+
+def variant_url(url, width):
+    return f"{VARIANTS_URL}{os.path.splitext(url)[0]}-{width}w.webp"
+
+
+def variant_fingerprint(source_hash, width):
+    params = f"{source_hash}|{width}|WEBP|{QUALITY}"
+    return hashlib.sha256(params.encode('utf-8')).hexdigest()[:16]
+
+
+def render(src_path, sizes, only=None):
+    # Worker: decode once, then resize each width from the full source.
+    # Returns (width, height, placeholder data URI, {width: webp bytes}).
+    from PIL import Image, ImageFilter
+
+    with Image.open(src_path) as img:
+        img.load()
+        mode = 'RGBA' if img.mode in ('RGBA', 'LA', 'P') else 'RGB'
+        img = img.convert(mode)
+    w, h = img.size
+
+    variants = {}
+    for width in widths_for(w, sizes):
+        if only is not None and width not in only:
+            continue
+        out = img if width == w else img.resize((width, round(h * width / w)), Image.Resampling.LANCZOS,
+                                                reducing_gap=3.0)
+        buf = io.BytesIO()
+        out.save(buf, 'WEBP', quality=QUALITY, method=6)
+        variants[width] = buf.getvalue()
+
+    tiny = img.resize((PLACEHOLDER_WIDTH, max(1, round(h * PLACEHOLDER_WIDTH / w))), Image.Resampling.BOX)
+    buf = io.BytesIO()
+    tiny.filter(ImageFilter.GaussianBlur(1)).save(buf, 'WEBP', quality=40)
+    placeholder = 'data:image/webp;base64,' + base64.b64encode(buf.getvalue()).decode('ascii')
+    return w, h, placeholder, variants
+
+
+def build(force=False, workers=None, output_path=OUTPUT_PATH):
+    sizes = device_sizes()
+    manifest = Manifest(MANIFEST_PATH)
+    previous = {}
+    if os.path.exists(output_path):
+        with open(output_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+
+    entries = {}
+    pending = []  # (url, path, source hash, widths to render or None for all)
+    for url in source_urls():
+        path = os.path.join(repo_root, 'public', url.lstrip('/'))
+        if not os.path.exists(path):
+            print(f"Missing {url}, skipped")
+            continue
+        with open(path, 'rb') as f:
+            source_hash = hashlib.sha256(f.read()).hexdigest()[:16]
+        old = previous.get(url)
+        if force or not old or old.get('hash') != source_hash:
+            pending.append((url, path, source_hash, None))
+            continue
+        stale = [v['width'] for v in old['variants'] if v['src'] != url
+                 and not manifest.is_current(os.path.join(repo_root, 'public', v['src'].lstrip('/')),
+                                            variant_fingerprint(source_hash, v['width']))]
+        if [v['width'] for v in old['variants']] != widths_for(old['width'], sizes):
+            pending.append((url, path, source_hash, None))
+        elif stale:
+            pending.append((url, path, source_hash, set(stale)))
+        else:
+            entries[url] = old
+            print(f"Up to date {url} ({len(old['variants'])} variants)")
+
+    written = 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            jobs = [pool.submit(render, path, sizes, only) for url, path, source_hash, only in pending]
+            for (url, path, source_hash, only), job in zip(pending, jobs):
+                w, h, placeholder, variants = job.result()
+                old = {v['width']: v for v in (previous.get(url) or {}).get('variants', [])}
+                entry = {'width': w, 'height': h, 'hash': source_hash, 'placeholder': placeholder, 'variants': []}
+                for width in widths_for(w, sizes):
+                    src = variant_url(url, width)
+                    target = os.path.join(repo_root, 'public', src.lstrip('/'))
+                    if width in variants and width == w and path.endswith('.webp') \
+                            and len(variants[width]) >= os.path.getsize(path):
+                        # Re-encoding didn't beat the source at full size: serve the source.
+                        src, size = url, os.path.getsize(path)
+                    elif width in variants:
+                        os.makedirs(os.path.dirname(target), exist_ok=True)
+                        data = variants[width]
+                        written += write_if_changed(target, data)
+                        manifest.record(target, data, variant_fingerprint(source_hash, width))
+                        size = len(data)
+                    else:
+                        src, size = old[width]['src'], old[width]['bytes']
+                    entry['variants'].append({'width': width, 'src': src, 'bytes': size})
+                entries[url] = entry
+                print(f"Rendered {url} ({w}x{h}) -> {', '.join(str(width) for width in sorted(variants))}")
+
+    # Keep source order stable so the output only changes when an image does.
+    ordered = {url: entries[url] for url in source_urls() if url in entries}
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    changed = write_if_changed(output_path, (json.dumps(ordered, indent=2) + '\n').encode('utf-8'))
+    manifest.save()
+    return {'images': len(ordered), 'rendered': len(pending), 'written': written, 'manifest_changed': changed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render responsive WebP variants and the image manifest.")
+    parser.add_argument('-f', '--force', action='store_true', help="Re-render every variant")
+    parser.add_argument('-j', '--workers', type=int, default=None)
+    parser.add_argument('--out', default=OUTPUT_PATH)
+    args = parser.parse_args()
+
+    result = build(args.force, args.workers, args.out)
+    print(f"{result['images']} images, {result['rendered']} re-rendered, {result['written']} variant files written"
+          f"{', manifest updated' if result['manifest_changed'] else ''}")
+
+
+if __name__ == '__main__':
+    main()
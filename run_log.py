@@ -0,0 +1,99 @@
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Per-stage measurements for the maintenance scripts, appended as one JSON line
+# per run to .cache/runs.jsonl:
+#
+#   {"command", "argv", "started", "wall_s", "status",
+#    "stages": [{"name", "wall_s", "read_bytes", "write_bytes",
+#                "peak_rss_kb", "children_peak_rss_kb", "python_peak_kb"}]}
+#
+# Bytes are the process's read()/write() totals from /proc/self/io (so they
+# include terminal output, and are null where /proc isn't available); work done
+# in pool workers shows up in children_peak_rss_kb but not in the byte counts.
+# peak_rss_kb is the process high-water mark at the end of the stage.
+# python_peak_kb is the stage's own peak of Python allocations and is only
+# filled in with trace_memory, since tracemalloc slows allocation-heavy code.
+
+RUN_LOG_PATH = os.path.join(repo_root, '.cache', 'runs.jsonl')
+
+
+def _io_counters():
+    try:
+        with open('/proc/self/io', 'r') as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line)
+        return int(fields['rchar']), int(fields['wchar'])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _peak_rss_kb(who='self'):
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who == 'self' else resource.RUSAGE_CHILDREN)
+    # ru_maxrss is in KB on Linux, bytes on macOS.
+    return usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+
+
+class RunLog:
+    def __init__(self, command, argv=None, path=RUN_LOG_PATH, trace_memory=False):
+        self.command = command
+        self.argv = list(sys.argv[1:] if argv is None else argv)
+        self.path = path
+        self.trace_memory = trace_memory
+        self.stages = []
+        self.started = datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z')
+        self.start = time.perf_counter()
+        if trace_memory:
+            import tracemalloc
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name):
+        io_before = _io_counters()
+        if self.trace_memory:
+            import tracemalloc
+            tracemalloc.reset_peak()
+        record = {'name': name}
+        start = time.perf_counter()
+        try:
+            yield record  # callers may add their own fields
+        finally:
+            record['wall_s'] = round(time.perf_counter() - start, 4)
+            io_after = _io_counters()
+            record['read_bytes'] = io_after[0] - io_before[0] if io_before and io_after else None
+            record['write_bytes'] = io_after[1] - io_before[1] if io_before and io_after else None
+            record['peak_rss_kb'] = _peak_rss_kb()
+            record['children_peak_rss_kb'] = _peak_rss_kb('children')
+            if self.trace_memory:
+                import tracemalloc
+                record['python_peak_kb'] = tracemalloc.get_traced_memory()[1] // 1024
+            else:
+                record['python_peak_kb'] = None
+            self.stages.append(record)
+
+    def finish(self, status=0):
+        entry = {'command': self.command, 'argv': self.argv, 'started': self.started,
+                 'wall_s': round(time.perf_counter() - self.start, 4), 'status': status, 'stages': self.stages}
+        if self.path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+        return entry
+
+    def summary(self):
+        lines = []
+        for s in self.stages:
+            io = '' if s['read_bytes'] is None else f"  read {s['read_bytes'] / 1024:.1f} KB, wrote {s['write_bytes'] / 1024:.1f} KB"
+            rss = '' if s['peak_rss_kb'] is None else f"  peak {s['peak_rss_kb'] / 1024:.1f} MB"
+            py = '' if s['python_peak_kb'] is None else f" (python {s['python_peak_kb'] / 1024:.1f} MB)"
+            lines.append(f"  {s['name']:<22} {s['wall_s'] * 1000:>9.1f} ms{io}{rss}{py}")
+        return '\n'.join(lines)
@@ -0,0 +1,182 @@
+import os
+import re
+import json
+import html
+import time
+import argparse
+
+from articles_index import ARTICLES_DIR, ArticlesIndex, DEFAULT_PAGE, load_split_articles
+from sync_manifest import write_if_changed
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Build-time search index over the published posts in data/content.json and the
+# internal articles (src/data/articles/ once split, else INTERNAL_ARTICLES in
+# berita/[slug]/page.tsx).
+#
+# Text is lowercased, stripped of HTML, split into words, filtered through an
+# Indonesian stopword list and reduced with a light affix stemmer (particles,
+# possessives, -kan/-an/-i, and the common di-/me-/pe-/ber-/ter- prefixes; the
+# bare ke-/se-/be-/te- only together with a suffix).
+# The output is two static files under public/data/search/:
+#
+#   index.json      {"docs": [slug, ...], "terms": {stem: [doc ids, delta-encoded]}}
+#   summaries.json  {slug: {title, date, image, excerpt, source}}
+#
+# so listing and search can work from summaries and postings instead of scanning
+# every article body.
+
+CONTENT_PATH = os.path.join(repo_root, 'data', 'content.json')
+OUTPUT_DIR = os.path.join(repo_root, 'public', 'data', 'search')
+EXCERPT_CHARS = 200
+MIN_STEM = 3
+
+STOPWORDS = frozenset('''
+ada adalah adanya agar akan aku anda antara apa apakah atas atau bagai bagaimana bagi bahkan bahwa banyak
+baru beberapa begitu belum berbagai bisa boleh bukan cukup dalam dan dapat dari daripada demikian dengan di
+dia hal hanya harus hingga ia ini itu jadi jika juga kalau kami kamu karena ke kecuali kembali kemudian
+kepada ketika kita lagi lain lalu lebih maka mana masih mereka meski mungkin namun oleh pada para per
+perlu pula saat saja sama sambil sampai sangat satu saya sebagai sebelum sebuah secara sedang sehingga
+sejak sekali selain selalu semua seperti serta setelah setiap siapa sini situ suatu sudah supaya tanpa
+telah tentang tersebut tetapi tidak untuk waktu yaitu yakni yang
+'''.split())
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_PARTICLES = ('lah', 'kah', 'tah', 'pun')
+_POSSESSIVES = ('nya', 'ku', 'mu')
+_SUFFIXES = ('kan', 'an', 'i')
+_PREFIXES = ('meng', 'meny', 'mem', 'men', 'me', 'peng', 'peny', 'pem', 'pen', 'pe',
+             'ber', 'be', 'ter', 'te', 'di', 'ke', 'se')
+# Too common as plain word starts (sejarah, kertas, besar, tempat): only taken
+# as part of a confix, i.e. when a suffix came off too (keamanan, sebaiknya).
+_CONFIX_PREFIXES = frozenset(('be', 'te', 'ke', 'se'))
+
+
+def strip_html(text):
+    return html.unescape(_TAG_RE.sub(' ', text or ''))
+
+
+def stem(word):
+    # Deliberately conservative: an affix is only removed when at least MIN_STEM
+    # characters remain, which keeps place names like "Surakarta" intact.
+    if word.isdigit():
+        return word
+    suffixed = False
+    for group in (_PARTICLES, _POSSESSIVES, _SUFFIXES):
+        for affix in group:
+            if word.endswith(affix) and len(word) - len(affix) >= MIN_STEM + 1:
+                word = word[:-len(affix)]
+                suffixed = True
+                break
+    for prefix in _PREFIXES:
+        if prefix in _CONFIX_PREFIXES and not suffixed:
+            continue
+        if word.startswith(prefix) and len(word) - len(prefix) >= MIN_STEM + 1:
+            word = word[len(prefix):]
+            break
+    return word
+
+
+def tokenize(text):
+    for word in _WORD_RE.findall(text.lower()):
+        if len(word) < 2 or word in STOPWORDS:
+            continue
+        yield stem(word)
+
+
+def excerpt(text, limit=EXCERPT_CHARS):
+    text = ' '.join(text.split())
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(' ', 1)[0] + '...'
+
+
+def load_documents(content_path=CONTENT_PATH, page_path=DEFAULT_PAGE):
+    docs = []
+
+    if os.path.exists(os.path.join(ARTICLES_DIR, 'index.json')):
+        articles = load_split_articles()
+    else:
+        with open(page_path, 'r', encoding='utf-8') as f:
+            index = ArticlesIndex(f.read())
+        articles = {slug: index.fields(slug) for slug in index.order}
+    for slug, fields in articles.items():
+        body = fields.get('body') or ''
+        docs.append({'slug': slug, 'source': 'internal', 'title': fields.get('title') or slug,
+                     'date': fields.get('date'), 'image': fields.get('image'), 'text': strip_html(body)})
+
+    if os.path.exists(content_path):
+        with open(content_path, 'r', encoding='utf-8') as f:
+            posts = json.load(f)
+        for post in posts:
+            if post.get('status', 'published') != 'published' or not post.get('slug'):
+                continue
+            docs.append({'slug': post['slug'], 'source': 'post', 'title': post.get('title') or post['slug'],
+                         'date': post.get('date') or post.get('createdAt'), 'image': post.get('image'),
+                         'text': strip_html(post.get('content'))})
+    return docs
+
+
+def build_index(docs):
+    postings = {}
+    for doc_id, doc in enumerate(docs):
+        for term in set(tokenize(doc['title'] + ' ' + doc['text'])):
+            postings.setdefault(term, []).append(doc_id)
+
+    terms = {}
+    for term in sorted(postings):
+        ids = postings[term]
+        terms[term] = [ids[0]] + [b - a for a, b in zip(ids, ids[1:])]
+    return {'version': 1, 'docs': [doc['slug'] for doc in docs], 'terms': terms}
+
+
+def build_summaries(docs):
+    return {doc['slug']: {'title': doc['title'], 'date': doc['date'], 'image': doc['image'],
+                          'excerpt': excerpt(doc['text']), 'source': doc['source']}
+            for doc in docs}
+
+
+def search(index, query):
+    # Reference lookup for -q and for checking the index by hand. Nothing under
+    # src/ reads public/data/search/ yet; the site's search still filters in
+    # the browser.
+    result = None
+    for term in set(tokenize(query)):
+        ids = set()
+        total = 0
+        for delta in index['terms'].get(term, []):
+            total += delta
+            ids.add(total)
+        result = ids if result is None else result & ids
+    return [index['docs'][i] for i in sorted(result or [])]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the static search index and summaries for posts and internal articles.")
+    parser.add_argument('--out', default=OUTPUT_DIR)
+    parser.add_argument('-q', '--query', help="Run a query against the freshly built index")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    docs = load_documents()
+    index = build_index(docs)
+    summaries = build_summaries(docs)
+
+    os.makedirs(args.out, exist_ok=True)
+    written = []
+    for name, data in (('index.json', index), ('summaries.json', summaries)):
+        raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if write_if_changed(os.path.join(args.out, name), raw):
+            written.append(name)
+        print(f"{name}: {len(raw) // 1024} KB")
+
+    text_bytes = sum(len(doc['text'].encode('utf-8')) for doc in docs)
+    print(f"{len(docs)} documents ({text_bytes // 1024} KB of text), {len(index['terms'])} terms, "
+          f"{len(written)} files written in {(time.perf_counter() - start) * 1000:.0f} ms")
+    if args.query:
+        print(f"'{args.query}': {search(index, args.query)}")
+
+
+if __name__ == '__main__':
+    main()
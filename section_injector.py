@@ -0,0 +1,196 @@
+import os
+import re
+import glob
+import hashlib
+import argparse
+import tempfile
+
+# Streaming, marker-based section injector.
+#
+# Named sections live in the target between comment markers:
+#
+#     <!-- section:NAME -->
+#     ...fragment...
+#     <!-- /section:NAME -->
+#
+# The target is streamed line by line through a small state machine, so memory
+# stays bounded by the longest line. A marked section is replaced in place, so
+# re-running never appends a duplicate. Sections not present yet are inserted
+# before the first line containing the anchor (if given), and a legacy block can
+# be adopted by giving its start and end markers: everything from the start line
+# up to (not including) the end line is replaced, section markers included.
+#
+# A fragment directory may list its section names, one per line, in an .order
+# file; fragments are spliced in that order, so file names need not encode it.
+
+BEGIN_RE = re.compile(r"<!--\s*section:([\w.-]+)\s*-->")
+END_RE = re.compile(r"<!--\s*/section:([\w.-]+)\s*-->")
+
+ORDER_NAME = ".order"
+
+OUTSIDE, IN_MARKED, IN_LEGACY = range(3)
+
+
+def load_fragment_dir(directory, pattern="*.html"):
+    # The name without the extension is the section name. Fragments follow the
+    # .order file if there is one, then file name order.
+    found = {}
+    for path in sorted(glob.glob(os.path.join(directory, pattern))):
+        found[os.path.splitext(os.path.basename(path))[0]] = path
+    order_path = os.path.join(directory, ORDER_NAME)
+    order = []
+    if os.path.exists(order_path):
+        with open(order_path, "r", encoding="utf-8") as f:
+            order = [line.strip() for line in f if line.strip()]
+    sections = {name: found[name] for name in order if name in found}
+    sections.update((name, path) for name, path in found.items() if name not in sections)
+    return sections
+
+
+def _newline_of(line):
+    if line.endswith("\r\n"):
+        return "\r\n"
+    return "\n"
+
+
+def _emit_section(out, name, path, indent, newline):
+    out(f"{indent}<!-- section:{name} -->{newline}")
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            out(line.rstrip("\r\n") + newline)
+    out(f"{indent}<!-- /section:{name} -->{newline}")
+
+
+def inject(target, sections, anchor=None, legacy=None, dry_run=False, label=None):
+    # sections: {name: fragment_path}; legacy: {name: (start_marker, end_marker)}
+    # where the end marker line itself is kept; label names the target in
+    # errors (when target is a working copy). Returns (changed, stats).
+    label = label or target
+    legacy = legacy or {}
+    done = set()
+    stats = {"replaced": [], "inserted": [], "dropped": []}
+
+    directory = os.path.dirname(os.path.abspath(target))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    old_hash = hashlib.sha256()
+    new_hash = hashlib.sha256()
+
+    try:
+        with open(target, "r", encoding="utf-8", newline="") as src, \
+                os.fdopen(fd, "w", encoding="utf-8", newline="") as dst:
+
+            def out(text):
+                new_hash.update(text.encode("utf-8"))
+                dst.write(text)
+
+            state = OUTSIDE
+            current = None
+            pending_blank = []
+            newline = "\n"
+
+            for line in src:
+                old_hash.update(line.encode("utf-8"))
+                newline = _newline_of(line)
+                indent = line[:len(line) - len(line.lstrip())]
+
+                if state == IN_MARKED:
+                    m = END_RE.search(line)
+                    if m and m.group(1) == current:
+                        state = OUTSIDE
+                    continue
+
+                if state == IN_LEGACY:
+                    if legacy[current][1] in line:
+                        # The blank lines before the end marker are kept, after
+                        # any sections inserted at it.
+                        state = OUTSIDE
+                    elif not line.strip():
+                        pending_blank.append(line)
+                        continue
+                    else:
+                        pending_blank = []
+                        continue
+
+                if state == OUTSIDE:
+                    trailing, pending_blank = pending_blank, []
+                    legacy_name = next((name for name, (start, _) in legacy.items()
+                                        if name not in done and start in line), None)
+                    if legacy_name:
+                        current = legacy_name
+                        state = IN_LEGACY
+                        for blank in trailing:
+                            out(blank)
+                        _emit_section(out, current, sections[current], indent, newline)
+                        stats["replaced"].append(current)
+                        done.add(current)
+                        continue
+
+                    m = BEGIN_RE.search(line)
+                    if m and m.group(1) in sections:
+                        current = m.group(1)
+                        state = IN_MARKED
+                        for blank in trailing:
+                            out(blank)
+                        if current in done:
+                            # Already written at the anchor earlier in this pass.
+                            stats["dropped"].append(current)
+                        else:
+                            _emit_section(out, current, sections[current], indent, newline)
+                            stats["replaced"].append(current)
+                            done.add(current)
+                        continue
+
+                    if anchor and anchor in line:
+                        missing = [name for name in sections if name not in done]
+                        for name in missing:
+                            _emit_section(out, name, sections[name], indent, newline)
+                            stats["inserted"].append(name)
+                            done.add(name)
+                        if missing and not trailing:
+                            out(newline)
+
+                    for blank in trailing:
+                        out(blank)
+                    out(line)
+
+            if state != OUTSIDE:
+                raise ValueError(f"Section '{current}' is not terminated in {label}")
+
+        missing = [name for name in sections if name not in done]
+        if missing:
+            raise ValueError(f"No marker or anchor found in {label} for sections: {', '.join(missing)}")
+
+        changed = old_hash.digest() != new_hash.digest()
+        if changed and not dry_run:
+            os.chmod(tmp_path, os.stat(target).st_mode & 0o777)
+            os.replace(tmp_path, target)
+        else:
+            os.remove(tmp_path)
+        return changed, stats
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Splice named HTML fragments into a file between section markers.")
+    parser.add_argument("target", help="File to patch in place")
+    parser.add_argument("fragments", help="Directory of NAME.html fragment files")
+    parser.add_argument("--anchor", help="Insert missing sections before the first line containing this text")
+    parser.add_argument("--pattern", default="*.html", help="Fragment file glob (default: *.html)")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="Report what would change without writing")
+    args = parser.parse_args()
+
+    sections = load_fragment_dir(args.fragments, args.pattern)
+    if not sections:
+        print(f"Error: No fragments found in {args.fragments}")
+        exit(1)
+
+    changed, stats = inject(args.target, sections, args.anchor, dry_run=args.dry_run)
+    print(f"{len(stats['replaced'])} replaced, {len(stats['inserted'])} inserted, {len(stats['dropped'])} duplicates dropped.")
+    print(f"Updated {args.target}" if changed else "No changes.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import os
+import re
+import json
+import hashlib
+import argparse
+
+from articles_index import load_split_articles
+from sync_manifest import write_if_changed
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+# Pre-renders the social profile cards that src/lib/socialEmbed.ts puts in
+# place of Instagram/Facebook/TikTok/YouTube/X links, so article pages don't
+# run the link scan on every request.
+#
+#   src/data/embeds/index.json    {"version": EMBED_VERSION, "renderer": fp,
+#                                  "entries": {hash: card count}}
+#   src/data/embeds/<hash>.json   {"html": body with the cards rendered in}
+#
+# hash is the first 16 hex digits of sha256(body); renderSocialLinks() hashes
+# the body it is about to render, returns it untouched for count 0, loads
+# <hash>.json otherwise, and only falls back to processSocialLinks() for bodies
+# that aren't in the index.
+#
+# Bodies are the internal articles in src/data/articles/, exactly as
+# getInternalArticle() hands them to the page. Posts are served from Firestore,
+# which this script can't read, so they always take the processSocialLinks()
+# path; data/content.json is an old snapshot and is not used. Platform names, colours, URL patterns,
+# excluded path words and the card markup are read from socialEmbed.ts itself,
+# so there is one definition of a card; all URL patterns are joined into one
+# regex and each body is scanned once, the same way processSocialLinks() does.
+# Bump EMBED_VERSION in socialEmbed.ts when a card change can't be seen here
+# (the renderer fingerprint covers everything parsed below).
+
+SOCIAL_EMBED_TS = os.path.join(repo_root, 'src', 'lib', 'socialEmbed.ts')
+EMBEDS_DIR = os.path.join(repo_root, 'src', 'data', 'embeds')
+INDEX_NAME = 'index.json'
+
+STRING_FIELDS = ('name', 'color', 'bgColor', 'darkBgColor')
+TEMPLATE_FIELDS = {
+    '${platform.name}': 'name', '${platform.color}': 'color',
+    '${platform.bgColor}': 'bgColor', '${platform.darkBgColor}': 'darkBgColor',
+    '${platform.iconSvg}': 'iconSvg',
+}
+
+
+def body_hash(body):
+    return hashlib.sha256(body.encode('utf-8')).hexdigest()[:16]
+
+
+def _js_regex(literal):
+    # /source/flags -> Python pattern. The patterns only use escapes that mean
+    # the same in both, apart from the escaped slashes.
+    source = literal[1:literal.rindex('/')]
+    return source.replace('\\/', '/')
+
+
+class Renderer:
+    def __init__(self, ts_path=SOCIAL_EMBED_TS):
+        with open(ts_path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        self.fingerprint = hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+
+        version = re.search(r'export const EMBED_VERSION = (\d+);', source)
+        if not version:
+            raise ValueError(f"EMBED_VERSION not found in {ts_path}")
+        self.version = int(version.group(1))
+
+        table = source[source.index('const PLATFORMS'):source.index('export function processSocialLinks')]
+        self.platforms = []
+        for block in re.split(r'\n    \{\n', table)[1:]:
+            platform = {}
+            for field in STRING_FIELDS:
+                platform[field] = re.search(rf"^        {field}: '([^']*)',", block, re.M).group(1)
+            platform['iconSvg'] = re.search(r'^        iconSvg: `([^`]*)`,', block, re.M).group(1)
+            patterns = re.search(r'\n        patterns: \[(.*?)\n        \],', block, re.S).group(1)
+            platform['patterns'] = [re.compile(_js_regex(p), re.I)
+                                    for p in re.findall(r'^\s*(/.+/[a-z]*),\s*$', patterns, re.M)]
+            excluded = re.search(r'!\[([^\]]*)\]\.includes', block)
+            platform['excluded'] = set(re.findall(r"'([^']*)'", excluded.group(1))) if excluded else set()
+            self.platforms.append(platform)
+        if not self.platforms:
+            raise ValueError(f"No platforms found in {ts_path}")
+
+        card = source[source.index('function generateCard'):]
+        self.template = re.search(r'return `(.*?)`;', card, re.S).group(1)
+
+        # One named group per platform, as urlSource() builds them.
+        def url(prefix):
+            return '|'.join(f"(?P<{prefix}{i}>{'|'.join(f'(?:{p.pattern})' for p in platform['patterns'])})"
+                            for i, platform in enumerate(self.platforms))
+
+        # Fixed-width lookbehinds: Python can't alternate them inside one.
+        self.link_re = re.compile(
+            rf"""<a[^>]*href=["'](?P<tag>{url('t')})["'][^>]*>.*?</a>"""
+            rf"""|(?<!href=")(?<!href=')(?<!src=")(?<!src=')(?P<bare>(?:{url('b')})[^\s<"]*)""",
+            re.I)
+
+    def card(self, platform, matched, url):
+        # Card html for a profile link; None for anything else (posts, reels,
+        # share links...), which is left as it was. matched is the part of url
+        # the platform's patterns matched; the username comes from it.
+        for pattern in platform['patterns']:
+            match = pattern.match(matched)
+            if not match:
+                continue
+            username = match.group(match.re.groups)
+            if username in platform['excluded']:
+                return None
+            html = self.template
+            for placeholder, field in TEMPLATE_FIELDS.items():
+                html = html.replace(placeholder, platform[field])
+            return (html.replace('${originalUrl}', url)
+                        .replace('${cleanUrl}', url.split('?')[0])
+                        .replace('${username}', username))
+        return None
+
+    def render(self, body):
+        # -> (html, card count)
+        count = 0
+
+        def replace(match):
+            nonlocal count
+            prefix = 't' if match.group('tag') is not None else 'b'
+            i = next(i for i in range(len(self.platforms)) if match.group(f'{prefix}{i}') is not None)
+            html = self.card(self.platforms[i], match.group(f'{prefix}{i}'), match.group('tag') or match.group('bare'))
+            if html is None:
+                return match.group(0)
+            count += 1
+            return html
+
+        return self.link_re.sub(replace, body), count
+
+
+def load_bodies():
+    # Every HTML body the article page passes to renderSocialLinks() that is
+    # known at build time.
+    bodies = []
+    for article in load_split_articles().values():
+        if isinstance(article.get('body'), str):
+            bodies.append(article['body'])
+    return bodies
+
+
+def build(force=False, embeds_dir=EMBEDS_DIR):
+    renderer = Renderer()
+    index_path = os.path.join(embeds_dir, INDEX_NAME)
+    previous = {}
+    if not force and os.path.exists(index_path):
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') == renderer.version and index.get('renderer') == renderer.fingerprint:
+            previous = index.get('entries', {})
+
+    os.makedirs(embeds_dir, exist_ok=True)
+    entries, rendered, written = {}, 0, 0
+    for body in load_bodies():
+        key = body_hash(body)
+        if key in entries:
+            continue
+        if key in previous and (previous[key] == 0 or os.path.exists(os.path.join(embeds_dir, key + '.json'))):
+            entries[key] = previous[key]
+            continue
+        html, count = renderer.render(body)
+        rendered += 1
+        entries[key] = count
+        if count:
+            data = json.dumps({'html': html}, ensure_ascii=False).encode('utf-8')
+            written += write_if_changed(os.path.join(embeds_dir, key + '.json'), data)
+
+    removed = 0
+    for name in os.listdir(embeds_dir):
+        key, ext = os.path.splitext(name)
+        if ext == '.json' and name != INDEX_NAME and not entries.get(key):
+            os.remove(os.path.join(embeds_dir, name))
+            removed += 1
+
+    index = {'version': renderer.version, 'renderer': renderer.fingerprint,
+             'entries': dict(sorted(entries.items()))}
+    write_if_changed(index_path, (json.dumps(index, indent=2) + '\n').encode('utf-8'))
+    cards = sum(entries.values())
+    print(f"{len(entries)} bodies, {cards} cards in {sum(1 for c in entries.values() if c)} bodies; "
+          f"rendered {rendered}, wrote {written}, removed {removed}")
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render social link cards for article bodies.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('build', help="Refresh src/data/embeds/ from the internal articles")
+    p.add_argument('-f', '--force', action='store_true', help="Re-render every body")
+    p = sub.add_parser('render', help="Print one HTML file with its cards rendered")
+    p.add_argument('file')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        build(force=args.force)
+    else:
+        with open(args.file, 'r', encoding='utf-8') as f:
+            body = f.read()
+        html, count = Renderer().render(body)
+        print(html)
+        print(f"<!-- {count} cards, key {body_hash(body)} -->")
+
+
+if __name__ == '__main__':
+    main()
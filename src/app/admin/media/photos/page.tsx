@@ -96,6 +96,7 @@ function MediaPageContent() {
         setIsSubmitting(true);
         const formData = new FormData();
         formData.append('file', file);
+        formData.append('scope', 'gallery');
 
         try {
             const res = await fetch('/api/upload', {
@@ -108,6 +109,8 @@ function MediaPageContent() {
                 setImageUrl(data.url);
                 setPublicId(data.public_id || ''); // Save the public_id
                 showToast('Foto berhasil diunggah', 'success');
+            } else if (res.status === 409) {
+                showToast('Foto serupa sudah ada di galeri', 'error');
             } else {
                 showToast('Upload gagal', 'error');
             }
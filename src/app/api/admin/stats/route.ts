@@ -22,26 +22,40 @@ export async function GET(req: NextRequest) {
             const year = new Date().getFullYear();
             const months = ['Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 'Jul', 'Agust', 'Sep', 'Okt', 'Nov', 'Des'];
 
-            // Optimization: Fetch all days of the year in one go to aggregate (ensures sync with daily data)
-            // Generate all daily keys for the current year
+            // Completed months come from the series the rollup worker
+            // (visitor_stats.py) stores under stats:series:yearly:<year> once
+            // they are in stats:rollup:months; the current month, and any month
+            // the worker hasn't rolled up yet, is summed from its daily keys.
+            const currentMonth = new Date().getMonth();
+            const [storedSeries, rolledUpMonths] = await Promise.all([
+                redis.get<{ visitors: number }[] | string>(`stats:series:yearly:${year}`),
+                redis.smembers('stats:rollup:months'),
+            ]);
+            const precomputed = typeof storedSeries === 'string' ? JSON.parse(storedSeries) : storedSeries;
+            const rolledUp = new Set(rolledUpMonths);
+
+            const monthlyTotals = new Array(12).fill(0);
             const keys = [];
             const keyToMonthMap = new Map<string, number>(); // Map "YYYY-MM-DD" -> monthIndex (0-11)
 
-            for (let m = 0; m < 12; m++) {
+            for (let m = 0; m <= currentMonth; m++) {
+                const month = `${year}-${String(m + 1).padStart(2, '0')}`;
+                if (m < currentMonth && rolledUp.has(month) && precomputed?.[m]) {
+                    monthlyTotals[m] = Number(precomputed[m].visitors) || 0;
+                    continue;
+                }
                 const daysInMonth = new Date(year, m + 1, 0).getDate();
                 for (let d = 1; d <= daysInMonth; d++) {
-                    const dateStr = `${year}-${String(m + 1).padStart(2, '0')}-${String(d).padStart(2, '0')}`;
-                    keys.push(`stats:visits:daily:${dateStr}`);
-                    keyToMonthMap.set(`stats:visits:daily:${dateStr}`, m);
+                    const key = `stats:visits:daily:${month}-${String(d).padStart(2, '0')}`;
+                    keys.push(key);
+                    keyToMonthMap.set(key, m);
                 }
             }
 
-            // Batch fetch all daily stats for the year
-            // Use mget for efficiency (Upstash/Redis handles hundreds of keys fine)
-            const values = await redis.mget<number[]>(...keys);
+            // Batch fetch the daily stats still needed (usually just this month's)
+            const values = keys.length ? await redis.mget<number[]>(...keys) : [];
 
             // Aggregate values by month
-            const monthlyTotals = new Array(12).fill(0);
             keys.forEach((key, index) => {
                 const val = values[index];
                 if (val) {
@@ -6,10 +6,54 @@ import { uploadToCloudinary } from '@/lib/cloudinary';
 // Image extensions that should be converted to WebP
 const IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.avif'];
 
+// Near-duplicate check for gallery uploads (image_dedup.py serve): checked
+// before upload, registered after it. Optional: when unset, slow or down,
+// uploads go through as before.
+const IMAGE_DEDUP_URL = process.env.IMAGE_DEDUP_URL;
+const DEDUP_TIMEOUT_MS = 500;
+
+interface DuplicateMatch {
+    path: string;
+    dhash_distance: number;
+    phash_distance: number;
+}
+
+async function findDuplicates(buffer: Buffer): Promise<DuplicateMatch[]> {
+    if (!IMAGE_DEDUP_URL) return [];
+    try {
+        const res = await fetch(`${IMAGE_DEDUP_URL.replace(/\/$/, '')}/check`, {
+            method: 'POST',
+            body: new Uint8Array(buffer),
+            signal: AbortSignal.timeout(DEDUP_TIMEOUT_MS),
+        });
+        if (!res.ok) return [];
+        const result = await res.json();
+        return result.duplicate ? result.matches : [];
+    } catch (error) {
+        console.warn('Duplicate check skipped:', error);
+        return [];
+    }
+}
+
+async function registerUpload(buffer: Buffer, url: string): Promise<void> {
+    if (!IMAGE_DEDUP_URL) return;
+    try {
+        await fetch(`${IMAGE_DEDUP_URL.replace(/\/$/, '')}/add?key=${encodeURIComponent(url)}`, {
+            method: 'POST',
+            body: new Uint8Array(buffer),
+            signal: AbortSignal.timeout(DEDUP_TIMEOUT_MS),
+        });
+    } catch (error) {
+        console.warn('Duplicate index not updated:', error);
+    }
+}
+
 export async function POST(request: Request) {
     try {
         const formData = await request.formData();
         const file = formData.get('file') as File;
+        // Proker and media uploads share this route; only the gallery is deduplicated.
+        const isGallery = formData.get('scope') === 'gallery';
 
         if (!file) {
             return NextResponse.json({ error: 'No file uploaded' }, { status: 400 });
@@ -18,12 +62,24 @@ export async function POST(request: Request) {
         const bytes = await file.arrayBuffer();
         // eslint-disable-next-line @typescript-eslint/no-explicit-any
         let buffer: any = Buffer.from(bytes);
+        const original = buffer as Buffer;
 
         const ext = path.extname(file.name).toLowerCase();
 
         // Check if the file is an image that should be converted
         const isImage = IMAGE_EXTENSIONS.includes(ext);
 
+        if (isGallery && (isImage || ext === '.webp')) {
+            // Hash the original: perceptual hashes don't care about size or quality.
+            const duplicates = await findDuplicates(buffer);
+            if (duplicates.length > 0) {
+                return NextResponse.json(
+                    { error: 'A near-identical image is already in the gallery', duplicates },
+                    { status: 409 }
+                );
+            }
+        }
+
         if (isImage) {
             // Convert to WebP with iterative compression to ensure < 100KB
             // Step 1: Resize to max 1200px (good enough for web display)
@@ -61,6 +117,10 @@ export async function POST(request: Request) {
         // Upload to Cloudinary explicitly providing the 'karangtaruna' folder
         const cloudinaryResult = await uploadToCloudinary(buffer, 'karangtaruna');
 
+        if (isGallery && (isImage || ext === '.webp')) {
+            await registerUpload(original, cloudinaryResult.url);
+        }
+
         // Return the secure URL and the public_id for future deletion
         return NextResponse.json({
             success: true,
@@ -5,7 +5,6 @@ import NewsImage from "@/components/NewsImage";
 import Pagination from "@/components/Pagination";
 import { adminDb } from '@/lib/firebase-admin';
 import type { Metadata } from 'next';
-import { INTERNAL_ARTICLES } from "@/app/berita/[slug]/page";
 
 export const revalidate = 60; // ISR: regenerate every 60 seconds
 
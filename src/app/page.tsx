@@ -2,7 +2,7 @@
 import Link from "next/link";
 import { ArrowRight, Calendar, Users, MapPin, Award, CheckCircle, Clock, User, ChevronRight } from "lucide-react";
 import NewsImage from "@/components/NewsImage";
-import { INTERNAL_ARTICLES } from "@/app/berita/[slug]/page";
+import { INTERNAL_ARTICLE_LIST, internalArticleDate } from "@/lib/internalArticles";
 
 
 import GalleryImage from '@/components/GalleryImage';
@@ -175,12 +175,12 @@ export default async function Home() {
   ];
 
   // Use dynamic news if available, otherwise fallback to static for demo
-  const displayNews = internalNews.length > 0 ? internalNews : Object.entries(INTERNAL_ARTICLES).map(([slug, article]) => ({
-    id: slug,
+  const displayNews = internalNews.length > 0 ? internalNews : INTERNAL_ARTICLE_LIST.map((article) => ({
+    id: article.slug,
     title: article.title,
-    slug: slug,
+    slug: article.slug,
     image: article.image,
-    date: article.date,
+    date: internalArticleDate(article.date),
     status: 'published'
   }));
 
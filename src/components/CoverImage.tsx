@@ -0,0 +1,67 @@
+'use client';
+
+import { useState } from 'react';
+import Image from 'next/image';
+import { getResponsiveImage, responsiveSrcSet } from '@/lib/responsiveImages';
+
+interface CoverImageProps {
+    src: string;
+    alt: string;
+    fallbackSrc: string;
+    className?: string;
+}
+
+const SIZES = "(max-width: 768px) 100vw, (max-width: 1200px) 50vw, 400px";
+
+/**
+ * CoverImage — covers its parent container, shared by NewsImage and GalleryImage.
+ * Local photos with pre-rendered variants (src/data/images.json) get a static
+ * srcset and skip the optimizer entirely; everything else goes through
+ * next/image fill mode. Parent must have `position: relative` and explicit height.
+ */
+export default function CoverImage({ src, alt, fallbackSrc, className }: CoverImageProps) {
+    const [imgSrc, setImgSrc] = useState(src || fallbackSrc);
+    const [hasError, setHasError] = useState(false);
+    const prerendered = hasError ? null : getResponsiveImage(imgSrc);
+
+    if (prerendered) {
+        const largest = prerendered.variants[prerendered.variants.length - 1];
+        return (
+            // eslint-disable-next-line @next/next/no-img-element
+            <img
+                src={largest.src}
+                srcSet={responsiveSrcSet(prerendered)}
+                sizes={SIZES}
+                width={prerendered.width}
+                height={prerendered.height}
+                alt={alt}
+                className={`absolute inset-0 w-full h-full object-cover ${className || ''}`}
+                style={{ backgroundImage: `url(${prerendered.placeholder})`, backgroundSize: 'cover' }}
+                loading="lazy"
+                decoding="async"
+                onError={() => {
+                    setImgSrc(fallbackSrc);
+                    setHasError(true);
+                }}
+            />
+        );
+    }
+
+    return (
+        <Image
+            src={hasError ? fallbackSrc : imgSrc}
+            alt={alt}
+            className={`object-cover ${className || ''}`}
+            fill
+            quality={75}
+            loading="lazy"
+            sizes={SIZES}
+            onError={() => {
+                if (!hasError) {
+                    setImgSrc(fallbackSrc);
+                    setHasError(true);
+                }
+            }}
+        />
+    );
+}
@@ -1,7 +1,6 @@
 'use client';
 
-import { useState } from 'react';
-import Image from 'next/image';
+import CoverImage from '@/components/CoverImage';
 
 interface GalleryImageProps {
     src: string;
@@ -9,30 +8,12 @@ interface GalleryImageProps {
     className?: string;
 }
 
+const FALLBACK = '/logo-kt.webp';
+
 /**
- * GalleryImage — uses next/image fill mode to perfectly cover the parent container.
+ * GalleryImage — perfectly covers the parent container (see CoverImage).
  * Parent must have `position: relative` and explicit height.
  */
 export default function GalleryImage({ src, alt, className }: GalleryImageProps) {
-    const fallback = '/logo-kt.webp';
-    const [imgSrc, setImgSrc] = useState(src || fallback);
-    const [hasError, setHasError] = useState(false);
-
-    return (
-        <Image
-            src={hasError ? fallback : imgSrc}
-            alt={alt}
-            className={`object-cover ${className || ''}`}
-            fill
-            quality={75}
-            loading="lazy"
-            sizes="(max-width: 768px) 100vw, (max-width: 1200px) 50vw, 400px"
-            onError={() => {
-                if (!hasError) {
-                    setImgSrc(fallback);
-                    setHasError(true);
-                }
-            }}
-        />
-    );
+    return <CoverImage src={src} alt={alt} fallbackSrc={FALLBACK} className={className} />;
 }
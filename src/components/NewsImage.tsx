@@ -1,7 +1,6 @@
 'use client';
 
-import { useState } from 'react';
-import Image from 'next/image';
+import CoverImage from '@/components/CoverImage';
 
 interface NewsImageProps {
     src: string;
@@ -9,30 +8,12 @@ interface NewsImageProps {
     className?: string;
 }
 
+const FALLBACK = "https://images.unsplash.com/photo-1504711434969-e33886168f5c?q=80&w=800&auto=format&fit=crop";
+
 /**
- * NewsImage — uses next/image fill mode to perfectly cover the parent container.
+ * NewsImage — perfectly covers the parent container (see CoverImage).
  * Parent must have `position: relative` and explicit height.
  */
 export default function NewsImage({ src, alt, className }: NewsImageProps) {
-    const fallback = "https://images.unsplash.com/photo-1504711434969-e33886168f5c?q=80&w=800&auto=format&fit=crop";
-    const [imgSrc, setImgSrc] = useState(src || fallback);
-    const [hasError, setHasError] = useState(false);
-
-    return (
-        <Image
-            src={hasError ? fallback : imgSrc}
-            alt={alt}
-            className={`object-cover ${className || ''}`}
-            fill
-            quality={75}
-            loading="lazy"
-            sizes="(max-width: 768px) 100vw, (max-width: 1200px) 50vw, 400px"
-            onError={() => {
-                if (!hasError) {
-                    setImgSrc(fallback);
-                    setHasError(true);
-                }
-            }}
-        />
-    );
+    return <CoverImage src={src} alt={alt} fallbackSrc={FALLBACK} className={className} />;
 }
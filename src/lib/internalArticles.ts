@@ -0,0 +1,43 @@
+/**
+ * Internal Static Articles
+ * Bodies live in src/data/articles/<slug>.json (written by articles_split.py)
+ * and are imported by slug on demand, so pages that only list titles and
+ * images pull in the small index.json manifest instead of every article body.
+ */
+
+import listing from '@/data/articles/index.json';
+
+export interface InternalArticleSummary {
+    slug: string;
+    title: string;
+    image: string;
+    date: string | null;
+    author: string;
+    excerpt: string;
+}
+
+export interface InternalArticle {
+    title: string;
+    image: string;
+    body: string | string[];
+    date: string;
+    author: string;
+    source?: string;
+    link?: string;
+    time?: string;
+}
+
+export const INTERNAL_ARTICLE_LIST = listing as InternalArticleSummary[];
+
+const INTERNAL_SLUGS = new Set(INTERNAL_ARTICLE_LIST.map((article) => article.slug));
+
+// Articles without a fixed date show today's date, as the inline literals did.
+export function internalArticleDate(date: string | null | undefined): string {
+    return date || new Date().toLocaleDateString('id-ID', { weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' });
+}
+
+export async function getInternalArticle(slug: string): Promise<InternalArticle | null> {
+    if (!INTERNAL_SLUGS.has(slug)) return null;
+    const article = (await import(`../data/articles/${slug}.json`)).default;
+    return { ...article, date: internalArticleDate(article.date) };
+}
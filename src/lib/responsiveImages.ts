@@ -0,0 +1,33 @@
+/**
+ * Pre-rendered Responsive Images
+ * src/data/images.json is written by responsive_images.py: intrinsic size, a
+ * blurred placeholder and one WebP per next.config.ts device width for each
+ * local photo, so those images can ship a static srcset instead of going
+ * through the on-demand optimizer.
+ */
+
+import manifest from '@/data/images.json';
+
+export interface ImageVariant {
+    width: number;
+    src: string;
+    bytes: number;
+}
+
+export interface ResponsiveImage {
+    width: number;
+    height: number;
+    hash: string;
+    placeholder: string;
+    variants: ImageVariant[];
+}
+
+const IMAGES = manifest as Record<string, ResponsiveImage>;
+
+export function getResponsiveImage(src: string): ResponsiveImage | null {
+    return IMAGES[src] ?? null;
+}
+
+export function responsiveSrcSet(image: ResponsiveImage): string {
+    return image.variants.map((variant) => `${variant.src} ${variant.width}w`).join(', ');
+}
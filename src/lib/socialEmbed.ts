@@ -4,6 +4,9 @@
  * with rich preview cards showing platform logo, name, and username.
  */
 
+import { createHash } from 'crypto';
+import embedIndex from '@/data/embeds/index.json';
+
 interface SocialPlatform {
     name: string;
     color: string;
@@ -109,49 +112,62 @@ const PLATFORMS: SocialPlatform[] = [
     },
 ];
 
+// Bump when a change to the cards isn't visible in this file's text (the
+// pre-rendered bodies in src/data/embeds/ are rebuilt when this file changes).
+export const EMBED_VERSION = 1;
+
+// One named group per platform (`${prefix}${index}`), so a match says which
+// platform it is; nothing else in the URL (a query string quoting another
+// profile link) can change that.
+function urlSource(prefix: string): string {
+    return PLATFORMS.map((platform, i) =>
+        `(?<${prefix}${i}>${platform.patterns.map((pattern) => `(?:${pattern.source})`).join('|')})`
+    ).join('|');
+}
+
+// Every platform pattern in one alternation: at each position a whole <a> tag
+// is tried first, then a bare URL (not preceded by href=" or src="). Cards are
+// never rescanned, so an <a> link doesn't get a second card nested inside it.
+const SOCIAL_LINK_REGEX = new RegExp(
+    `<a[^>]*href=["'](?<tagUrl>${urlSource('t')})["'][^>]*>.*?</a>|(?<!href=["']|src=["'])(?<bareUrl>(?:${urlSource('b')})[^\\s<"]*)`,
+    'gi'
+);
+
+const PRERENDERED = (embedIndex.version === EMBED_VERSION ? embedIndex.entries : {}) as Record<string, number>;
+
 /**
  * Processes HTML content and replaces standalone social media links
  * with rich preview cards.
  */
 export function processSocialLinks(html: string): string {
-    // Match <a> tags that contain a social media URL
-    // Also match bare URLs that aren't in <a> tags
-    let processed = html;
-
-    for (const platform of PLATFORMS) {
-        for (const pattern of platform.patterns) {
-            // Match <a> tags with social media links
-            const aTagRegex = new RegExp(
-                `<a[^>]*href=["'](${pattern.source})["'][^>]*>.*?</a>`,
-                'gi'
-            );
-
-            processed = processed.replace(aTagRegex, (fullMatch, url) => {
-                const username = platform.extractUsername(url);
-                if (!username) return fullMatch;
-                return generateCard(platform, username, url);
-            });
-
-            // Also match bare URLs (not already in <a> tags)
-            // Look for URLs that are not preceded by href=" or src="
-            const bareUrlRegex = new RegExp(
-                `(?<!href=["']|src=["'])(${pattern.source}[^\\s<"]*)`,
-                'gi'
-            );
+    return html.replace(SOCIAL_LINK_REGEX, (...args) => {
+        const fullMatch: string = args[0];
+        const groups: Record<string, string | undefined> = args[args.length - 1];
+        const url = (groups.tagUrl ?? groups.bareUrl) as string;
+        const prefix = groups.tagUrl !== undefined ? 't' : 'b';
+        const index = PLATFORMS.findIndex((_, i) => groups[`${prefix}${i}`] !== undefined);
+        const platform = PLATFORMS[index];
+        // Only the part the platform's pattern matched: the username must come from it.
+        const username = platform.extractUsername(groups[`${prefix}${index}`] as string);
+        if (!username) return fullMatch;
+        return generateCard(platform, username, url);
+    });
+}
 
-            processed = processed.replace(bareUrlRegex, (fullMatch, url) => {
-                // Skip if already processed (inside our card)
-                if (processed.indexOf(`data-social-card`) > -1 && fullMatch.includes('data-social-card')) {
-                    return fullMatch;
-                }
-                const username = platform.extractUsername(url);
-                if (!username) return fullMatch;
-                return generateCard(platform, username, url);
-            });
-        }
+/**
+ * processSocialLinks() for article pages: the internal article bodies seen by
+ * social_embeds.py at build time are served from src/data/embeds/ (keyed by
+ * the first 16 hex digits of their sha256). Firestore posts aren't known at
+ * build time and are always scanned.
+ */
+export async function renderSocialLinks(html: string): Promise<string> {
+    const hash = createHash('sha256').update(html).digest('hex').slice(0, 16);
+    const cards = PRERENDERED[hash];
+    if (cards === 0) return html;
+    if (cards !== undefined) {
+        return (await import(`../data/embeds/${hash}.json`)).default.html;
     }
-
-    return processed;
+    return processSocialLinks(html);
 }
 
 function generateCard(platform: SocialPlatform, username: string, originalUrl: string): string {
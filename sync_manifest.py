@@ -0,0 +1,103 @@
+import os
+import json
+import hashlib
+import tempfile
+
+# Persistent record of which rule sets have already been applied to which files.
+#
+# A file is considered current when its size and mtime still match what we wrote
+# (or last saw) and the rule set fingerprint is in its applied list, so a no-op
+# run only costs one stat() per file and never opens the file itself.
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".sync_manifest.json")
+
+
+def rules_fingerprint(rules):
+    payload = json.dumps(rules, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def atomic_write(path, data):
+    # Write to a sibling temp file and rename over the target so readers
+    # (and file watchers) never see a half-written file.
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        else:
+            # mkstemp creates 0600 files; give new files the usual umask-based mode.
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_if_changed(path, data, original=None):
+    if original is None and os.path.exists(path):
+        with open(path, "rb") as f:
+            original = f.read()
+    if original == data:
+        return False
+    atomic_write(path, data)
+    return True
+
+
+class Manifest:
+    def __init__(self, path=DEFAULT_MANIFEST):
+        self.path = path
+        self.files = {}
+        self.dirty = False
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == MANIFEST_VERSION:
+                    self.files = data.get("files", {})
+            except (OSError, ValueError):
+                # A corrupt manifest only costs us one full run.
+                self.files = {}
+
+    def _key(self, path):
+        return os.path.abspath(path)
+
+    def is_current(self, path, fingerprint):
+        entry = self.files.get(self._key(path))
+        if not entry or fingerprint not in entry.get("applied", []):
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]
+
+    def record(self, path, data, fingerprint):
+        key = self._key(path)
+        st = os.stat(path)
+        digest = hashlib.sha256(data).hexdigest()
+        entry = self.files.get(key)
+        if not entry or entry.get("sha256") != digest:
+            # Content changed under us (or by us): earlier fingerprints no longer prove anything
+            # except the one whose application produced these bytes.
+            entry = {"applied": []}
+        if fingerprint not in entry["applied"]:
+            entry["applied"].append(fingerprint)
+        entry.update({"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest})
+        self.files[key] = entry
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        data = json.dumps({"version": MANIFEST_VERSION, "files": self.files}, indent=2, sort_keys=True)
+        atomic_write(self.path, data.encode("utf-8"))
+        self.dirty = False
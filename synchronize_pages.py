@@ -1,9 +1,12 @@
 
 import os
 
+from patch_engine import patch_files, report
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
 files_to_update = [
-    r"c:/Users/rayna/Pictures/Website Karang Taruna/karang-taruna-app/src/app/page.tsx",
-    r"c:/Users/rayna/Pictures/Website Karang Taruna/karang-taruna-app/src/app/berita/page.tsx"
+    os.path.join(repo_root, "src", "app", "page.tsx"),
+    os.path.join(repo_root, "src", "app", "berita", "page.tsx"),
 ]
 
 # Mapping of old text snippets to new text
@@ -31,29 +34,15 @@ updates = [
 ]
 
 def update_file(path):
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        modified_content = content
-        changes_count = 0
-        
-        for update in updates:
-            if update["old"] in modified_content:
-                modified_content = modified_content.replace(update["old"], update["new"])
-                changes_count += 1
-            else:
-                print(f"Warning: String not found in {os.path.basename(path)}: '{update['old'][:30]}...'")
-
-        if content != modified_content:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(modified_content)
-            print(f"Updated {os.path.basename(path)} with {changes_count} changes.")
-        else:
-             print(f"No changes made to {os.path.basename(path)}.")
-             
-    except Exception as e:
-        print(f"Error updating {path}: {e}")
-
-for file_path in files_to_update:
-    update_file(file_path)
+    # Kept for callers that patch a single file; all rules are applied in one scan.
+    return patch_files([path], updates)
+
+
+def main():
+    results = patch_files(files_to_update, updates)
+    report(results, updates)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,23 @@
-import requests
 import json
 
+import pddikti_client
+
+
 def test_api():
     try:
         # 1. Search
-        url = "https://univppdikti.vercel.app/search/mahasiswa/Raynaldo"
-        print(f"Fetching {url}...")
-        response = requests.get(url)
-        data = response.json()
-        
+        print(f"Fetching {pddikti_client.BASE_URL}/search/mahasiswa/Raynaldo...")
+        data = pddikti_client.search('mahasiswa', 'Raynaldo')
+
         if data and len(data) > 0:
             first_result = data[0]
             print("First Result:")
             print(json.dumps(first_result, indent=2))
-            
+
             # 2. Get Detail
             if 'id' in first_result:
-                detail_url = f"https://univppdikti.vercel.app/detail/mahasiswa/{first_result['id']}"
-                print(f"\nFetching Detail: {detail_url}...")
-                detail_res = requests.get(detail_url)
-                detail_data = detail_res.json()
+                print(f"\nFetching Detail: {pddikti_client.BASE_URL}/detail/mahasiswa/{first_result['id']}...")
+                detail_data = pddikti_client.detail('mahasiswa', first_result['id'])
                 print("Detail Data:")
                 print(json.dumps(detail_data, indent=2))
         else:
@@ -0,0 +1,114 @@
+import json
+import base64
+import threading
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from visitor_stats import connect
+
+# Local stand-in for the Upstash Redis REST API that src/lib/redis.ts talks to.
+#
+#   POST /             ["INCR", "stats:visits:total"]        -> {"result": 1}
+#   POST /pipeline     [["INCR", ...], ["SADD", ...]]        -> [{"result": ...}, ...]
+#   POST /multi-exec   same, run in a MULTI/EXEC transaction
+#
+# Commands run against fakeredis by default (or any redis:// URL). Requests
+# need "Authorization: Bearer <token>"; when the client sends
+# "Upstash-Encoding: base64" string results are base64-encoded, as Upstash does.
+# Point the app at it with UPSTASH_REDIS_REST_URL / UPSTASH_REDIS_REST_TOKEN.
+
+DEFAULT_TOKEN = 'local-stub-token'
+
+
+def _encode(value, b64):
+    if isinstance(value, (list, tuple, set)):
+        return [_encode(v, b64) for v in value]
+    if isinstance(value, bytes):
+        value = value.decode('utf-8', 'replace')
+    if isinstance(value, str) and b64:
+        return base64.b64encode(value.encode('utf-8')).decode('ascii')
+    return value
+
+
+class UpstashHandler(BaseHTTPRequestHandler):
+    redis = None
+    token = DEFAULT_TOKEN
+    lock = threading.Lock()
+    commands_seen = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _run(self, command, b64):
+        try:
+            result = self.redis.execute_command(*[str(a) for a in command])
+            return {'result': _encode(result, b64)}
+        except Exception as e:  # Upstash reports command errors per command
+            return {'error': str(e)}
+
+    def do_POST(self):
+        if self.headers.get('Authorization') != f'Bearer {self.token}':
+            return self._send(401, {'error': 'Unauthorized'})
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b'null')
+        except ValueError:
+            return self._send(400, {'error': 'ERR failed to parse command'})
+        b64 = self.headers.get('Upstash-Encoding', '').lower() == 'base64'
+        path = self.path.split('?')[0].rstrip('/')
+
+        with self.lock:
+            type(self).commands_seen += len(body) if path else 1
+        if path == '':
+            return self._send(200, self._run(body, b64))
+        if path == '/pipeline':
+            return self._send(200, [self._run(c, b64) for c in body])
+        if path == '/multi-exec':
+            with self.lock:
+                pipe = self.redis.pipeline(transaction=True)
+                for c in body:
+                    pipe.execute_command(*[str(a) for a in c])
+                try:
+                    results = pipe.execute(raise_on_error=False)
+                except Exception as e:
+                    return self._send(200, {'error': str(e)})
+            return self._send(200, [{'error': str(r)} if isinstance(r, Exception) else {'result': _encode(r, b64)}
+                                    for r in results])
+        return self._send(404, {'error': 'not found'})
+
+
+def start_upstash_stub(port=0, redis_url='fake', token=DEFAULT_TOKEN):
+    # Runs in a daemon thread; returns (server, base_url).
+    redis = connect(redis_url)
+    redis.response_callbacks.clear()  # raw replies, as Upstash sends them ("OK", 0/1, ...)
+    handler = type('Handler', (UpstashHandler,), {'redis': redis, 'token': token})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local Upstash-compatible Redis REST endpoint.")
+    parser.add_argument('--port', type=int, default=8079)
+    parser.add_argument('--redis', default='fake', help="'fake' (in-process fakeredis) or a redis:// URL")
+    parser.add_argument('--token', default=DEFAULT_TOKEN)
+    args = parser.parse_args()
+
+    server, url = start_upstash_stub(args.port, args.redis, args.token)
+    print(f"Upstash stub listening on {url} (UPSTASH_REDIS_REST_URL={url} UPSTASH_REDIS_REST_TOKEN={args.token})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+import os
+import json
+import time
+import random
+import argparse
+from datetime import date, datetime, timedelta, timezone
+
+# Rollup worker for the visitor counters written by /api/visitor.
+#
+# The route keeps one counter per day (stats:visits:daily:<day>), one per month
+# (stats:visits:monthly:<month>) and one set of IPs per day (stats:unique:<day>),
+# and nothing ever expires. The worker:
+#
+#   - sets each completed month's counter to the sum of its daily counters (the
+#     monthly counter was added later, so the daily keys are authoritative) and
+#     deletes daily counters older than --keep-days once their month is rolled up
+#   - folds every closed day's IP set into HyperLogLogs (stats:unique:hll:<day>
+#     and stats:unique:hll:month:<month>, ~12 KB each at most) and drops the set
+#   - stores the yearly chart series /api/admin/stats builds, in the same
+#     [{label, visitors, key}] shape, under stats:series:yearly:<year>, in the
+#     same transaction that marks months as rolled up; the route takes the
+#     rolled-up months from it and only sums daily keys for the current month
+#     (and any month not rolled up yet)
+#
+# All reads and writes go through pipelines, so a rollup costs a handful of
+# round trips regardless of how many days it touches. Today's keys are never
+# modified, so the worker can run while the site is taking traffic.
+
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+KEEP_DAYS = 400  # the yearly chart still reads daily keys for the current year
+BATCH = 1000
+MONTH_LABELS = ['Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 'Jul', 'Agust', 'Sep', 'Okt', 'Nov', 'Des']
+
+DAILY = 'stats:visits:daily:'
+MONTHLY = 'stats:visits:monthly:'
+UNIQUE = 'stats:unique:'
+UNIQUE_HLL = 'stats:unique:hll:'
+UNIQUE_HLL_MONTH = 'stats:unique:hll:month:'
+SERIES_YEARLY = 'stats:series:yearly:'
+ROLLED_UP = 'stats:rollup:months'
+
+
+def connect(url=REDIS_URL):
+    # "fake" gives an in-process fakeredis server, for tests and the load generator.
+    if url == 'fake':
+        import fakeredis
+        return fakeredis.FakeRedis(decode_responses=True)
+    import redis
+    return redis.Redis.from_url(url, decode_responses=True)
+
+
+def _scan(r, prefix):
+    return sorted(k for k in r.scan_iter(match=prefix + '*', count=BATCH)
+                  if len(k) - len(prefix) in (7, 10))  # YYYY-MM or YYYY-MM-DD, skips sub-prefixes
+
+
+def _chunks(items, size=BATCH):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def rollup_months(r, today):
+    # Returns {month: total} for the completed months that were rolled up.
+    current = today.isoformat()[:7]
+    days = [k for k in _scan(r, DAILY) if k[len(DAILY):len(DAILY) + 7] < current]
+    totals = {}
+    for chunk in _chunks(days):
+        for key, value in zip(chunk, r.mget(chunk)):
+            month = key[len(DAILY):len(DAILY) + 7]
+            totals[month] = totals.get(month, 0) + int(value or 0)
+    if totals:
+        # The series goes out in the same transaction as the counters and the
+        # rolled-up set: the route reads a month from the series as soon as it
+        # is in ROLLED_UP, so the two must never disagree.
+        years = {today.year} | {int(month[:4]) for month in totals}
+        series = {year: yearly_series(r, year, today, totals) for year in years}
+        pipe = r.pipeline()
+        for month, total in totals.items():
+            pipe.set(MONTHLY + month, total)
+        pipe.sadd(ROLLED_UP, *totals)
+        for year, entries in series.items():
+            pipe.set(SERIES_YEARLY + str(year), json.dumps(entries, separators=(',', ':')))
+        pipe.execute()
+    return totals
+
+
+def compact_daily(r, today, keep_days=KEEP_DAYS):
+    # Whole months only: a month with some of its days deleted would be rolled
+    # up again from the remainder and lose visits.
+    cutoff = (today - timedelta(days=keep_days)).isoformat()[:7]
+    rolled = r.smembers(ROLLED_UP)
+    old = [k for k in _scan(r, DAILY)
+           if k[len(DAILY):len(DAILY) + 7] < cutoff and k[len(DAILY):len(DAILY) + 7] in rolled]
+    for chunk in _chunks(old):
+        r.delete(*chunk)
+    return len(old)
+
+
+def convert_uniques(r, today):
+    # Closed days only: today's set is still being written by the route.
+    days = [k for k in _scan(r, UNIQUE) if k[len(UNIQUE):] < today.isoformat()]
+    members = 0
+    for key in days:
+        day = key[len(UNIQUE):]
+        pipe = r.pipeline()
+        for chunk in _chunks(list(r.sscan_iter(key, count=BATCH))):
+            members += len(chunk)
+            pipe.pfadd(UNIQUE_HLL + day, *chunk)
+            pipe.pfadd(UNIQUE_HLL_MONTH + day[:7], *chunk)
+        pipe.delete(key)
+        pipe.execute()
+    return len(days), members
+
+
+def yearly_series(r, year, today, totals=None):
+    # Completed months come from the rolled-up monthly counters (or totals,
+    # {month: total} about to be written over them), the current month from
+    # its daily counters, matching what the route computes.
+    totals = totals or {}
+    monthly = r.mget([f'{MONTHLY}{year}-{m:02d}' for m in range(1, 13)])
+    series = []
+    for m in range(1, 13):
+        month = f'{year}-{m:02d}'
+        if month == today.isoformat()[:7]:
+            n = (date(year, m % 12 + 1, 1) if m < 12 else date(year + 1, 1, 1)) - date(year, m, 1)
+            days = r.mget([f'{DAILY}{month}-{d:02d}' for d in range(1, n.days + 1)])
+            total = sum(int(v or 0) for v in days)
+        elif month > today.isoformat()[:7]:
+            total = 0
+        else:
+            total = totals.get(month, int(monthly[m - 1] or 0))
+        series.append({'label': MONTH_LABELS[m - 1], 'visitors': total, 'key': f'{year}-{m}'})
+    return series
+
+
+def rollup(r, today=None, keep_days=KEEP_DAYS):
+    today = today or datetime.now(timezone.utc).date()
+    start = time.perf_counter()
+    months = rollup_months(r, today)
+    days, members = convert_uniques(r, today)
+    deleted = compact_daily(r, today, keep_days)
+    return {'months_rolled_up': len(months), 'unique_sets_converted': days, 'unique_members': members,
+            'daily_keys_deleted': deleted, 'seconds': round(time.perf_counter() - start, 4)}
+
+
+def footprint(r):
+    # used_memory from a real server; fakeredis has no INFO (and stores HLLs as
+    # sets), so there only the key and set-member counts are meaningful.
+    keys = list(r.scan_iter(match='stats:*', count=BATCH))
+    pipe = r.pipeline(transaction=False)
+    for key in keys:
+        pipe.type(key)
+    sets = [k for k, t in zip(keys, pipe.execute())
+            if t == 'set' and k != ROLLED_UP and not k.startswith(UNIQUE_HLL)]
+    pipe = r.pipeline(transaction=False)
+    for key in sets:
+        pipe.scard(key)
+    try:
+        used = int(r.info('memory')['used_memory'])
+    except Exception:
+        used = None
+    return {'keys': len(keys), 'set_members': sum(pipe.execute()), 'used_memory': used}
+
+
+def _visit(target, ip, day):
+    # The four commands /api/visitor sends per page view.
+    target.incr('stats:visits:total')
+    target.incr(DAILY + day)
+    target.incr(MONTHLY + day[:7])
+    target.sadd(UNIQUE + day, ip)
+
+
+def generate_load(r, views, days, visitors, pipelined, seed=1):
+    # Replays page views spread over the given days and returns ops/s.
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    pipe = r.pipeline(transaction=False) if pipelined else r
+    for n in range(views):
+        day = days[rng.randrange(len(days))]
+        v = rng.randrange(visitors)
+        ip = f'10.{v >> 16 & 255}.{v >> 8 & 255}.{v & 255}'
+        _visit(pipe, ip, day)
+        if pipelined and n % 250 == 249:
+            pipe.execute()
+    if pipelined:
+        pipe.execute()
+    elapsed = time.perf_counter() - start
+    return views * 4 / elapsed if elapsed else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Roll up visitor counters and convert unique-IP sets to HyperLogLogs.")
+    parser.add_argument('--url', default=REDIS_URL, help="Redis URL, or 'fake' for an in-process fakeredis")
+    sub = parser.add_subparsers(dest='command', required=True)
+    ru = sub.add_parser('rollup', help="Run one rollup pass")
+    ru.add_argument('--keep-days', type=int, default=KEEP_DAYS)
+    ru.add_argument('--today', help="YYYY-MM-DD (default: today, UTC)")
+    lg = sub.add_parser('load', help="Generate synthetic traffic, then roll it up and report memory")
+    lg.add_argument('--views', type=int, default=20000)
+    lg.add_argument('--days', type=int, default=90)
+    lg.add_argument('--visitors', type=int, default=5000)
+    lg.add_argument('--no-pipeline', action='store_true', help="Send commands one at a time, like the route")
+    args = parser.parse_args()
+
+    r = connect(args.url)
+    if args.command == 'rollup':
+        today = date.fromisoformat(args.today) if args.today else None
+        print(json.dumps(rollup(r, today, args.keep_days), indent=2))
+        return
+
+    today = datetime.now(timezone.utc).date()
+    days = [(today - timedelta(days=d)).isoformat() for d in range(args.days)]
+    before = footprint(r)
+    ops = generate_load(r, args.views, days, args.visitors, not args.no_pipeline)
+    loaded = footprint(r)
+    summary = rollup(r, today)
+    after = footprint(r)
+    print(f"{args.views} views over {args.days} days: {ops:,.0f} ops/s "
+          f"({'sequential' if args.no_pipeline else 'pipelined'})")
+    for label, f in (('before load', before), ('after load', loaded), ('after rollup', after)):
+        memory = f"{f['used_memory']:,} B used, " if f['used_memory'] is not None else ''
+        print(f"  {label:<13} {memory}{f['keys']} keys, {f['set_members']} set members")
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == '__main__':
+    main()